@@ -59,6 +59,37 @@ def part_ranges_lowest(parent_part, basis_container):
 
 
 def part_ranges(parent_part, basis_container):
+    """The slice objects for the parent part and all of its children
+
+    The slices are cached in the basis container, as they are needed every
+    time an array is created or indexed by a part. The cached slices are
+    reused only if the tree of parts below `parent_part` is unchanged.
+    """
+    cache = getattr(basis_container, 'cached_ranges', None)
+    if cache is None:
+        return calculate_part_ranges(parent_part, basis_container)
+
+    if hasattr(parent_part, 'children'):
+        # The cache holds references to the parts, so their ids cannot be
+        # reused by other parts while they are cached
+        all_parts = list(parent_part.iter_all())
+        structure = [id(part) for part in all_parts]
+    else:
+        all_parts = structure = None
+
+    try:
+        cached_structure, _, ranges = cache[parent_part]
+        if cached_structure == structure:
+            return ranges
+    except KeyError:
+        pass
+
+    ranges = calculate_part_ranges(parent_part, basis_container)
+    cache[parent_part] = (structure, all_parts, ranges)
+    return ranges
+
+
+def calculate_part_ranges(parent_part, basis_container):
     "Construct the slice objects for the parent part and all of its children"
     if hasattr(basis_container, 'lowest_parts'):
         return part_ranges_lowest(parent_part, basis_container)
@@ -86,6 +117,88 @@ def part_ranges(parent_part, basis_container):
     return ranges
 
 
+class IndexPlan(object):
+    """An index into a LookupArray, with any Parts and quantities converted
+    to the corresponding slices and integers.
+
+    Converting an index requires looking up each part, which is a significant
+    overhead when many small blocks are accessed. A plan can be created once
+    by `LookupArray.index_plan`, and then used to index every array which has
+    the same lookup table, such as all the matrices and derivatives of an
+    impedance matrix.
+    """
+
+    def __init__(self, lookup, idx):
+        if not isinstance(idx, tuple):
+            # force a single index to be a tuple
+            idx = idx,
+
+        self.original = idx
+        new_idx = []
+        sub_lookup = []
+        entry_num = 0
+
+        # try to lookup every part of the index to convert to a range
+        for entry in idx:
+            if isinstance(entry, Part):
+                # Need to pass this metadata to the sub-array for its
+                # lookup table
+                this_lookup, container, parent_part = lookup[entry_num]
+                sub_lookup.append((part_ranges(entry, container), container, entry))
+                new_idx.append(this_lookup[entry])
+            elif isinstance(entry, six.string_types):
+                # If a string has been passed, then this dimension will have
+                # been flattened out, so no metadata is needed
+                this_lookup = lookup[entry_num]
+                new_idx.append(this_lookup[entry])
+            else:
+                new_idx.append(entry)
+
+                if not isinstance(entry, numbers.Integral):
+                    # Integers mean a dimension is dropped, in all other
+                    # cases it is kept
+                    if entry is None:
+                        # Need to record that a new dimension is added, so
+                        # keep the place in the lookup of the original
+                        sub_lookup.append(None)
+                        entry_num -= 1
+                    elif isinstance(entry, slice) and entry == slice(None):
+                        # If slicing the whole dimension, metadata can be kept
+                        sub_lookup.append(lookup[entry_num])
+                    elif isinstance(entry, collections.Iterable):
+                        # TODO: find a better solution to avoid this probelm
+                        # warnings.warn("Indexing LookupArray with iterable is unreliable")
+                        pass
+                    else:
+                        # In all other cases metadata is lost
+                        sub_lookup.append(None)
+
+            entry_num += 1
+
+        self.index = tuple(new_idx)
+        self.sub_lookup = sub_lookup
+        self.num_entries = entry_num
+
+    @staticmethod
+    def convert(lookup, idx):
+        """Convert an index to slices and integers, without the lookup data
+        needed to create a sub-array"""
+        if not isinstance(idx, tuple):
+            idx = idx,
+
+        new_idx = []
+        for entry_num, entry in enumerate(idx):
+            if isinstance(entry, Part):
+                this_lookup, container, parent_part = lookup[entry_num]
+                new_idx.append(this_lookup[entry])
+            elif isinstance(entry, six.string_types):
+                this_lookup = lookup[entry_num]
+                new_idx.append(this_lookup[entry])
+            else:
+                new_idx.append(entry)
+        return tuple(new_idx)
+
+
 def build_lookup(index_data):
     "Create the lookup table for a LookupArray"
     lookup = []
@@ -211,95 +324,56 @@ class LookupArray(np.ndarray):
         "Needed due to CPython bug"
         self.__setitem__(slice(start, stop), val)
 
+    def index_plan(self, idx):
+        """Compile an index, so that it can be used repeatedly without
+        looking up any Parts or quantities again.
+
+        Parameters
+        ----------
+        idx : tuple
+            The index, as would be used with `__getitem__` or `__setitem__`
+
+        Returns
+        -------
+        plan : IndexPlan
+            The compiled index, which can be used to index this array or any
+            other array with the same lookup table
+        """
+        return IndexPlan(self.lookup, idx)
+
     def __getitem__(self, idx):
         """Gets an item or items from the array. Any of the indices may be the
         name of a range, in addition to all the usual fancy indexing options"""
 
-        if not isinstance(idx, tuple):
-            # force a single index to be a tuple
-            idx = idx,
-
-        new_idx = []
-        sub_lookup = []
-        entry_num = 0
-
-        # try to lookup every part of the index to convert to a range
-        for entry in idx:
-            if isinstance(entry, Part):
-                # Need to pass this metadata to the sub-array for its
-                # lookup table
-                this_lookup, container, parent_part = self.lookup[entry_num]
-                sub_lookup.append((part_ranges(entry, container), container, entry))
-                new_idx.append(this_lookup[entry])
-            elif isinstance(entry, six.string_types):
-                # If a string has been passed, then this dimension will have
-                # been flattened out, so no metadata is needed
-                this_lookup = self.lookup[entry_num]
-                new_idx.append(this_lookup[entry])
-            else:
-                new_idx.append(entry)
-
-                if not isinstance(entry, numbers.Integral):
-                    # Integers mean a dimension is dropped, in all other
-                    # cases it is kept
-                    if entry is None:
-                        # Need to record that a new dimension is added, so
-                        # keep the place in the lookup of the original
-                        sub_lookup.append(None)
-                        entry_num -= 1
-                    elif isinstance(entry, slice) and entry == slice(None):
-                        # If slicing the whole dimension, metadata can be kept
-                        sub_lookup.append(self.lookup[entry_num])
-                    elif isinstance(entry, collections.Iterable):
-                        # TODO: find a better solution to avoid this probelm
-                        # warnings.warn("Indexing LookupArray with iterable is unreliable")
-                        pass
-                    else:
-                        # In all other cases metadata is lost
-                        sub_lookup.append(None)
-
-            entry_num += 1
-
-        # now add lookup data for all the non-indexed dimensions
-        sub_lookup = sub_lookup+self.lookup[entry_num:]
+        if not isinstance(idx, IndexPlan):
+            idx = IndexPlan(self.lookup, idx)
 
         try:
-            result = super(LookupArray, self).__getitem__(tuple(new_idx))
+            result = super(LookupArray, self).__getitem__(idx.index)
         except IndexError as exc:
-            message = "Invalid index %s" % str(idx)
+            message = "Invalid index %s" % str(idx.original)
             exc.args = (message,)+tuple(str(n) for n in exc.args[1:])
             raise
 
         # May get a LookupArray or an array scalar back
         if isinstance(result, LookupArray):
-            result.lookup = sub_lookup
+            result.lookup = idx.sub_lookup+self.lookup[idx.num_entries:]
 
         return result
 
     def __setitem__(self, idx, value):
         """Gets an item or items in the array. Any of the indices may be the
         name of a range, in addition to all the usual fancy indexing options"""
-        if not isinstance(idx, tuple):
-            # force a single index to be a tuple
-            idx = idx,
-
-        new_idx = []
-
-        # try to lookup every part of the index to convert to a range
-        for entry_num, entry in enumerate(idx):
-            if isinstance(entry, Part):
-                this_lookup, container, parent_part = self.lookup[entry_num]
-                new_idx.append(this_lookup[entry])
-            elif isinstance(entry, six.string_types):
-                this_lookup = self.lookup[entry_num]
-                new_idx.append(this_lookup[entry])
-            else:
-                new_idx.append(entry)
+        if isinstance(idx, IndexPlan):
+            new_idx = idx.index
+        else:
+            new_idx = IndexPlan.convert(self.lookup, idx)
 
         try:
-            super(LookupArray, self).__setitem__(tuple(new_idx), value)
+            # index the base array, as this avoids numpy calling __getitem__
+            self.view(np.ndarray)[new_idx] = value
         except IndexError as exc:
-            message = "Invalid index %s" % idx
+            message = "Invalid index %s" % str(idx)
             exc.args = (message,)+tuple(str(n) for n in exc.args[1:])
             raise
 
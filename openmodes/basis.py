@@ -22,10 +22,12 @@ Routines to construct the basis functions on a mesh
 
 import logging
 from collections import namedtuple
-from scipy.sparse import lil_matrix
+from scipy.sparse import lil_matrix, bsr_matrix, csr_matrix
+import scipy.linalg as la
 import numpy as np
 
-from openmodes.mesh import nodes_not_in_edge, shared_nodes
+from openmodes.mesh import (nodes_not_in_edge, shared_nodes,
+                            barycentric_refinement)
 from openmodes.helpers import (cached_property, inc_slice, Identified, memoize,
                                equivalence, MeshError)
 from openmodes.integration import triangle_centres
@@ -157,6 +159,71 @@ class LinearTriangleBasis(AbstractBasis):
         else:
             return r, vector_func
 
+    @memoize
+    def interpolation_matrix(self, nodes, integration_rule,
+                             int_weight=False):
+        """A matrix which interpolates the vector function of any basis
+        coefficients, giving the same result as `interpolate_function`.
+        Many functions can be interpolated at once by multiplying this matrix
+        with a matrix of coefficients.
+
+        Parameters
+        ----------
+        nodes : array
+            Nodes of the Part
+        integration_rule : DunavantRule
+            The integration rule giving the points to interpolate on each
+            triangle
+        int_weight : boolean, optional
+            Whether to include the weights on the function for easier
+            integration.
+
+        Returns
+        -------
+        r : ndarray (num_points, 3)
+            The interpolation points
+        matrix : csr_matrix (3*num_points, num_basis)
+            The matrix giving the vector function at each point, with the
+            three cartesian components of each point in consecutive rows
+        """
+        num_tri = len(self.mesh.polygons)
+        points_per_tri = len(integration_rule)
+
+        xi_eta = integration_rule.points
+        xi_eta_zeta = np.hstack((xi_eta,
+                                1.0 - xi_eta[:, :1] - xi_eta[:, 1:2]))
+
+        if int_weight:
+            weights = integration_rule.weights
+            tri_scale = np.ones(num_tri)
+        else:
+            weights = np.ones_like(integration_rule.weights)
+            tri_scale = 1.0/(2*self.mesh.polygon_areas)
+
+        # num tri, points per tri, x/y/z
+        tri_nodes = nodes[self.mesh.polygons]
+        r = np.sum(tri_nodes[:, None]*xi_eta_zeta[None, :, :, None], axis=2)
+
+        # The coefficient of each triangle node within each component at
+        # each point, with dimensions num tri, points per tri, x/y/z, nodes
+        rho = r[:, :, None] - tri_nodes[:, None]
+        values = (rho.transpose(0, 1, 3, 2)*weights[None, :, None, None] *
+                  tri_scale[:, None, None, None])
+
+        rows = np.arange(num_tri*points_per_tri*3).reshape(num_tri,
+                                                           points_per_tri, 3)
+        cols = np.arange(num_tri*3).reshape(num_tri, 1, 1, 3)
+        face_matrix = csr_matrix((values.ravel(),
+                                  (np.repeat(rows[..., None], 3,
+                                             axis=3).ravel(),
+                                   np.broadcast_to(cols,
+                                                   values.shape).ravel())),
+                                 shape=(3*num_tri*points_per_tri, 3*num_tri))
+
+        vector_transform, _ = self.transformation_matrices
+        matrix = csr_matrix(face_matrix.dot(vector_transform.T))
+        return r.reshape((num_tri*points_per_tri, 3)), matrix
+
     @memoize
     def integration_points(self, nodes, integration_rule):
         """Find all the integration points for the basis functions in cartesian
@@ -205,7 +272,9 @@ class LinearTriangleBasis(AbstractBasis):
         ----------
         func : function(r)
             A function of the coordinates which returns the field value at
-            each coordinate point. Must be able to accept r as a 3d array
+            each coordinate point. Must be able to accept r as a 3d array.
+            The field may have additional dimensions before the last, such
+            as for a collection of sources.
         integration_rule : DunavantRule
             An object with the barycentric coordinates and weights for
             integration over a triangle
@@ -217,22 +286,27 @@ class LinearTriangleBasis(AbstractBasis):
 
         Returns
         -------
-        tested_func : ndarray[num_basis]
-            The function tested over each basis function
+        tested_func : ndarray[num_basis, ...]
+            The function tested over each basis function, with any additional
+            dimensions of the field
         """
 
         # This implementation uses vector operations, making it relatively
         # fast, but somewhat memory inefficient
         r, rho = self.integration_points(nodes, integration_rule)
-        func_points = func(r)  # dim[num_tri, num_points, 3]
+        func_points = func(r)  # dim[num_tri, num_points, ..., 3]
+        extra_shape = func_points.shape[2:-1]
+        func_points = func_points.reshape(func_points.shape[:2]+(-1, 3))
         if n_cross:
-            func_points = np.cross(self.mesh.surface_normals[:, None, :],
+            func_points = np.cross(self.mesh.surface_normals[:, None, None, :],
                                    func_points)
-        func_rho = np.sum(func_points[:, None, :, :]*rho, axis=3)
-        # func_rho has dim[num_tri, 3, num_points]
-        func_tri = np.dot(func_rho, integration_rule.weights)  # dim[num_tri, 3]
+        func_rho = np.einsum('tpfx,tbpx->tbfp', func_points, rho)
+        # func_rho has dim[num_tri, 3, num_fields, num_points]
+        func_tri = np.dot(func_rho, integration_rule.weights)
         vector_transform, _ = self.transformation_matrices
-        return vector_transform.dot(func_tri.flatten())
+        tested = vector_transform.dot(func_tri.reshape(-1,
+                                                       func_tri.shape[-1]))
+        return tested.reshape((tested.shape[0],)+extra_shape)
 
     @cached_property
     def gram_matrix(self):
@@ -257,6 +331,35 @@ class LinearTriangleBasis(AbstractBasis):
         vector_transform, _ = self.transformation_matrices
         return vector_transform.dot(vector_transform.dot(G.reshape(3*num_tri, 3*num_tri)).T).T
 
+    @cached_property
+    def near_neighbours(self):
+        """The pairs of basis functions which interact in the near field,
+        defined as those whose supports have at least one node in common
+
+        Returns
+        -------
+        near : csc_matrix
+            A symmetric sparse matrix, which is non-zero for each pair of
+            near-field basis functions
+        """
+        num_tri = len(self.mesh.polygons)
+        vector_transform, _ = self.transformation_matrices
+
+        # The triangles supporting each basis function
+        face_to_tri = csr_matrix((np.ones(3*num_tri),
+                                  (np.arange(3*num_tri),
+                                   np.repeat(np.arange(num_tri), 3))))
+        basis_tri = abs(vector_transform).dot(face_to_tri)
+
+        tri_nodes = csr_matrix((np.ones(3*num_tri),
+                                (np.repeat(np.arange(num_tri), 3),
+                                 np.ravel(self.mesh.polygons))),
+                               shape=(num_tri, len(self.mesh.nodes)))
+        basis_nodes = basis_tri.dot(tri_nodes)
+        near = basis_nodes.dot(basis_nodes.T).tocsc()
+        near.data[:] = 1.0
+        return near
+
 
 class DivRwgBasis(LinearTriangleBasis):
     """Divergence-conforming RWG basis functions
@@ -638,6 +741,175 @@ class LoopStarBasis(LinearTriangleBasis):
         return vector_transform.tocsr(), scalar_transform.tocsr()
 
 
+class BuffaChristiansenBasis(LinearTriangleBasis):
+    """Buffa-Christiansen basis functions, which are dual to the RWG basis
+    functions
+
+    Each function is associated with an edge of the original mesh, in the
+    same order as `DivRwgBasis`, and is defined on the barycentric refinement
+    of the mesh as a combination of RWG functions. The cross product of the
+    surface normal with these functions forms a well-conditioned dual to the
+    RWG functions, as required for Calderon preconditioning of the EFIE.
+
+    Note that the member `mesh` is the refined mesh, so the nodes of a part
+    must be transformed by `node_transform` before use with these functions.
+    Only closed surfaces are supported.
+
+    See:
+    A. Buffa and S. H. Christiansen, "A dual finite element complex on the
+    barycentric refinement," Math. Comp., vol. 76, pp. 1743-1769, 2007.
+    """
+
+    def __init__(self, part_or_mesh):
+        super(BuffaChristiansenBasis, self).__init__(part_or_mesh)
+        self.canonical_basis = BuffaChristiansenBasis
+        self.primal = DivRwgBasis(self.mesh)
+        primal_mesh = self.mesh
+
+        if not primal_mesh.closed_surface:
+            raise ValueError("Buffa-Christiansen basis functions are only "
+                             "implemented for closed surfaces")
+
+        self.mesh, self.node_transform = barycentric_refinement(primal_mesh)
+        self.refined_rwg = DivRwgBasis(self.mesh)
+        polygons = self.mesh.polygons
+
+        # The refined RWG function and its sign for flux passing from one
+        # refined triangle into another
+        refined_rwg = {}
+        for basis_count, (tri_p, tri_m, _, _) in enumerate(self.refined_rwg):
+            refined_rwg[tri_p, tri_m] = (basis_count, 1.0)
+            refined_rwg[tri_m, tri_p] = (basis_count, -1.0)
+
+        refined_edges, sharing = self.mesh.get_edges(True)
+        triangles_of_edge = {frozenset(edge): triangles for edge, triangles
+                             in zip(refined_edges, sharing)}
+
+        num_nodes = len(primal_mesh.nodes)
+        primal_edges = primal_mesh.get_edges()
+        midpoints = {frozenset(edge): num_nodes+edge_count
+                     for edge_count, edge in enumerate(primal_edges)}
+
+        def fan(node, midpoint, tri):
+            """The refined triangles around a node, starting from the one
+            within the original triangle `tri` which touches `midpoint`"""
+            fan_triangles = [triangle for triangle in range(6*tri, 6*tri+6)
+                             if node in polygons[triangle] and
+                             midpoint in polygons[triangle]]
+            previous = midpoint
+            while True:
+                current = fan_triangles[-1]
+                next_node = [n for n in polygons[current]
+                             if n != node and n != previous][0]
+                if next_node == midpoint:
+                    return fan_triangles
+                fan_triangles.append([triangle for triangle in
+                                      triangles_of_edge[frozenset((node,
+                                                                   next_node))]
+                                      if triangle != current][0])
+                previous = next_node
+
+        coefficients = lil_matrix((len(self.primal), len(self.refined_rwg)))
+
+        for basis_count, (tri_p, tri_m, node_p, _) in enumerate(self.primal):
+            edge = nodes_not_in_edge(range(3), [node_p])
+            edge = primal_mesh.polygons[tri_p][edge]
+            midpoint = midpoints[frozenset(edge)]
+
+            fans = []
+            for node, sign in zip(edge, (1.0, -1.0)):
+                # Each refined triangle around the first node is a source of
+                # equal flux, and around the second node is a sink, with the
+                # unit flux passing between the two halves at the midpoint
+                triangles = fan(node, midpoint, tri_p)
+                fans.append(triangles)
+                num_half = len(triangles)//2
+                for count in range(1, len(triangles)):
+                    index, direction = refined_rwg[triangles[count-1],
+                                                   triangles[count]]
+                    coefficients[basis_count, index] += (
+                        sign*direction*(count-num_half)/(2.0*num_half))
+
+            for end in (0, -1):
+                index, direction = refined_rwg[fans[0][end], fans[1][end]]
+                coefficients[basis_count, index] += 0.5*direction
+
+        self.coefficients = coefficients.tocsr()
+
+        logging.info("Constructing %d Buffa-Christiansen basis functions over "
+                     "%d refined faces" % (len(self), len(polygons)))
+
+    def __len__(self):
+        return len(self.primal)
+
+    @cached_property
+    def transformation_matrices(self):
+        """Returns the sparse transformation matrices to turn quantities
+        defined on the faces of the refined mesh to Buffa-Christiansen basis
+        functions
+        """
+        vector_transform, scalar_transform = \
+            self.refined_rwg.transformation_matrices
+        return (self.coefficients.dot(vector_transform).tocsr(),
+                self.coefficients.dot(scalar_transform).tocsr())
+
+    @cached_property
+    def mixed_gram_matrix(self):
+        """The inner product between the RWG functions of the original mesh
+        and the cross product of the surface normal with these functions
+
+        Returns
+        -------
+        G : csr_matrix
+            The sparse mixed Gram matrix, G[m, n] = <f_m, n x g_n>, where f
+            are RWG and g are Buffa-Christiansen basis functions
+        """
+        num_tri = len(self.primal.mesh.polygons)
+
+        # Barycentric coordinates of the nodes of each refined triangle
+        # within its original triangle, from which the rooftop functions of
+        # the original triangle are expanded over each refined triangle.
+        # Each refined triangle has 1/6 of the area of the original.
+        corner = np.eye(3)
+        centroid = np.ones(3)/3.0
+        refine = np.empty((6, 3, 3))
+        for node_count in range(3):
+            next_count = (node_count+1) % 3
+            midpoint = 0.5*(corner[node_count]+corner[next_count])
+            for child, child_nodes in enumerate(
+                    ((corner[node_count], midpoint, centroid),
+                     (midpoint, corner[next_count], centroid))):
+                refine[2*node_count+child] = la.inv(np.array(child_nodes).T)/6.0
+
+        face_transform = lil_matrix((3*num_tri, 18*num_tri))
+        for tri_count in range(num_tri):
+            for child in range(6):
+                for node_count in range(3):
+                    for refined_node in range(3):
+                        face_transform[3*tri_count+node_count,
+                                       18*tri_count+3*child+refined_node] = \
+                            refine[child, refined_node, node_count]
+
+        # The rotated inner product of rooftop functions on each refined
+        # triangle, which is linear in position, so is exact at the centroid
+        nodes = self.mesh.nodes[self.mesh.polygons]
+        rho = nodes.mean(axis=1)[:, None, :] - nodes
+        normals = self.mesh.surface_normals
+        areas = self.mesh.polygon_areas
+        rotated = np.cross(normals[:, None, :], rho)
+        face_gram = (np.sum(rho[:, :, None, :]*rotated[:, None, :, :],
+                            axis=3)/(4*areas[:, None, None]))
+        num_refined = len(face_gram)
+        face_gram = bsr_matrix((face_gram, np.arange(num_refined),
+                                np.arange(num_refined+1)),
+                               shape=(3*num_refined, 3*num_refined))
+
+        primal_transform = self.primal.transformation_matrices[0].dot(
+                                                    face_transform.tocsr())
+        dual_transform = self.transformation_matrices[0]
+        return primal_transform.dot(face_gram.dot(dual_transform.T)).tocsr()
+
+
 class MacroBasis(AbstractBasis):
     """Macro basis functions defined from a set of solutions found on objects,
     e.g. a set of natural modes"""
@@ -691,9 +963,13 @@ class BasisContainer(object):
         self.cached_basis = {}
         self.global_args = global_args
 
+        # the slices of each part within arrays, see `part_ranges`
+        self.cached_ranges = {}
+
     def set_args(self, part, args):
         "Override the default basis function arguments for a particular part"
         self.args[part] = dict(args)
+        self.cached_ranges.clear()
 
     def __getitem__(self, part):
         """Return the basis functions for a particular part, constructing them
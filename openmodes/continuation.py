@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+"Tracking of poles as a parameter of the geometry or material is varied"
+
+from __future__ import division
+
+import logging
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from openmodes.helpers import equivalence
+from openmodes.integration import CircularContour
+from openmodes.modes import Modes
+
+
+def track_poles(sim_func, parameters, estimates=None, contour=None,
+                rel_tol=1e-8, max_iter=20, max_halvings=4,
+                fallback_radius=0.05, cluster_tol=1e-4):
+    """Follow the poles of a system as a parameter is swept
+
+    Instead of searching for all poles by contour integration at each
+    parameter value, the poles found at the previous parameter value are
+    used as the starting point for Newton iteration. The pole frequencies
+    are predicted by linear extrapolation from the previous steps. If a pole
+    cannot be found, or if it jumps onto a different mode, then the step in
+    the parameter is halved. When the step cannot be reduced further, a
+    contour integral in the vicinity of the predicted pole is used instead.
+
+    Poles which are degenerate or nearly degenerate, as commonly occurs for
+    symmetric geometries, are refined together as a cluster, and are matched
+    to their predicted values together.
+
+    Parameters
+    ----------
+    sim_func : function
+        Called with a single parameter value, returns a `Simulation` for that
+        parameter. The poles of all parts in the simulation, considered as a
+        single system, will be tracked. The same `Simulation` object may
+        be returned each time, with its parts moved or rotated.
+    parameters : array
+        The parameter values at which poles are required, in order of the
+        sweep. Intermediate values may also be passed to `sim_func` if the
+        step needs to be reduced.
+    estimates : Modes, optional
+        Estimates of the poles at the first parameter value, as returned from
+        `Simulation.estimate_poles`
+    contour : Contour, optional
+        If `estimates` are not given, then poles within this contour at the
+        first parameter value will be tracked
+    rel_tol : float, optional
+        The relative tolerance on the search for poles
+    max_iter : integer, optional
+        The maximum number of Newton iterations for each step. This should be
+        small, as a large number of iterations indicates that the step is too
+        large. This does not apply to the refinement of the initial estimates.
+    max_halvings : integer, optional
+        How many times the step between successive parameter values can be
+        halved before falling back to a contour integral
+    fallback_radius : float, optional
+        The radius of the contour integral used when tracking fails, relative
+        to the magnitude of the predicted pole
+    cluster_tol : float, optional
+        Predicted poles whose relative separation is less than this value are
+        refined together by block Newton iteration
+
+    Returns
+    -------
+    modes : list of Modes
+        The modes at each of the parameters. Modes retain their ordering
+        between parameter values, unless a mode was lost, in which case it is
+        discarded from all subsequent results.
+    """
+
+    sim = sim_func(parameters[0])
+    part = sim.parts
+
+    if estimates is None:
+        if contour is None:
+            raise ValueError("Either estimates or contour must be specified")
+        estimates = sim.estimate_poles(contour)
+    estimates = estimates.modes_of_parts[estimates.parts[0].unique_id]
+
+    # The initial estimates may be far from the poles, so are given the
+    # same number of iterations as `Simulation.refine_poles`
+    refined = sim.operator.refine_poles(estimates, part, rel_tol, 40,
+                                        cluster_tol=cluster_tol)
+    results = [Modes(part, [part], {part.unique_id: refined}, sim.operator,
+                     sim.basis_container)]
+
+    # The history of parameter values and poles for the predictor
+    history = [(parameters[0], refined)]
+
+    for param_next in parameters[1:]:
+        param = history[-1][0]
+        step = param_next - param
+        min_step = abs(step)/2**max_halvings
+
+        while param != param_next:
+            param_try = param + step
+            if abs(param_try - param) >= abs(param_next - param):
+                param_try = param_next
+
+            sim = sim_func(param_try)
+            force = abs(step) <= min_step
+            refined = _continuation_step(sim, param_try, history, rel_tol,
+                                         max_iter, force, fallback_radius,
+                                         cluster_tol)
+
+            if refined is None:
+                logging.info("Halving step at parameter %s" % param_try)
+                step = 0.5*step
+                continue
+
+            param = param_try
+            history = [history[-1], (param, refined)]
+            step = 2*step
+
+        part = sim.parts
+        results.append(Modes(part, [part], {part.unique_id: refined},
+                             sim.operator, sim.basis_container))
+
+    return results
+
+
+def _continuation_step(sim, param, history, rel_tol, max_iter, force,
+                       fallback_radius, cluster_tol):
+    """Attempt to find all poles at a new parameter value
+
+    Returns the refined poles, or None if the step failed and should be
+    retried with a smaller step. If `force` is True, then poles which cannot
+    be tracked are searched for with a contour integral, and discarded if
+    still not found.
+    """
+    part = sim.parts
+    operator = sim.operator
+
+    param_prev, previous = history[-1]
+    s_prev = previous['s']
+    num_modes = len(s_prev)
+
+    # linear extrapolation of the pole frequencies
+    if len(history) > 1:
+        param_pp, previous_pp = history[0]
+        if len(previous_pp['s']) == num_modes:
+            slope = (s_prev - previous_pp['s'])/(param_prev - param_pp)
+            s_pred = s_prev + slope*(param - param_prev)
+        else:
+            s_pred = s_prev
+    else:
+        s_pred = s_prev
+
+    # The previous modes are the starting vectors, unless the number of
+    # unknowns has changed, e.g. due to re-meshing
+    num_unknowns = len(sim.empty_array().simple_view())
+    vr_prev = previous['vr']
+    vl_prev = previous['vl']
+    if vr_prev.shape[0] != num_unknowns:
+        random = np.random.RandomState(0)
+        vr_prev = random.rand(num_unknowns, num_modes).astype(np.complex128)
+        vl_prev = vr_prev.T.copy()
+
+    # Group the predicted poles which are close enough to be refined together
+    relations = [(mode, mode) for mode in range(num_modes)]
+    for mode1 in range(num_modes):
+        for mode2 in range(mode1+1, num_modes):
+            if abs(s_pred[mode1]-s_pred[mode2]) < cluster_tol*abs(s_pred[mode1]):
+                relations.append((mode1, mode2))
+    clusters = sorted(sorted(group) for group in equivalence(relations))
+
+    # the refined pole, right and left vectors, and cluster of each mode
+    tracked = {}
+    for cluster_count, cluster in enumerate(clusters):
+        estimate = {'s': s_pred[cluster], 'vr': vr_prev[:, cluster],
+                    'vl': vl_prev[cluster, :]}
+        res = operator.refine_poles(estimate, part, rel_tol, max_iter,
+                                    cluster_tol=cluster_tol)
+
+        # Match the refined poles to all predicted poles together, so that
+        # poles within a degenerate cluster are interchangeable. A pole which
+        # is matched to a prediction outside the cluster has jumped to
+        # another mode.
+        if len(res['s']) > 0:
+            distance = np.abs(res['s'][:, None] - s_pred[None, :])
+            for n, mode in zip(*linear_sum_assignment(distance)):
+                if mode in cluster:
+                    tracked[mode] = (res['s'][n], res['vr'][:, n],
+                                     res['vl'][n], cluster_count)
+
+        for mode in cluster:
+            if mode in tracked:
+                continue
+
+            if not force:
+                return None
+            res = _local_search(sim, s_pred[mode], fallback_radius, rel_tol,
+                                max_iter)
+            if res is None:
+                logging.warn("Lost mode {} at parameter {}, mode "
+                             "discarded".format(mode, param))
+                continue
+
+            tracked[mode] = (res['s'][0], res['vr'][:, 0], res['vl'][0],
+                             cluster_count)
+
+    modes = sorted(tracked.keys())
+    s = np.array([tracked[mode][0] for mode in modes])
+    cluster_of = np.array([tracked[mode][3] for mode in modes])
+
+    # Check that no two modes converged onto the same pole. Modes within a
+    # cluster may be degenerate, but their vectors are kept distinct by the
+    # block iteration, so they are not compared.
+    for mode in range(len(s)):
+        others = s[cluster_of != cluster_of[mode]]
+        if np.any(np.abs(others - s[mode]) < 10*rel_tol*abs(s[mode])):
+            if not force:
+                return None
+            logging.warn("Modes have merged at parameter {}".format(param))
+            break
+
+    refined = {'s': s}
+    refined['vr'] = np.array([tracked[mode][1] for mode in modes]).T
+    refined['vl'] = np.array([tracked[mode][2] for mode in modes])
+    return refined
+
+
+def _local_search(sim, s_pred, radius, rel_tol, max_iter):
+    """Search for a single pole near the predicted location with a contour
+    integral"""
+    part = sim.parts
+    contour = CircularContour(s_pred, radius*abs(s_pred))
+    logging.info("Searching for pole near %+.4e %+.4ej by contour integral"
+                 % (s_pred.real, s_pred.imag))
+
+    estimates = sim.operator.estimate_poles(contour, part, 1e-14)
+    if len(estimates['s']) == 0:
+        return None
+
+    nearest = np.argmin(np.abs(estimates['s'] - s_pred))
+    estimate = {'s': estimates['s'][nearest:nearest+1],
+                'vr': estimates['vr'][:, nearest:nearest+1],
+                'vl': estimates['vl'][nearest:nearest+1, :]}
+    res = sim.operator.refine_poles(estimate, part, rel_tol, max_iter)
+    if len(res['s']) == 0:
+        return None
+    return res
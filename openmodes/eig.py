@@ -21,6 +21,8 @@ Routines for solving linear and nonlinear eigenvalue problems
 """
 
 import scipy.linalg as la
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.linalg import LinearOperator, eigs
 import numpy as np
 import logging
 from openmodes.array import loop_star_indices
@@ -30,7 +32,7 @@ class ConvergenceError(Exception):
     pass
 
 
-def eig_linearised(Z, modes):
+def eig_linearised(Z, modes, method='dense'):
     """Solves a linearised approximation to the eigenvalue problem from
     the impedance calculated at some fixed frequency.
 
@@ -40,8 +42,15 @@ def eig_linearised(Z, modes):
     ----------
     Z : EfieImpedanceMatrixLoopStar
         The impedance matrix calculated in a loop-star basis
-    modes : ndarray (int)
-        A list or array of the mode numbers required
+    modes : ndarray (int) or None
+        A list or array of the mode numbers required. If None, all modes
+        with physical frequencies are returned, ordered by frequency.
+    method : string, optional
+        If 'dense', all eigenvalues of the problem are found and the requested
+        modes are selected from them. If 'arpack', then only the lowest modes
+        are found by shift-invert Arnoldi iteration, which requires a single
+        LU factorisation of the star part of `S`. This is much faster for
+        large meshes, but requires a loop-star basis and a list of `modes`.
 
     Returns
     -------
@@ -52,7 +61,14 @@ def eig_linearised(Z, modes):
         Columns of this matrix contain the corresponding modal currents
     """
 
-    modes = np.asarray(modes)
+    if method not in ('dense', 'arpack'):
+        raise ValueError("Unknown method for linearised eigenvalues: %s"
+                         % method)
+
+    if method == 'arpack' and modes is None:
+        logging.warning("Mode numbers required for arpack method, "
+                        "using dense method to find all modes")
+        method = 'dense'
 
     L = Z.matrices['L']
     S = Z.matrices['S']
@@ -72,7 +88,10 @@ def eig_linearised(Z, modes):
                  np.dot(L[star[0], loop[1]], L_conv))
 
         # find eigenvalues, and star part of eigenvectors
-        w, v_s = la.eig(S[star[0], star[1]], -L_red)
+        if method == 'arpack':
+            w, v_s = eig_arpack(S[star[0], star[1]], L_red, np.max(modes)+1)
+        else:
+            w, v_s = la.eig(S[star[0], star[1]], -L_red)
 
         vr = np.empty((L.shape[0], len(w)), np.complex128)
         vr[star[1]] = v_s
@@ -80,6 +99,9 @@ def eig_linearised(Z, modes):
     else:
         # Matrix does not have loop-star decomposition, so use the whole thing
         # TODO: implement some filtering to eliminate null-space solutions?
+        if method == 'arpack':
+            logging.warning("Loop-star basis required for arpack method, "
+                            "using dense method instead")
         w, vr = la.eig(S, -L)
 
     w_freq = np.sqrt(w)
@@ -87,11 +109,58 @@ def eig_linearised(Z, modes):
     w_freq = np.where(w_freq.real > 0, -w_freq, w_freq)
 
     w_selected = np.ma.masked_array(w_freq, abs(w_freq.real) > abs(w_freq.imag))
-    which_modes = np.argsort(abs(w_selected.imag))[modes]
+    # masked frequencies are sorted last
+    which_modes = np.argsort(abs(w_selected.imag))
+    if modes is None:
+        which_modes = which_modes[:np.ma.count(w_selected)]
+    else:
+        which_modes = which_modes[np.asarray(modes)]
 
     return w_freq[which_modes], vr[:, which_modes]
 
 
+def eig_arpack(S, L, num_modes, oversample=10):
+    """Find the lowest eigenvalues w of the problem S.v = -w L.v by
+    shift-invert Arnoldi iteration about w=0
+
+    Parameters
+    ----------
+    S, L : ndarray
+        The matrices, where S must be non-singular
+    num_modes : integer
+        How many of the lowest eigenvalues are required
+    oversample : integer, optional
+        The number of additional eigenvalues to find, as some may be
+        rejected as non-physical by the caller
+
+    Returns
+    -------
+    w : ndarray
+        The eigenvalues
+    v : ndarray
+        The eigenvectors, as columns
+    """
+    S = np.asarray(S)
+    L = np.asarray(L)
+    N = S.shape[0]
+    num_eigs = num_modes + oversample
+
+    if num_eigs >= N-1:
+        # ARPACK cannot find all eigenvalues, so solve the dense problem
+        return la.eig(S, -L)
+
+    # The inverse of the eigenvalues of interest are the largest eigenvalues
+    # of S^{-1}.L, which only requires a single factorisation of S
+    S_lu = la.lu_factor(S)
+
+    def matvec(x):
+        return la.lu_solve(S_lu, L.dot(x))
+
+    op = LinearOperator((N, N), matvec=matvec, dtype=np.complex128)
+    mu, v = eigs(op, k=num_eigs, which='LM')
+    return -1.0/mu, v
+
+
 def poles_cauchy(Z_func, contour, svd_threshold=1e-10, previous_result=None,
                  iter_wrap=lambda x: x):
     """Estimate location and residue of the poles of a matrix function by
@@ -192,7 +261,8 @@ def poles_cauchy(Z_func, contour, svd_threshold=1e-10, previous_result=None,
 
 def eig_newton(func, lambda_0, x_0, lambda_tol=1e-8, max_iter=20,
                func_gives_der=False, G=None, args=[],
-               weight='rayleigh symmetric', y_0=None):
+               weight='rayleigh symmetric', y_0=None, func_gives_der2=False,
+               symmetric=False):
     """Solve a nonlinear eigenvalue problem by Newton iteration
 
     Parameters
@@ -228,6 +298,14 @@ def eig_newton(func, lambda_0, x_0, lambda_tol=1e-8, max_iter=20,
     y_0 : ndarray, optional
         For 'rayleigh asymmetric weighting', this is required as the initial
         guess for the left eigenvector
+    func_gives_der2 : boolean, optional
+        If `True`, then the function returns the matrix and its first and
+        second derivatives, and a Halley update is used for the eigenvalue
+        instead of the Newton update. This implies `func_gives_der`.
+    symmetric : boolean, optional
+        If `True`, then the matrix is known to be complex symmetric, and a
+        symmetric factorisation is used, requiring half the operations of
+        the general case
 
     Returns
     -------
@@ -250,8 +328,14 @@ def eig_newton(func, lambda_0, x_0, lambda_tol=1e-8, max_iter=20,
     2.  A. Ruhe, “Algorithms for the Nonlinear Eigenvalue Problem,”
         SIAM J. Numer. Anal., vol. 10, no. 4, pp. 674–689, Sep. 1973.
 
+    The Halley update is found by noting that the Newton update is equivalent
+    to Newton iteration on the scalar function 1/q(lambda), where
+    q(lambda) = v^T T(lambda)^-1 T(lambda_s) x_s, and applying Halley's
+    method to the same function instead.
     """
 
+    func_gives_der = func_gives_der or func_gives_der2
+
     x_s = x_0
     lambda_s = lambda_0
 
@@ -274,14 +358,26 @@ def eig_newton(func, lambda_0, x_0, lambda_tol=1e-8, max_iter=20,
         T_sm = func(lambda_sm, *args)
 
     for iter_count in range(max_iter):
-        if func_gives_der:
+        if func_gives_der2:
+            T_s, T_ds, T_d2s = func(lambda_s, *args)
+        elif func_gives_der:
             T_s, T_ds = func(lambda_s, *args)
         else:
             T_s = func(lambda_s, *args)
             T_ds = (T_s - T_sm)/(lambda_s - lambda_sm)
 
-        T_s_lu = la.lu_factor(T_s)
-        u = la.lu_solve(T_s_lu, np.dot(T_ds, x_s))
+        if symmetric:
+            T_s_ldl = ldl_factor(T_s)
+
+            def T_solve(b, trans=0):
+                return ldl_solve(T_s_ldl, b)
+        else:
+            T_s_lu = la.lu_factor(T_s)
+
+            def T_solve(b, trans=0):
+                return la.lu_solve(T_s_lu, b, trans=trans)
+
+        u = T_solve(np.dot(T_ds, x_s))
 
         # if known_vects is supplied, we should take this into account when
         # finding v
@@ -293,13 +389,19 @@ def eig_newton(func, lambda_0, x_0, lambda_tol=1e-8, max_iter=20,
         elif weight.lower() == 'rayleigh symmetric':
             v_s = np.dot(T_s.T, x_s)
         elif weight.lower() == 'rayleigh asymmetric':
-            y_s = la.lu_solve(T_s_lu, np.dot(T_ds.T, y_s), trans=1)
+            y_s = T_solve(np.dot(T_ds.T, y_s), trans=1)
             y_s /= np.sqrt(np.sum(np.abs(y_s)**2))
             v_s = np.dot(T_s.T, y_s)
         else:
             raise ValueError("Unknown weighting method %s" % weight)
 
-        delta_lambda_abs = np.dot(v_s, x_s)/(np.dot(v_s, u))
+        if func_gives_der2:
+            # Halley update, -2q'/q'', where the required derivatives are
+            # q' = -v^T u and q'' = v^T T^-1 (2 T' u - T'' x)
+            z = T_solve(2*np.dot(T_ds, u) - np.dot(T_d2s, x_s))
+            delta_lambda_abs = 2*np.dot(v_s, u)/np.dot(v_s, z)
+        else:
+            delta_lambda_abs = np.dot(v_s, x_s)/(np.dot(v_s, u))
 
         delta_lambda = abs(delta_lambda_abs/lambda_s)
         converged = delta_lambda < lambda_tol
@@ -722,6 +824,324 @@ def eig_bordered_nonlinear(func, w_0, vr_0, vl_0=None, w_tol=1e-8,
             'delta_w': delta_w, 'vl': vl_s1}
 
 
+def ldl_factor(A, overwrite_a=False):
+    """Factorise a complex symmetric matrix as A = L.D.L^T, where L is a
+    product of permutations and unit lower triangular matrices, and D is
+    block diagonal with blocks of size 1 or 2.
+
+    This requires half the operations of an LU factorisation. Only the lower
+    triangle of A is used, so the matrix must be symmetric, not Hermitian.
+    The factors are stored in a single array in the packed form of LAPACK's
+    `sytrf`, so the memory required is the same as an LU factorisation.
+
+    Parameters
+    ----------
+    A : ndarray (N, N)
+        The complex symmetric matrix to factorise
+    overwrite_a : boolean, optional
+        If True, the factors may be stored in the memory of A, which is then
+        destroyed
+
+    Returns
+    -------
+    factors : tuple
+        The packed factors and the pivot indices, for use with `ldl_solve`
+    """
+    sytrf, sytrf_lwork = la.get_lapack_funcs(('sytrf', 'sytrf_lwork'), (A,))
+    lwork, info = sytrf_lwork(A.shape[0], lower=1)
+    if info != 0:
+        raise ValueError("Failed to determine workspace size for LDL")
+
+    # The transpose of a C ordered array can be factorised in place, and
+    # by symmetry it is equal to A
+    ldu, ipiv, info = sytrf(A.T, lower=1, lwork=max(int(lwork.real), 1),
+                            overwrite_a=overwrite_a)
+    if info < 0:
+        raise ValueError("Illegal value in argument %d of sytrf" % -info)
+    elif info > 0:
+        raise la.LinAlgError("Matrix is singular, D[%d, %d] is zero" %
+                             (info-1, info-1))
+    return ldu, ipiv
+
+
+def ldl_solve(factors, b):
+    """Solve a complex symmetric system which has been factorised by
+    `ldl_factor`
+
+    The packed factors are applied as in LAPACK's `sytrs`, with each 1x1 or
+    2x2 pivot block processed in turn.
+    """
+    ldu, ipiv = factors
+    N = ldu.shape[0]
+    x = np.array(b, dtype=np.result_type(ldu, b)).reshape(N, -1)
+
+    # solve L.D.y = b
+    k = 0
+    while k < N:
+        if ipiv[k] > 0:
+            kp = ipiv[k]-1
+            x[[k, kp]] = x[[kp, k]]
+            x[k+1:] -= ldu[k+1:, k, None]*x[k]
+            x[k] /= ldu[k, k]
+            k += 1
+        else:
+            kp = -ipiv[k]-1
+            x[[k+1, kp]] = x[[kp, k+1]]
+            x[k+2:] -= ldu[k+2:, k, None]*x[k] + ldu[k+2:, k+1, None]*x[k+1]
+            akm1k = ldu[k+1, k]
+            akm1 = ldu[k, k]/akm1k
+            ak = ldu[k+1, k+1]/akm1k
+            denom = akm1*ak - 1.0
+            bkm1 = x[k]/akm1k
+            bk = x[k+1]/akm1k
+            x[k] = (ak*bkm1 - bk)/denom
+            x[k+1] = (akm1*bk - bkm1)/denom
+            k += 2
+
+    # solve L^T.x = y
+    k = N-1
+    while k >= 0:
+        if ipiv[k] > 0:
+            x[k] -= ldu[k+1:, k].dot(x[k+1:])
+            kp = ipiv[k]-1
+            x[[k, kp]] = x[[kp, k]]
+            k -= 1
+        else:
+            x[k] -= ldu[k+1:, k].dot(x[k+1:])
+            x[k-1] -= ldu[k+1:, k-1].dot(x[k+1:])
+            kp = -ipiv[k]-1
+            x[[k, kp]] = x[[kp, k]]
+            k -= 2
+
+    return x.reshape(np.shape(b))
+
+
+def lu_no_pivot(A):
+    """LU decomposition of a small matrix without pivoting, such that
+    A = L.U with L having unit diagonal"""
+    N = A.shape[0]
+    L = np.eye(N, dtype=np.complex128)
+    U = np.array(A, dtype=np.complex128)
+    for k in range(N-1):
+        L[k+1:, k] = U[k+1:, k]/U[k, k]
+        U[k+1:, :] -= L[k+1:, k, None]*U[None, k, :]
+    return L, np.triu(U)
+
+
+def biorthogonalise(vr, vl, G, symmetric):
+    """Normalise a set of right and left eigenvectors so that
+    vl.G.vr is the identity.
+
+    Vectors are only mixed with those which have a non-zero weighted overlap,
+    which for well separated eigenvalues reduces to a scaling of each vector,
+    while degenerate eigenvectors are orthogonalised.
+
+    Parameters
+    ----------
+    vr : ndarray (N, k)
+        The right eigenvectors
+    vl : ndarray (k, N)
+        The left eigenvectors
+    G : ndarray (k, k)
+        The weighted overlap matrix vl.T'.vr between the vectors, where T' is
+        the frequency derivative of the operator
+    symmetric : boolean
+        If True, the left and right vectors are the same, and G is complex
+        symmetric
+
+    Returns
+    -------
+    vr, vl : ndarray
+        The normalised vectors
+    """
+    L, U = lu_no_pivot(G)
+    D = np.diag(U)
+    if symmetric:
+        # G = L.D.L^T for complex symmetric G
+        vr = la.solve_triangular(L, vr.T, lower=True, unit_diagonal=True).T
+        vr = vr/np.sqrt(D)
+        return vr, vr.T
+    else:
+        # G = L.D.U' where U' has unit diagonal
+        vr = la.solve_triangular(U/D[:, None], vr.T, trans=1,
+                                 unit_diagonal=True).T/np.sqrt(D)
+        vl = la.solve_triangular(L, vl, lower=True,
+                                 unit_diagonal=True)/np.sqrt(D)[:, None]
+
+        # give left and right vectors the same magnitude
+        scale = np.sqrt(np.sqrt(np.sum(np.abs(vr)**2, axis=0) /
+                                np.sum(np.abs(vl)**2, axis=1)))
+        return vr/scale, vl*scale[:, None]
+
+
+def eig_newton_block(func, w_0, vr_0, vl_0=None, w_tol=1e-8, max_iter=20,
+                     func_gives_der=False, args=[]):
+    """Refine a cluster of eigenvalues of a nonlinear eigenvalue problem
+    together, by iterating on a shared subspace
+
+    func(w).vr = 0
+
+    and optionally also
+
+    vl.func(w) = 0
+
+    Each iteration evaluates the function (and its derivative) once, at the
+    centre of the cluster, and the single LU factorisation is used to update
+    the whole subspace by block inverse iteration. The eigenvalues within the
+    cluster are then found from the Rayleigh-Ritz problem projected onto this
+    subspace, linearised about the centre of the cluster. Once the subspace
+    has converged, the separated Ritz pairs are polished individually with
+    `eig_newton`. This avoids the problem of independent Newton iterations
+    converging onto the same eigenvector for degenerate or nearly degenerate
+    eigenvalues.
+
+    Parameters
+    ----------
+    func : function
+        The function to search for zeros
+    w_0 : ndarray (k)
+        The starting guesses for the eigenvalues in the cluster
+    vr_0 : ndarray (N, k)
+        The starting guesses for the right eigenvectors
+    vl_0 : ndarray (k, N), optional
+        The starting guess for the left eigenvectors. If not supplied, vr_0
+        will be used, which is only accurate when func(w) is complex
+        symmetric
+    w_tol : float, optional
+        The relative tolerance in the eigenvalues for convergence
+    max_iter : int, optional
+        The maximum number of iterations to perform
+    func_gives_der : boolean, optional
+        If `True`, then the function also returns the derivative as the second
+        returned value. If `False` finite differences will be used instead,
+        which will have reduced accuracy
+    args : list, optional
+        Any additional arguments to be supplied to `func`
+
+    Returns
+    -------
+    res : dictionary
+        A dictionary containing the following members:
+
+        'w' : the eigenvalues
+        'vr' : the right eigenvectors, as columns
+        'vl' : the left eigenvectors, as rows
+        'iter_count' : the number of iterations performed
+        'delta_w' : the largest relative change in the eigenvalues on the
+        final iteration
+
+        Each eigenvector pair is normalised such that vl.func'(w).vr = 1
+
+    See:
+    1.  D. Kressner, “A block Newton method for nonlinear eigenvalue
+        problems,” Numer. Math., vol. 114, no. 2, pp. 355–372, 2009.
+
+    2.  A. Ruhe, “Algorithms for the Nonlinear Eigenvalue Problem,”
+        SIAM J. Numer. Anal., vol. 10, no. 4, pp. 674–689, Sep. 1973.
+    """
+
+    w_s = np.array(w_0, dtype=np.complex128)
+    num_w = len(w_s)
+
+    logging.debug("Searching for %d clustered zeros with eig_newton_block"
+                  % num_w)
+
+    symmetric = vl_0 is None
+    vr_s = la.qr(np.asarray(vr_0).reshape(-1, num_w), mode='economic')[0]
+    if not symmetric:
+        vl_s = la.qr(np.asarray(vl_0).reshape(num_w, -1).T,
+                     mode='economic')[0]
+
+    if not func_gives_der:
+        # evaluate at an arbitrary nearby starting point to allow finite
+        # differences to be taken
+        w_sm = np.mean(w_s)*(1+(10+10j)*w_tol)
+        T_sm = func(w_sm, *args)
+
+    converged = False
+
+    for iter_count in range(max_iter):
+        # Expand about the centre of the cluster. Placing the shift on any
+        # one eigenvalue would cause the inverse iteration to collapse the
+        # subspace onto its eigenvector.
+        w_c = np.mean(w_s)
+
+        if func_gives_der:
+            T_s, T_ds = func(w_c, *args)
+        else:
+            T_s = func(w_c, *args)
+            T_ds = (T_s - T_sm)/(w_c - w_sm)
+
+        # Update the whole subspace with a single factorisation
+        T_s_lu = la.lu_factor(T_s)
+        vr_s = la.qr(la.lu_solve(T_s_lu, T_ds.dot(vr_s)), mode='economic')[0]
+        if symmetric:
+            vl_s = vr_s
+        else:
+            vl_s = la.qr(la.lu_solve(T_s_lu, T_ds.T.dot(vl_s), trans=1),
+                         mode='economic')[0]
+
+        # project onto the subspace, and solve the linearised problem
+        A = vl_s.T.dot(T_s.dot(vr_s))
+        B = vl_s.T.dot(T_ds.dot(vr_s))
+        delta, z_l, z_r = la.eig(A, -B, left=True)
+        z_l = z_l.conjugate()
+        w_s1 = w_c + delta
+
+        # match the new eigenvalues to the previous ones
+        order = linear_sum_assignment(np.abs(w_s[:, None]-w_s1[None, :]))[1]
+        w_s1 = w_s1[order]
+        z_r = z_r[:, order]
+        z_l = z_l[:, order]
+
+        # The Ritz values only need to be accurate enough to separate the
+        # modes before they are refined individually
+        delta_w = np.max(np.abs((w_s1 - w_s)/w_s))
+        converged = delta_w < np.sqrt(w_tol)
+
+        logging.debug("Cluster centre %+.4e %+.4ej, delta %.4e"
+                      % (w_c.real, w_c.imag, delta_w))
+
+        if not func_gives_der:
+            w_sm = w_c
+            T_sm = T_s
+
+        w_s = w_s1
+
+        if converged:
+            break
+
+    if not converged:
+        raise ConvergenceError("maximum iterations reached, no convergence")
+
+    # The Ritz vectors, biorthogonalised against the derivative to separate
+    # any degenerate eigenvalues
+    if symmetric:
+        z_l = z_r
+    z_r, z_l = biorthogonalise(z_r, z_l.T, z_l.T.dot(B.dot(z_r)), symmetric)
+    vr = vr_s.dot(z_r)
+    vl = z_l.dot(vl_s.T)
+
+    # The linearisation about the centre of the cluster is only exact for
+    # degenerate eigenvalues, so the Ritz pairs are individually refined.
+    # These are now well separated, so they cannot converge onto the same
+    # solution.
+    weight = 'rayleigh symmetric' if symmetric else 'rayleigh asymmetric'
+    for n in range(num_w):
+        res = eig_newton(func, w_s[n], vr[:, n], lambda_tol=w_tol,
+                         max_iter=max_iter, func_gives_der=func_gives_der,
+                         args=args, weight=weight, y_0=vl[n],
+                         symmetric=symmetric)
+        w_s[n] = res['eigval']
+        vr[:, n] = res['eigvec']
+        vl[n] = res['eigvec_left']
+        iter_count += res['iter_count']
+        delta_w = max(delta_w, res['delta_lambda'])
+
+    return {'w': w_s, 'vr': vr, 'vl': vl, 'iter_count': iter_count+1,
+            'delta_w': delta_w}
+
+
 def project_modes(mode_j, E):
     """Take the projection of some field onto mode currents. Mostly useful
     for degenerate modes, in order to make the polarisation of a particular
@@ -21,33 +21,124 @@
 from __future__ import division
 
 # numpy and scipy
+import logging
+
 import numpy as np
 import scipy.linalg as la
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, gmres
+
+from openmodes.array import LookupArray, IndexPlan
+from openmodes.basis import LinearTriangleBasis
+from openmodes.eig import ldl_factor, ldl_solve, ConvergenceError
+from openmodes.out_of_core import lu_factor_tiled, lu_solve_tiled
+
+# The number of elements of each matrix which are combined at a time, so that
+# the temporary values remain in cache
+CHUNK_ELEMENTS = 2**15
+
+
+def linear_combination(terms, out, accumulate=False):
+    """Calculate a linear combination of matrices, without creating any
+    temporary matrices
+
+    The rows are combined a few at a time, so that only a small scratch
+    array is needed, and each part of the result is completed while it is
+    in cache.
+
+    Parameters
+    ----------
+    terms : list of tuple
+        Each term is a scalar coefficient and a matrix
+    out : ndarray
+        The array in which to store the result, which has the same shape as
+        each matrix
+    accumulate : boolean, optional
+        If True, the linear combination is added to the contents of `out`
+
+    Returns
+    -------
+    out : ndarray
+        The array containing the result
+    """
+    target = np.asarray(out)
+    terms = [(coeff, np.asarray(mat)) for coeff, mat in terms]
+
+    if not accumulate and len(terms) == 0:
+        target[:] = 0.0
+        return out
+
+    num_rows = target.shape[0]
+    chunk_rows = max(1, CHUNK_ELEMENTS*num_rows//max(target.size, 1))
+    scratch = np.empty((min(chunk_rows, num_rows),)+target.shape[1:],
+                       dtype=target.dtype)
+
+    for start in range(0, num_rows, chunk_rows):
+        rows = slice(start, min(start+chunk_rows, num_rows))
+        target_rows = target[rows]
+        temp = scratch[:target_rows.shape[0]]
+        for count, (coeff, mat) in enumerate(terms):
+            if count == 0 and not accumulate:
+                np.multiply(mat[rows], coeff, out=target_rows)
+            else:
+                np.multiply(mat[rows], coeff, out=temp)
+                target_rows += temp
+    return out
 
-from openmodes.array import LookupArray
+
+def efie_terms(s, L, S, dL=None, dS=None, coeff=1.0, der_coeff=0.0):
+    """The terms of `coeff*D + der_coeff*dD/ds` for `linear_combination`,
+    where D = s*L + S/s is the EFIE operator and dD/ds is its frequency
+    derivative"""
+    terms = [(coeff*s + der_coeff, L), (coeff/s - der_coeff/s**2, S)]
+    if der_coeff != 0.0:
+        terms += [(der_coeff*s, dL), (der_coeff/s, dS)]
+    return terms
 
 
 class ImpedanceMatrixLA(object):
     """An impedance matrix based on LookupArray, which can hold matrices for
-    Parts of arbitrary level"""
+    Parts of arbitrary level
+
+    If a `ScratchStorage` object is passed as `storage`, then the matrices
+    are held in memory-mapped files instead of memory, and are factorised
+    one tile at a time. In this case `val` should be avoided, as it creates
+    the whole matrix in memory.
+
+    If `derivatives` is False, then the frequency derivatives were not
+    calculated together with the matrices. They will be calculated by the
+    operator when they are first accessed.
+
+    For a symmetric matrix, the operator may calculate only the blocks on and
+    above the diagonal, and record the remaining blocks with `defer_mirror`.
+    These are filled with the transposes of the calculated blocks when any
+    of the matrices are first accessed."""
 
     matrix_names = ('Z',)
 
     def __init__(self, part_o, part_s, basis_container, sources, unknowns,
-                 metadata=None, matrices=None, derivatives=None):
+                 metadata=None, matrices=None, derivatives=None,
+                 second_derivatives=None, storage=None):
         self.md = metadata or dict()
         self.part_o = part_o
         self.part_s = part_s
         self.basis_container = basis_container
         self.sources = sources
         self.unknowns = unknowns
+        self.storage = storage
+        self.unmirrored = []
 
         # Note that the internal LookupArray format is different from the
         # final format as it excludes the quantity lookup.
-        self.matrices = {name: LookupArray(((part_o, basis_container),
-                                            (part_s, basis_container)),
-                                           dtype=np.complex128)
-                         for name in self.matrix_names}
+        index_data = ((part_o, basis_container), (part_s, basis_container))
+
+        def new_matrix():
+            if storage is None:
+                return LookupArray(index_data, dtype=np.complex128)
+            else:
+                return storage.lookup_array(index_data, dtype=np.complex128)
+
+        self.matrices = {name: new_matrix() for name in self.matrix_names}
 
         if matrices is not None:
             # fill out any matrices which are supplied
@@ -56,37 +147,320 @@ class ImpedanceMatrixLA(object):
 
         # create the frequency derivatives of the matrices
         if derivatives is None:
-            self.der = {name: LookupArray(((part_o, basis_container,),
-                                           (part_s, basis_container)),
-                                          dtype=np.complex128)
-                        for name in self.matrix_names}
+            self._der = {name: new_matrix() for name in self.matrix_names}
         else:
-            self.der = derivatives
+            self._der = derivatives
 
-    def val(self):
-        "The value of the impedance matrix"
-        Z = LookupArray((self.sources, (self.part_o, self.basis_container), self.unknowns,
-                         (self.part_s, self.basis_container)), dtype=np.complex128)
-        Z.simple_view()[:] = self.matrices['Z']
+        # The second frequency derivatives are only created on request, as
+        # few operators provide them
+        if second_derivatives is True:
+            self.der2 = {name: new_matrix() for name in self.matrix_names}
+        else:
+            self.der2 = second_derivatives
+
+    @property
+    def matrices(self):
+        "The matrices from which the impedance is calculated"
+        if self.unmirrored:
+            self.mirror()
+        return self._matrices
+
+    @matrices.setter
+    def matrices(self, matrices):
+        self._matrices = matrices
+
+    @property
+    def der2(self):
+        "The second frequency derivatives of the matrices, or None"
+        if self.unmirrored:
+            self.mirror()
+        return self._der2
+
+    @der2.setter
+    def der2(self, der2):
+        self._der2 = der2
+
+    def defer_mirror(self, blocks):
+        """Record blocks of a symmetric matrix which have not been
+        calculated, as they are the transposes of other blocks
+
+        Parameters
+        ----------
+        blocks : list of tuple
+            Each block is given by its observer and source parts. The block
+            with these parts swapped must have been calculated.
+        """
+        self.unmirrored.extend(blocks)
+
+    def mirror(self):
+        """Fill all blocks recorded by `defer_mirror` with the transposes of
+        the corresponding calculated blocks. Each block is copied directly
+        between the stored arrays, without creating any intermediate
+        impedance matrix."""
+        blocks = self.unmirrored
+        self.unmirrored = []
+
+        all_matrices = list(self._matrices.values())
+        if self._der not in (None, False):
+            all_matrices.extend(self._der.values())
+        if self._der2 is not None:
+            all_matrices.extend(self._der2.values())
+
+        # all matrices share the same lookup of the parts
+        lookup = all_matrices[0].lookup
+        for part_o, part_s in blocks:
+            lower = IndexPlan.convert(lookup, (part_o, part_s))
+            upper = IndexPlan.convert(lookup, (part_s, part_o))
+            for mat in all_matrices:
+                raw = mat.view(np.ndarray)
+                raw[lower] = raw[upper].T
+
+    @property
+    def der(self):
+        """The frequency derivatives of the matrices. If these were deferred
+        when the matrices were calculated, then they are calculated now."""
+        if self.unmirrored:
+            self.mirror()
+        if self._der is False:
+            operator = self.md.get('operator')
+            if (operator is None or
+                    self.basis_container is not operator.basis_container):
+                raise NotImplementedError("Frequency derivatives were not "
+                                          "calculated")
+            logging.info("Calculating deferred frequency derivatives")
+            Z = operator.impedance(self.md['s'], self.part_o, self.part_s,
+                                   frequency_derivatives=True,
+                                   storage=self.storage)
+            self._der = Z.der
+        return self._der
+
+    @property
+    def deferred_derivatives(self):
+        "Whether the calculation of the frequency derivatives was deferred"
+        return self._der is False
+
+    def output_array(self, out=None):
+        """An array in which to store the value or frequency derivatives of
+        the impedance matrix, together with its simple view
+
+        Parameters
+        ----------
+        out : LookupArray, optional
+            An array returned by a previous call of `val` or
+            `frequency_derivative` for a matrix of the same parts, which is
+            reused instead of creating a new array
+        """
+        if out is None:
+            out = LookupArray((self.sources, (self.part_o,
+                                              self.basis_container),
+                               self.unknowns, (self.part_s,
+                                               self.basis_container)),
+                              dtype=np.complex128)
+        return out, out.simple_view()
+
+    def val(self, out=None):
+        """The value of the impedance matrix
+
+        Parameters
+        ----------
+        out : LookupArray, optional
+            An array returned by a previous call, in which the value is
+            stored instead of creating a new array
+
+        Returns
+        -------
+        Z : LookupArray
+            The value of the impedance matrix
+        """
+        Z, Z_simple = self.output_array(out)
+        Z_simple[:] = self.matrices['Z']
         return Z
 
-    def frequency_derivative(self):
-        # TODO: return LookupArray?
-        return self.der['Z']
+    def val_rows(self, rows, out=None):
+        """The value of some rows of the simple view of the impedance matrix,
+        without creating the whole matrix
+
+        Parameters
+        ----------
+        rows : slice
+            The rows to calculate
+        out : ndarray, optional
+            The array in which to store the rows
+        """
+        if out is None:
+            return np.array(self.matrices['Z'][rows])
+        out[:] = self.matrices['Z'][rows]
+        return out
+
+    def val_stacked(self, s, matrices):
+        """The values of several matrices of the same form as this one, each
+        at a different frequency
+
+        Parameters
+        ----------
+        s : ndarray (n_freq)
+            The frequencies
+        matrices : dict of ndarray (n_freq, M, N)
+            The simple view of each matrix at each frequency, stacked along
+            the first axis
+        """
+        return np.array(matrices['Z'])
+
+    def frequency_derivative(self, out=None):
+        """The derivative of the impedance matrix with respect to frequency
+
+        Parameters
+        ----------
+        out : LookupArray, optional
+            An array returned by a previous call, in which the derivative is
+            stored. Otherwise the stored derivative is returned without
+            copying.
+        """
+        if out is None:
+            return self.der['Z']
+        out.simple_view()[:] = self.der['Z']
+        return out
+
+    def frequency_second_derivative(self, out=None):
+        "The second derivative of the impedance matrix with respect to frequency"
+        if self.der2 is None:
+            raise NotImplementedError("Second derivatives were not calculated")
+        if out is None:
+            return self.der2['Z']
+        out.simple_view()[:] = self.der2['Z']
+        return out
 
     def clear_cached(self):
         "Clear any cached data"
         if hasattr(self, "lu_factored"):
             del self.lu_factored
+        if hasattr(self, "block_factors"):
+            del self.block_factors
+        if hasattr(self, "approximate_inverse"):
+            del self.approximate_inverse
+        if hasattr(self, "update_base"):
+            del self.update_base
+        if hasattr(self, "woodbury"):
+            del self.woodbury
+
+    def record_update(self, indices):
+        """Prepare for the rows and columns `indices` of the matrix to be
+        modified, which occurs when parts are moved.
+
+        If the matrix has already been factorised, the values of these rows
+        and columns at the time of factorisation are kept, so that `solve`
+        can correct the existing factorisation with the Woodbury identity,
+        instead of factorising the modified matrix. If a large fraction of
+        the matrix has changed, the factorisation is discarded instead.
+        """
+        if not hasattr(self, "lu_factored"):
+            return
+
+        if self.storage is not None:
+            # the original rows and columns cannot be kept in memory
+            self.clear_cached()
+            return
+
+        if hasattr(self, "woodbury"):
+            del self.woodbury
+
+        Z = self.val().simple_view()
+        if not hasattr(self, "update_base"):
+            base_indices = np.unique(indices)
+            rows = Z[base_indices]
+            cols = Z[:, base_indices]
+        else:
+            # For newly modified rows and columns, their intersections with
+            # previously modified columns and rows have already changed, so
+            # the values at the time of factorisation are taken from those
+            old_indices, old_rows, old_cols = self.update_base
+            new_indices = np.setdiff1d(indices, old_indices)
+            new_rows = Z[new_indices]
+            new_rows[:, old_indices] = old_cols[new_indices]
+            new_cols = Z[:, new_indices]
+            new_cols[old_indices] = old_rows[:, new_indices]
+
+            base_indices = np.hstack((old_indices, new_indices))
+            rows = np.vstack((old_rows, new_rows))
+            cols = np.hstack((old_cols, new_cols))
+
+        if 4*len(base_indices) > Z.shape[0]:
+            self.clear_cached()
+        else:
+            self.update_base = (base_indices, rows, cols)
+
+    def woodbury_factors(self, base_solve):
+        """The factors required to correct the solution of the originally
+        factorised matrix for the modified rows and columns.
+
+        The change in the matrix is written as a low-rank product U.V^T,
+        where U contains the changed columns and the unit vectors of the
+        changed rows, and V^T contains the changed rows and the unit vectors
+        of the changed columns."""
+        try:
+            return self.woodbury
+        except AttributeError:
+            pass
+
+        indices, rows, cols = self.update_base
+        Z = self.val().simple_view()
+        num_changed = len(indices)
+
+        delta_rows = Z[indices] - rows
+        delta_cols = Z[:, indices] - cols
+        # the intersection of rows and columns is included in delta_rows
+        delta_cols[indices] = 0.0
+
+        U = np.zeros((Z.shape[0], 2*num_changed), dtype=np.complex128)
+        U[indices, np.arange(num_changed)] = 1.0
+        U[:, num_changed:] = delta_cols
+
+        W = base_solve(U)
+        capacitance = (np.eye(2*num_changed) +
+                       np.vstack((delta_rows.dot(W), W[indices])))
+        self.woodbury = (indices, delta_rows, W, la.lu_factor(capacitance))
+        return self.woodbury
 
     def factored(self):
-        "Caches the LU factorisation of the matrix"
+        """Caches the factorisation of the matrix. If the matrix is known to
+        be symmetric, a symmetric LDL^T factorisation is used, otherwise
+        an LU factorisation.
+
+        Note that if the matrix has been modified since it was factorised,
+        then this is the factorisation of the original matrix."""
         try:
             return self.lu_factored
         except AttributeError:
-            self.lu_factored = la.lu_factor(self.val().simple_view())
+            if self.storage is not None:
+                self.lu_factored = self.factored_tiled()
+                return self.lu_factored
+
+            Z = self.val().simple_view()
+            if self.md.get('symmetric', False):
+                self.lu_factored = ldl_factor(Z, overwrite_a=True)
+            else:
+                self.lu_factored = la.lu_factor(Z)
             return self.lu_factored
 
+    def factored_tiled(self):
+        """Factorise a matrix held in scratch storage, one tile at a time.
+        The matrix is first copied to a new memory-mapped array, which is
+        then overwritten by its LU factors."""
+        num_unknowns = len(LookupArray((self.unknowns, (self.part_s,
+                                                        self.basis_container)),
+                                       dtype=np.int8).simple_view())
+
+        Z = self.storage.empty((num_unknowns, num_unknowns), np.complex128)
+        tile_size = self.storage.tile_size(num_unknowns,
+                                           copies=len(self.matrix_names)+1)
+        for start in range(0, num_unknowns, tile_size):
+            rows = slice(start, min(start+tile_size, num_unknowns))
+            self.val_rows(rows, out=Z[rows])
+
+        logging.info("Factorising impedance matrix with %d unknowns in "
+                     "scratch storage" % num_unknowns)
+        return lu_factor_tiled(Z, self.storage.tile_size(num_unknowns))
+
     def solve(self, vec):
         """Solve the impedance matrix for a source vector. Caches the
         factorised matrix for efficiently solving multiple vectors"""
@@ -99,12 +473,272 @@ class ImpedanceMatrixLA(object):
 
         lookup = (self.unknowns, (self.part_s, self.basis_container))
 
+        if len(vec.shape) > 1:
+            lookup = lookup+(vec.shape[1],)
+
+        def base_solve(b):
+            if self.storage is not None:
+                return lu_solve_tiled(Z_lu, b)
+            elif self.md.get('symmetric', False):
+                return ldl_solve(Z_lu, b)
+            else:
+                return la.lu_solve(Z_lu, b)
+
+        I = LookupArray(lookup, dtype=np.complex128)
+        I_simp = I.simple_view()
+        I_simp[:] = base_solve(vec)
+
+        if hasattr(self, "update_base"):
+            # correct for the rows and columns changed since factorisation
+            indices, delta_rows, W, capacitance = \
+                self.woodbury_factors(base_solve)
+            I_simp -= W.dot(la.lu_solve(capacitance,
+                                        np.concatenate((delta_rows.dot(I_simp),
+                                                        I_simp[indices]))))
+        return I
+
+    def part_indices(self, part):
+        """The row and column indices of a single part within the simple view
+        of the matrix"""
+        indices = []
+        for quantities, parent in ((self.sources, self.part_o),
+                                   (self.unknowns, self.part_s)):
+            index = LookupArray((quantities, (parent, self.basis_container)),
+                                dtype=np.int64)
+            index.simple_view()[:] = np.arange(index.size)
+            indices.append(np.asarray(index[:, part]).ravel())
+        return indices
+
+    def block_factored(self):
+        """Caches the factorisation of the self-impedance block of each
+        distinct part. Parts with the same `unique_id` have identical self
+        blocks, so each is factorised only once.
+
+        Returns
+        -------
+        blocks : list of tuple
+            For each single part, its row indices, column indices and the
+            factorisation of its self block
+        """
+        try:
+            return self.block_factors
+        except AttributeError:
+            pass
+
+        symmetric = self.md.get('symmetric', False)
+        Z = self.val().simple_view()
+        factors = {}
+        self.block_factors = []
+        for part in self.part_s.iter_single():
+            rows, cols = self.part_indices(part)
+            if part.unique_id not in factors:
+                Z_part = Z[np.ix_(rows, cols)]
+                if symmetric:
+                    factors[part.unique_id] = ldl_factor(Z_part,
+                                                         overwrite_a=True)
+                else:
+                    factors[part.unique_id] = la.lu_factor(Z_part)
+            self.block_factors.append((rows, cols, factors[part.unique_id]))
+
+        logging.info("Factorised %d distinct self blocks for %d parts"
+                     % (len(factors), len(self.block_factors)))
+        return self.block_factors
+
+    def sparse_approximate_inverse(self):
+        """Caches a sparse approximate inverse of the matrix, for use as a
+        preconditioner
+
+        Only the near-field interactions within each part are considered,
+        i.e. pairs of basis functions whose supports share a node. Each
+        column of the approximate inverse M has the same sparsity as the
+        near-field interactions, and is found by minimising the Frobenius
+        norm of Z.M - I with a small least-squares problem. Parts with the
+        same `unique_id` share the same approximate inverse.
+
+        Returns
+        -------
+        M : csr_matrix
+            The sparse approximate inverse
+        """
+        try:
+            return self.approximate_inverse
+        except AttributeError:
+            pass
+
+        Z = self.val().simple_view()
+        part_inverses = {}
+        M_rows = []
+        M_cols = []
+        M_data = []
+
+        for part in self.part_s.iter_single():
+            rows, cols = self.part_indices(part)
+
+            if part.unique_id not in part_inverses:
+                basis = self.basis_container[part]
+                if not isinstance(basis, LinearTriangleBasis):
+                    raise NotImplementedError("Sparse approximate inverse "
+                                              "requires basis functions "
+                                              "defined on triangles")
+
+                # the same pattern applies to all quantities
+                near = basis.near_neighbours
+                num_quantities = len(cols)//near.shape[0]
+                near = sp.kron(np.ones((num_quantities, num_quantities)),
+                               near).tocsc()
+
+                Z_part = Z[np.ix_(rows, cols)]
+                inverse_rows = []
+                inverse_cols = []
+                inverse_data = []
+                for col in range(len(rows)):
+                    J = near.indices[near.indptr[col]:near.indptr[col+1]]
+                    I = np.unique(near[:, J].indices)
+                    target = (I == col).astype(Z.dtype)
+                    m = np.linalg.lstsq(Z_part[np.ix_(I, J)], target,
+                                        rcond=None)[0]
+                    inverse_rows.append(J)
+                    inverse_cols.append(np.full(len(J), col))
+                    inverse_data.append(m)
+
+                part_inverses[part.unique_id] = (np.hstack(inverse_rows),
+                                                 np.hstack(inverse_cols),
+                                                 np.hstack(inverse_data))
+
+            inverse_rows, inverse_cols, inverse_data = \
+                part_inverses[part.unique_id]
+            M_rows.append(cols[inverse_rows])
+            M_cols.append(rows[inverse_cols])
+            M_data.append(inverse_data)
+
+        self.approximate_inverse = sp.csr_matrix((np.hstack(M_data),
+                                                  (np.hstack(M_rows),
+                                                   np.hstack(M_cols))),
+                                                 shape=Z.shape[::-1])
+        return self.approximate_inverse
+
+    def solve_iterative(self, vec, tol=1e-8, max_iter=None, restart=50,
+                        modes=None, callback=None,
+                        preconditioner='block jacobi'):
+        """Solve the impedance matrix for a source vector by GMRES iteration,
+        by default preconditioned by the self-impedance blocks of each part.
+
+        This avoids factorising the full matrix, which is particularly
+        efficient for arrays of many identical parts, where only the self
+        block of each distinct part needs to be factorised.
+
+        Near the resonances of the parts, the system is poorly conditioned,
+        which can greatly increase the number of iterations. If the modes of
+        the parts are supplied, then the component of the solution within
+        the space of these modes is found directly, by a Petrov-Galerkin
+        projection of the matrix onto the right and left eigenvectors,
+        so that the iterative solution only needs to find the remaining
+        non-resonant part.
+
+        Parameters
+        ----------
+        vec : LookupArray or ndarray
+            The source vector. If it has two dimensions, each column is
+            solved separately
+        tol : float, optional
+            The relative tolerance on the residual
+        max_iter : integer, optional
+            The maximum number of restart cycles
+        restart : integer, optional
+            The number of iterations between restarts
+        modes : Modes, optional
+            The modes of the parts, which are used to deflate the problem.
+            These should be defined for the same parent part as this matrix,
+            as returned by `Simulation.refine_poles`
+        callback : function, optional
+            Called after each iteration with the norm of the preconditioned
+            residual
+        preconditioner : string, LinearOperator or None, optional
+            'block jacobi' to use the factorised self-impedance blocks, 'sai'
+            for the near-field sparse approximate inverse, None for no
+            preconditioning, or any operator which approximates the inverse
+            of the matrix, such as that given by
+            `EfieOperator.calderon_preconditioner`
+
+        Returns
+        -------
+        I : LookupArray
+            The solution vector
+        """
+        if self.part_o != self.part_s:
+            raise ValueError("Can only invert a self-impedance matrix")
+
+        Z = self.val().simple_view()
+        symmetric = self.md.get('symmetric', False)
+
+        if preconditioner is None:
+            def base_precondition(r):
+                return r
+        elif hasattr(preconditioner, 'matvec'):
+            base_precondition = preconditioner.matvec
+        elif preconditioner == 'block jacobi':
+            blocks = self.block_factored()
+
+            def base_precondition(r):
+                x = np.empty_like(r)
+                for rows, cols, factors in blocks:
+                    if symmetric:
+                        x[cols] = ldl_solve(factors, r[rows])
+                    else:
+                        x[cols] = la.lu_solve(factors, r[rows])
+                return x
+        elif preconditioner == 'sai':
+            base_precondition = self.sparse_approximate_inverse().dot
+        else:
+            raise ValueError("Unknown preconditioner %s" % preconditioner)
+
+        if modes is None:
+            precondition = base_precondition
+        else:
+            if modes.parent_part != self.part_s:
+                raise ValueError("Modes must be defined for the same part as "
+                                 "the impedance matrix")
+            Z_modal_lu = la.lu_factor(modes.project_matrix(Z))
+
+            def precondition(r):
+                # coarse correction in the space of the modes, followed by
+                # preconditioning of the remaining residual
+                x_modes = la.lu_solve(Z_modal_lu, modes.project(r).simple_view())
+                x = modes.expand(x_modes).simple_view()
+                return x + base_precondition(r - Z.dot(x))
+
+        M = LinearOperator(Z.shape, matvec=precondition, dtype=Z.dtype)
+
+        if isinstance(vec, LookupArray):
+            vec = vec.simple_view()
+
+        lookup = (self.unknowns, (self.part_s, self.basis_container))
+
         if len(vec.shape) > 1:
             lookup = lookup+(vec.shape[1],)
 
         I = LookupArray(lookup, dtype=np.complex128)
         I_simp = I.simple_view()
-        I_simp[:] = la.lu_solve(Z_lu, vec)
+        I_simp = I_simp.reshape(I_simp.shape[0], -1)
+
+        for col, rhs in enumerate(vec.reshape(vec.shape[0], -1).T):
+            # the initial guess is the preconditioned source
+            iter_count = [0]
+
+            def count(residual):
+                iter_count[0] += 1
+                if callback is not None:
+                    callback(residual)
+
+            x, info = gmres(Z, rhs, x0=precondition(rhs), tol=tol,
+                            restart=restart, maxiter=max_iter, M=M,
+                            callback=count, callback_type='pr_norm')
+            if info > 0:
+                raise ConvergenceError("GMRES did not converge after %d "
+                                       "iterations" % iter_count[0])
+            logging.info("GMRES converged after %d iterations"
+                         % iter_count[0])
+            I_simp[:, col] = x
         return I
 
     def __getitem__(self, index):
@@ -115,44 +749,65 @@ class ImpedanceMatrixLA(object):
             ind1 = index
             ind2 = self.part_s
 
-        matrices = {key: val[ind1, ind2] for key, val in self.matrices.items()}
-        if self.der in (None, False):
-            der = self.der
+        # all matrices share the same lookup of the parts
+        plan = self.matrices[self.matrix_names[0]].index_plan((ind1, ind2))
+
+        matrices = {key: val[plan] for key, val in self.matrices.items()}
+        if self._der in (None, False):
+            der = self._der
+        else:
+            der = {key: val[plan] for key, val in self._der.items()}
+
+        if self.der2 is None:
+            der2 = None
         else:
-            der = {key: val[ind1, ind2] for key, val in self.der.items()}
+            der2 = {key: val[plan] for key, val in self.der2.items()}
 
         return self.__class__(ind1, ind2, self.basis_container, self.sources,
                               self.unknowns, metadata=self.md,
-                              matrices=matrices, derivatives=der)
+                              matrices=matrices, derivatives=der,
+                              second_derivatives=der2)
 
     def __setitem__(self, index, other):
         "Set part of this matrix from another impedance matrix"
         if not isinstance(other, ImpedanceMatrixLA):
             raise ValueError("Can only set to another impedance matrix")
+        plan = self.matrices[self.matrix_names[0]].index_plan(index)
         for name in self.matrix_names:
-            self.matrices[name][index] = other.matrices[name]
-            if self.der:
-                self.der[name][index] = other.der[name]
+            self.matrices[name][plan] = other.matrices[name]
+            if self._der and other._der:
+                self._der[name][plan] = other._der[name]
+            if self.der2 is not None and other.der2 is not None:
+                self.der2[name][plan] = other.der2[name]
 
     @property
     def T(self):
         matrices = {key: val.T for key, val in self.matrices.items()}
 
-        if self.der in (None, False):
-            der = self.der
+        if self._der in (None, False):
+            der = self._der
         else:
-            der = {key: val.T for key, val in self.der.items()}
+            der = {key: val.T for key, val in self._der.items()}
+
+        if self.der2 is None:
+            der2 = None
+        else:
+            der2 = {key: val.T for key, val in self.der2.items()}
 
         return self.__class__(self.part_s, self.part_o, self.basis_container,
                               self.sources, self.unknowns, metadata=self.md,
-                              matrices=matrices, derivatives=der)
+                              matrices=matrices, derivatives=der,
+                              second_derivatives=der2)
 
     def weight(self, vr, vl):
         "Weight the impedance matrix by right and left vectors"
         new_matrices = {name: np.dot(vl.simple_view(), np.dot(mat, vr.simple_view()))
                         for name, mat in self.matrices.items()}
-        new_der = {name: np.dot(vl.simple_view(), np.dot(mat, vr.simple_view()))
-                   for name, mat in self.der.items()}
+        if self.deferred_derivatives:
+            new_der = False
+        else:
+            new_der = {name: np.dot(vl.simple_view(), np.dot(mat, vr.simple_view()))
+                       for name, mat in self.der.items()}
         macro_container = vr.lookup[3][1]
         return self.__class__(self.part_o, self.part_s, macro_container,
                               ('modes',), ('modes',), self.md, new_matrices,
@@ -164,21 +819,46 @@ class EfieImpedanceMatrixLA(ImpedanceMatrixLA):
 
     matrix_names = ('L', 'S')
 
-    def val(self):
+    def val(self, out=None):
         "The value of the impedance matrix"
-        s = self.md['s']
-        Z = LookupArray((self.sources, (self.part_o, self.basis_container),
-                         self.unknowns, (self.part_s, self.basis_container)),
-                        dtype=np.complex128)
-        Z.simple_view()[:] = self.matrices['S']/s + s*self.matrices['L']
+        Z, Z_simple = self.output_array(out)
+        linear_combination(efie_terms(self.md['s'], self.matrices['L'],
+                                      self.matrices['S']), Z_simple)
         return Z
 
-    def frequency_derivative(self):
-        # TODO: return LookupArray
-        return (self.matrices['L'] +
-                self.md['s']*self.der['L'] -
-                self.matrices['S']/self.md['s']**2 +
-                self.der['S']/self.md['s'])
+    def val_rows(self, rows, out=None):
+        "The value of some rows of the simple view of the impedance matrix"
+        L = np.asarray(self.matrices['L'])[rows]
+        S = np.asarray(self.matrices['S'])[rows]
+        if out is None:
+            out = np.empty(L.shape, np.complex128)
+        return linear_combination(efie_terms(self.md['s'], L, S), out)
+
+    def val_stacked(self, s, matrices):
+        "The values of matrices at several frequencies, stacked"
+        s = s[:, None, None]
+        return matrices['S']/s + s*matrices['L']
+
+    def frequency_derivative(self, out=None):
+        "The derivative of the impedance matrix with respect to frequency"
+        dZ, dZ_simple = self.output_array(out)
+        linear_combination(efie_terms(self.md['s'], self.matrices['L'],
+                                      self.matrices['S'], self.der['L'],
+                                      self.der['S'], coeff=0.0,
+                                      der_coeff=1.0), dZ_simple)
+        return dZ
+
+    def frequency_second_derivative(self, out=None):
+        "The second derivative of the impedance matrix with respect to frequency"
+        if self.der2 is None:
+            raise NotImplementedError("Second derivatives were not calculated")
+        s = self.md['s']
+        d2Z, d2Z_simple = self.output_array(out)
+        linear_combination([(2.0, self.der['L']), (s, self.der2['L']),
+                            (2.0/s**3, self.matrices['S']),
+                            (-2.0/s**2, self.der['S']),
+                            (1.0/s, self.der2['S'])], d2Z_simple)
+        return d2Z
 
 
 class CfieImpedanceMatrixLA(ImpedanceMatrixLA):
@@ -186,17 +866,44 @@ class CfieImpedanceMatrixLA(ImpedanceMatrixLA):
 
     matrix_names = ('L', 'S', 'M')
 
-    def val(self):
+    def val(self, out=None):
         "The value of the impedance matrix"
-        s = self.md['s']
         alpha = self.md['alpha']
-        Z = LookupArray((self.sources, (self.part_o, self.basis_container),
-                         self.unknowns, (self.part_s, self.basis_container)),
-                        dtype=np.complex128)
-        Z.simple_view()[:] = (alpha*(self.matrices['S']/s + s*self.matrices['L']) +
-                              (1.0-alpha)*self.matrices['M'])
+        Z, Z_simple = self.output_array(out)
+        linear_combination(efie_terms(self.md['s'], self.matrices['L'],
+                                      self.matrices['S'], coeff=alpha) +
+                           [(1.0-alpha, self.matrices['M'])], Z_simple)
         return Z
 
+    def val_rows(self, rows, out=None):
+        "The value of some rows of the simple view of the impedance matrix"
+        alpha = self.md['alpha']
+        L, S, M = (np.asarray(self.matrices[name])[rows]
+                   for name in self.matrix_names)
+        if out is None:
+            out = np.empty(L.shape, np.complex128)
+        return linear_combination(efie_terms(self.md['s'], L, S,
+                                             coeff=alpha) +
+                                  [(1.0-alpha, M)], out)
+
+    def val_stacked(self, s, matrices):
+        "The values of matrices at several frequencies, stacked"
+        s = s[:, None, None]
+        alpha = self.md['alpha']
+        return (alpha*(matrices['S']/s + s*matrices['L']) +
+                (1.0-alpha)*matrices['M'])
+
+    def frequency_derivative(self, out=None):
+        "The derivative of the impedance matrix with respect to frequency"
+        alpha = self.md['alpha']
+        dZ, dZ_simple = self.output_array(out)
+        linear_combination(efie_terms(self.md['s'], self.matrices['L'],
+                                      self.matrices['S'], self.der['L'],
+                                      self.der['S'], coeff=0.0,
+                                      der_coeff=alpha) +
+                           [(1.0-alpha, self.der['M'])], dZ_simple)
+        return dZ
+
 
 class PenetrableImpedanceMatrixLA(ImpedanceMatrixLA):
     "An impedance matrix for penetrable objects"
@@ -206,12 +913,11 @@ class PenetrableImpedanceMatrixLA(ImpedanceMatrixLA):
     # TODO: D_i and K_i are stored inefficiently as full matrices, but only
     # self terms are actually needed
 
-    def val(self):
+    def val(self, out=None):
         "The value of the impedance matrix"
         s = self.md['s']
-        D_i = s*self.matrices['L_i']+self.matrices['S_i']/s
-        D_o = s*self.matrices['L_o']+self.matrices['S_o']/s
-        K_i = self.matrices['K_i']
+        L_o = self.matrices['L_o']
+        S_o = self.matrices['S_o']
         K_o = self.matrices['K_o']
         eta_o = self.md['eta_o']
         eta_i = self.md['eta_i']
@@ -220,23 +926,126 @@ class PenetrableImpedanceMatrixLA(ImpedanceMatrixLA):
         w_MFIE_i = self.md['w_MFIE_i']
         w_MFIE_o = self.md['w_MFIE_o']
 
-        Z = LookupArray((("E", "H"), (self.part_o, self.basis_container),
-                         ("J", "M"), (self.part_s, self.basis_container)),
-                        dtype=np.complex128)
+        Z = self.output_array(out)[0]
 
         # first calculate the external problem contributions
-        Z["E", :, "J"] = eta_o*D_o*w_EFIE_o
-        Z["E", :, "M"] = -K_o*w_EFIE_o
-        Z["H", :, "J"] = K_o*w_MFIE_o
-        Z["H", :, "M"] = D_o/eta_o*w_MFIE_o
+        linear_combination(efie_terms(s, L_o, S_o, coeff=eta_o*w_EFIE_o),
+                           Z["E", :, "J"])
+        linear_combination([(-w_EFIE_o, K_o)], Z["E", :, "M"])
+        linear_combination([(w_MFIE_o, K_o)], Z["H", :, "J"])
+        linear_combination(efie_terms(s, L_o, S_o, coeff=w_MFIE_o/eta_o),
+                           Z["H", :, "M"])
 
         # The internal contributions are only for self-terms
         for part_o in self.part_o.iter_single():
             for part_s in self.part_s.iter_single():
                 if part_o == part_s:
-                    Z["E", :, "J"][part_o, part_s] += eta_i[part_s]*D_i[part_o, part_s]*w_EFIE_i[part_s]
-                    Z["E", :, "M"][part_o, part_s] -= K_i[part_o, part_s]*w_EFIE_i[part_s]
-                    Z["H", :, "J"][part_o, part_s] += K_i[part_o, part_s]*w_MFIE_i[part_s]
-                    Z["H", :, "M"][part_o, part_s] += D_i[part_o, part_s]/eta_i[part_s]*w_MFIE_i[part_s]
+                    block = self.matrices['L_i'].index_plan((part_o, part_s))
+                    L = self.matrices['L_i'][block]
+                    S = self.matrices['S_i'][block]
+                    K = self.matrices['K_i'][block]
+                    eta = eta_i[part_s]
+
+                    linear_combination(efie_terms(s, L, S,
+                                                  coeff=eta*w_EFIE_i[part_s]),
+                                       Z["E", :, "J"][block], accumulate=True)
+                    linear_combination([(-w_EFIE_i[part_s], K)],
+                                       Z["E", :, "M"][block], accumulate=True)
+                    linear_combination([(w_MFIE_i[part_s], K)],
+                                       Z["H", :, "J"][block], accumulate=True)
+                    linear_combination(efie_terms(s, L, S,
+                                                  coeff=w_MFIE_i[part_s]/eta),
+                                       Z["H", :, "M"][block], accumulate=True)
 
         return Z
+
+    def val_rows(self, rows, out=None):
+        """The value of some rows of the simple view of the impedance matrix.
+
+        The quantities of the penetrable matrix are interleaved in the simple
+        view, so the whole matrix is created."""
+        if out is None:
+            return self.val().simple_view()[rows]
+        out[:] = self.val().simple_view()[rows]
+        return out
+
+    def val_stacked(self, s, matrices):
+        "The values of matrices at several frequencies, stacked"
+        raise NotImplementedError("Stacked values of penetrable impedance "
+                                  "matrices are not supported")
+
+    def frequency_derivative(self, out=None):
+        "The derivative of the impedance matrix with respect to frequency"
+        s = self.md['s']
+        L_o = self.matrices['L_o']
+        S_o = self.matrices['S_o']
+        K_o = self.matrices['K_o']
+        dL_o = self.der['L_o']
+        dS_o = self.der['S_o']
+        dK_o = self.der['K_o']
+
+        eta_o = self.md['eta_o']
+        eta_i = self.md['eta_i']
+        w_EFIE_i = self.md['w_EFIE_i']
+        w_EFIE_o = self.md['w_EFIE_o']
+        w_MFIE_i = self.md['w_MFIE_i']
+        w_MFIE_o = self.md['w_MFIE_o']
+
+        deta_o = self.md['eta_o_ds']
+        deta_i = self.md['eta_i_ds']
+        dw_EFIE_i = self.md['w_EFIE_i_ds']
+        dw_EFIE_o = self.md['w_EFIE_o_ds']
+        dw_MFIE_i = self.md['w_MFIE_i_ds']
+        dw_MFIE_o = self.md['w_MFIE_o_ds']
+
+        dZ = self.output_array(out)[0]
+
+        # first calculate the external problem contributions
+        linear_combination(efie_terms(s, L_o, S_o, dL_o, dS_o,
+                                      coeff=(deta_o*w_EFIE_o +
+                                             eta_o*dw_EFIE_o),
+                                      der_coeff=eta_o*w_EFIE_o),
+                           dZ["E", :, "J"])
+        linear_combination([(-w_EFIE_o, dK_o), (-dw_EFIE_o, K_o)],
+                           dZ["E", :, "M"])
+        linear_combination([(w_MFIE_o, dK_o), (dw_MFIE_o, K_o)],
+                           dZ["H", :, "J"])
+        linear_combination(efie_terms(s, L_o, S_o, dL_o, dS_o,
+                                      coeff=(dw_MFIE_o/eta_o -
+                                             w_MFIE_o*deta_o/eta_o**2),
+                                      der_coeff=w_MFIE_o/eta_o),
+                           dZ["H", :, "M"])
+
+        # The internal contributions are only for self-terms
+        for part_o in self.part_o.iter_single():
+            for part_s in self.part_s.iter_single():
+                if part_o == part_s:
+                    block = self.matrices['L_i'].index_plan((part_o, part_s))
+                    L = self.matrices['L_i'][block]
+                    S = self.matrices['S_i'][block]
+                    K = self.matrices['K_i'][block]
+                    dL = self.der['L_i'][block]
+                    dS = self.der['S_i'][block]
+                    dK = self.der['K_i'][block]
+                    eta = eta_i[part_s]
+                    d_eta = deta_i[part_s]
+                    w_E = w_EFIE_i[part_s]
+                    dw_E = dw_EFIE_i[part_s]
+                    w_M = w_MFIE_i[part_s]
+                    dw_M = dw_MFIE_i[part_s]
+
+                    linear_combination(efie_terms(s, L, S, dL, dS,
+                                                  coeff=d_eta*w_E + eta*dw_E,
+                                                  der_coeff=eta*w_E),
+                                       dZ["E", :, "J"][block], accumulate=True)
+                    linear_combination([(-w_E, dK), (-dw_E, K)],
+                                       dZ["E", :, "M"][block], accumulate=True)
+                    linear_combination([(w_M, dK), (dw_M, K)],
+                                       dZ["H", :, "J"][block], accumulate=True)
+                    linear_combination(efie_terms(s, L, S, dL, dS,
+                                                  coeff=(dw_M/eta -
+                                                         w_M*d_eta/eta**2),
+                                                  der_coeff=w_M/eta),
+                                       dZ["H", :, "M"][block], accumulate=True)
+
+        return dZ
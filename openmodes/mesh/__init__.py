@@ -20,4 +20,5 @@
 Operator classes
 """
 
-from .mesh import TriangularSurfaceMesh, nodes_not_in_edge, shared_nodes, combine_mesh
+from .mesh import (TriangularSurfaceMesh, nodes_not_in_edge, shared_nodes,
+                   combine_mesh, barycentric_refinement)
@@ -21,8 +21,10 @@ Routines and classes for storing a mesh, and querying it to calculate
 derived quantities
 """
 
+import hashlib
 import logging
 import numpy as np
+from scipy.sparse import lil_matrix
 from openmodes.helpers import Identified, cached_property
 from openmodes.external.ordered_set import OrderedSet
 from collections import OrderedDict
@@ -123,6 +125,16 @@ class TriangularSurfaceMesh(Identified):
         logging.info('Creating triangular mesh\n%d nodes\n%d triangles' %
                      (len(self.nodes), len(self.polygons)))
 
+    @cached_property
+    def content_hash(self):
+        """A hash of the nodes and polygons of the mesh. Unlike the `id`, this
+        is the same for identical meshes loaded in different sessions."""
+        content = hashlib.sha1()
+        for array in (self.nodes, self.polygons):
+            content.update(str(array.shape).encode())
+            content.update(np.ascontiguousarray(array).tobytes())
+        return content.hexdigest()
+
 #    def __repr__(self):
 #        return "Nodes
 
@@ -276,3 +288,61 @@ def combine_mesh(meshes, nodes=None):
                 mesh_class.polygon_name: np.vstack(all_polygons)}
 
     return mesh_class(raw_mesh)
+
+
+def barycentric_refinement(mesh):
+    """Divide each triangle of a mesh into six, by joining its centroid to
+    its nodes and the midpoints of its edges
+
+    Parameters
+    ----------
+    mesh : TriangularSurfaceMesh
+        The mesh to refine
+
+    Returns
+    -------
+    refined : TriangularSurfaceMesh
+        The refined mesh. Its nodes are the original nodes, followed by the
+        midpoints of each edge, in the order given by `get_edges`, followed
+        by the centroid of each triangle. Refined triangle 6*n+k lies within
+        original triangle n, and touches its node (k+1)//2 % 3, with the same
+        orientation as the original triangle.
+    node_transform : csr_matrix
+        The sparse matrix which gives the refined nodes from the original
+        nodes, so that the refined mesh can be applied to translated or
+        rotated nodes
+    """
+    edges = mesh.get_edges()
+    num_nodes = len(mesh.nodes)
+    num_edges = len(edges)
+    num_triangles = len(mesh.polygons)
+
+    node_transform = lil_matrix((num_nodes+num_edges+num_triangles,
+                                 num_nodes))
+    for node in range(num_nodes):
+        node_transform[node, node] = 1.0
+
+    edge_numbers = {}
+    for edge_count, edge in enumerate(edges):
+        edge_numbers[frozenset(edge)] = num_nodes+edge_count
+        node_transform[num_nodes+edge_count, edge[0]] = 0.5
+        node_transform[num_nodes+edge_count, edge[1]] = 0.5
+
+    polygons = np.empty((6*num_triangles, 3), np.int32)
+    for tri_count, t_nodes in enumerate(mesh.polygons):
+        centroid = num_nodes+num_edges+tri_count
+        for node in t_nodes:
+            node_transform[centroid, node] = 1.0/3.0
+
+        for node_count in range(3):
+            node = t_nodes[node_count]
+            next_node = t_nodes[(node_count+1) % 3]
+            midpoint = edge_numbers[frozenset((node, next_node))]
+            polygons[6*tri_count+2*node_count] = (node, midpoint, centroid)
+            polygons[6*tri_count+2*node_count+1] = (midpoint, next_node,
+                                                    centroid)
+
+    node_transform = node_transform.tocsr()
+    refined = TriangularSurfaceMesh({'nodes': node_transform.dot(mesh.nodes),
+                                     'triangles': polygons})
+    return refined, node_transform
@@ -19,30 +19,81 @@
 "Fit scalar models to numerically calculated impedance data"
 
 from __future__ import division
+import logging
+
 import numpy as np
-from openmodes.impedance import ImpedanceMatrixLA, EfieImpedanceMatrixLA
+from openmodes.impedance import (ImpedanceMatrixLA, EfieImpedanceMatrixLA,
+                                 PenetrableImpedanceMatrixLA)
 from openmodes.modes import SplitModes
+from openmodes.array import LookupArray, part_ranges
+from openmodes.constants import c
+
+
+def part_delay(part_o, part_s):
+    "The retardation between the centres of two parts"
+    centre_o = np.mean(part_o.nodes, axis=0)
+    centre_s = np.mean(part_s.nodes, axis=0)
+    return np.sqrt(np.sum((centre_o - centre_s)**2))/c
+
+
+def stacked_diagonal(diagonals):
+    "Diagonal matrices stacked along the first axis, given their diagonals"
+    num = diagonals.shape[-1]
+    Z = np.zeros(diagonals.shape + (num,), diagonals.dtype)
+    Z[..., np.arange(num), np.arange(num)] = diagonals
+    return Z
+
+
+def split_self_stacked(s, s_o):
+    """The self impedance of modes split into real and imaginary parts,
+    at several frequencies"""
+    s = s[:, None]
+    num_modes = len(s_o)//2
+    s_r = s_o[:num_modes]
+    s_i = s_o[num_modes:]
+    Z_self = stacked_diagonal(s_r + (s_i**2 - s_r**2)/s)*0.5
+    Z_mutual = stacked_diagonal(s_i - 2*s_r*s_i/s)*0.5
+    return np.concatenate((np.concatenate((Z_self, Z_mutual), axis=2),
+                           np.concatenate((Z_mutual, -Z_self), axis=2)),
+                          axis=1)
 
 
 class ModelMutualWeight(object):
     """A model where mutual terms come from directly weighting the mutual
-    terms of the full impedance matrix"""
+    terms of the full impedance matrix
+
+    Weighting the mutual terms requires the full mutual impedance between
+    parts. If the model is only needed over a line in the complex frequency
+    plane from `s_start` to `s_end`, then the weighted mutual terms are
+    instead calculated at a few anchor frequencies, and interpolated in
+    between. This makes sweeps over many frequencies much faster."""
 
-    def __init__(self, modes):
+    def __init__(self, modes, s_start=None, s_end=None, rel_tol=1e-6,
+                 max_anchors=100):
         """
         Parameters
         ----------
         modes : Modes object
             The modes object from which to create
+        s_start, s_end : complex, optional
+            If specified, the weighted mutual terms are interpolated over the
+            line between these frequencies
+        rel_tol : float, optional
+            The relative error in the interpolated mutual terms
+        max_anchors : integer, optional
+            The maximum number of anchor frequencies for each pair of parts
         """
         self.modes = modes
+        self.s_start = s_start
+        self.s_end = s_end
+        self.rel_tol = rel_tol
+        self.max_anchors = max_anchors
+        self.mutual_interpolation = {}
         self.parts = modes.parts
         self.parent_part = modes.parent_part
         self.macro_container = modes.macro_container
         self.symmetric = modes.operator.reciprocal
         self.impedance_class = ImpedanceMatrixLA
-        self.vl = self.modes.vl
-        self.vr = self.modes.vr
 
     def impedance_self(self, s, part_o, Z_full):
         "Self impedance of one part"
@@ -50,11 +101,19 @@ class ModelMutualWeight(object):
         Z_full.matrices['Z'][part_o, part_o] = np.diag(s_o*(s-s_o)/s)
         # TODO: impedance derivative
 
+    def impedance_self_stacked(self, s, part_o):
+        "Self impedance of one part at several frequencies"
+        s_o = self.modes.s[0, part_o]
+        return stacked_diagonal(s_o*(s[:, None]-s_o)/s[:, None])
+
     def impedance_mutual(self, s, part_o, part_s, Z_full):
         "Impedance between two parts, by weighting matrix"
-        vl = self.vl[:, part_o, :, part_o]
-        vr = self.vr[:, part_s, :, part_s]
-        z_weighted = self.modes.operator.impedance(s, part_o, part_s).weight(vr, vl)
+        if self.s_start is None:
+            vl = self.modes.vl_blocks[part_o]
+            vr = self.modes.vr_blocks[part_s]
+            z_weighted = self.modes.operator.impedance(s, part_o, part_s).weight(vr, vl)
+        else:
+            z_weighted = self.interpolated_mutual(s, part_o, part_s)
 
         # If the model has the same impedance class as the full matrix,
         # then store all sub-matrices. Otherwise just get the combined value.
@@ -63,6 +122,63 @@ class ModelMutualWeight(object):
         except KeyError:
             Z_full.matrices['Z'][part_o, part_s] = z_weighted.val().simple_view()
 
+    def mutual_stacked(self, s, part_o, part_s):
+        "Impedance between two parts at several frequencies"
+        if self.s_start is None:
+            vl = self.modes.vl_blocks[part_o]
+            vr = self.modes.vr_blocks[part_s]
+            z_weighted = [self.modes.operator.impedance(s_n, part_o,
+                                                        part_s).weight(vr, vl)
+                          for s_n in s]
+            anchor_Z = z_weighted[0]
+            matrices = {name: np.array([z.matrices[name] for z in z_weighted])
+                        for name in anchor_Z.matrices}
+        else:
+            interpolation, anchor_Z = self.mutual_interpolator(part_o, part_s)
+            matrices = interpolation(s)[0]
+        return anchor_Z.val_stacked(s, matrices)
+
+    def mutual_interpolator(self, part_o, part_s):
+        """The interpolation of the weighted impedance between two parts, and
+        the weighted impedance at the first anchor. The anchors are
+        calculated the first time each pair of parts is used."""
+        try:
+            return self.mutual_interpolation[part_o, part_s]
+        except KeyError:
+            vl = self.modes.vl_blocks[part_o]
+            vr = self.modes.vr_blocks[part_s]
+            anchors = []
+
+            def weighted_impedance(s):
+                Z = self.modes.operator.impedance(s, part_o, part_s,
+                                                  frequency_derivatives=True)
+                Z = Z.weight(vr, vl)
+                if not anchors:
+                    anchors.append(Z)
+                return Z.matrices, Z.der
+
+            logging.info("Interpolating weighted impedance between parts "
+                         "%s and %s" % (part_o.id, part_s.id))
+            interpolation = HermiteInterpolation(weighted_impedance,
+                                                 self.s_start, self.s_end,
+                                                 part_delay(part_o, part_s),
+                                                 self.rel_tol,
+                                                 self.max_anchors)
+            self.mutual_interpolation[part_o, part_s] = (interpolation,
+                                                         anchors[0])
+            return interpolation, anchors[0]
+
+    def interpolated_mutual(self, s, part_o, part_s):
+        """The weighted impedance between two parts, interpolated from its
+        values at anchor frequencies"""
+        interpolation, anchor_Z = self.mutual_interpolator(part_o, part_s)
+        values, derivatives = interpolation(s)
+        metadata = dict(anchor_Z.md)
+        metadata['s'] = s
+        return anchor_Z.__class__(part_o, part_s, anchor_Z.basis_container,
+                                  ('modes',), ('modes',), metadata, values,
+                                  derivatives)
+
     def impedance(self, s):
         """Impedance matrix
 
@@ -89,13 +205,73 @@ class ModelMutualWeight(object):
                     self.impedance_mutual(s, part_o, part_s, Z)
         return Z
 
+    def impedance_stacked(self, s):
+        """The value of the impedance matrix at several frequencies.
+
+        This avoids creating impedance matrix objects at each frequency, so
+        it is much faster for sweeping over many frequencies, particularly
+        when the mutual terms are interpolated.
+
+        Parameters
+        ----------
+        s : array of complex
+            The frequencies at which to calculate the impedance
+
+        Returns
+        -------
+        Z : ndarray (n_freq, n_modes, n_modes)
+            The impedance matrix at each frequency
+        """
+        s = np.atleast_1d(np.asarray(s, dtype=np.complex128))
+        ranges = part_ranges(self.parent_part, self.macro_container)
+        num_modes = ranges[self.parent_part].stop
+        Z = np.empty((len(s), num_modes, num_modes), np.complex128)
+
+        for count_o, part_o in enumerate(self.parts):
+            range_o = ranges[part_o]
+            for count_s, part_s in enumerate(self.parts):
+                range_s = ranges[part_s]
+                if count_o == count_s:
+                    Z[:, range_o, range_o] = self.impedance_self_stacked(s, part_o)
+                elif self.symmetric and (count_o > count_s):
+                    # account for symmetry of operator
+                    Z[:, range_o, range_s] = Z[:, range_s, range_o].transpose(0, 2, 1)
+                else:
+                    Z[:, range_o, range_s] = self.mutual_stacked(s, part_o, part_s)
+        return Z
+
+    def solve_stacked(self, s, V):
+        """Solve the model at several frequencies
+
+        Parameters
+        ----------
+        s : array of complex
+            The frequencies at which to solve
+        V : ndarray
+            The source, projected onto the modes. Its shape should be
+            (n_freq, n_modes), or (n_freq, n_modes, n_sources) to solve for
+            several sources at once. A source of shape (n_modes) is used at
+            all frequencies.
+
+        Returns
+        -------
+        I : ndarray
+            The modal currents, with the same shape as the broadcast source
+        """
+        Z = self.impedance_stacked(s)
+        V = np.asarray(V)
+        if V.ndim < 3:
+            V = np.broadcast_to(V, Z.shape[:2])
+            return np.linalg.solve(Z, V[..., None])[..., 0]
+        return np.linalg.solve(Z, V)
+
 
 class EfieModelMutualWeight(ModelMutualWeight):
     """A model where mutual terms come from directly weighting the mutual
     terms of the full impedance matrix"""
 
-    def __init__(self, modes):
-        ModelMutualWeight.__init__(self, modes)
+    def __init__(self, modes, **kwargs):
+        ModelMutualWeight.__init__(self, modes, **kwargs)
         self.impedance_class = EfieImpedanceMatrixLA
 
     def impedance_self(self, s, part_o, Z_full):
@@ -108,10 +284,10 @@ class EfieModelMutualWeight(ModelMutualWeight):
 
 class ModelSplit(ModelMutualWeight):
     "A model of modes which have been split into real and imaginary parts"
-    def __init__(self, modes):
+    def __init__(self, modes, **kwargs):
         if not isinstance(modes, SplitModes):
             modes = modes.split_real_imag()
-        super(ModelSplit, self).__init__(modes)
+        super(ModelSplit, self).__init__(modes, **kwargs)
 
     def impedance_self(self, s, part_o, Z_full):
         "Self impedance of one part"
@@ -124,13 +300,17 @@ class ModelSplit(ModelMutualWeight):
         Z_full.matrices['Z'][part_o, part_o] = np.vstack((np.hstack((Z_self, Z_mutual)),
                                                           np.hstack((Z_mutual, -Z_self))))
 
+    def impedance_self_stacked(self, s, part_o):
+        "Self impedance of one part at several frequencies"
+        return split_self_stacked(s, self.modes.s[0, part_o])
+
 
 class EfieModelSplit(EfieModelMutualWeight):
     "A model of modes which have been split into real and imaginary parts"
-    def __init__(self, modes):
+    def __init__(self, modes, **kwargs):
         if not isinstance(modes, SplitModes):
             modes = modes.split_real_imag()
-        super(EfieModelSplit, self).__init__(modes)
+        super(EfieModelSplit, self).__init__(modes, **kwargs)
 
     def impedance_self(self, s, part_o, Z_full):
         "Self impedance of one part"
@@ -143,3 +323,286 @@ class EfieModelSplit(EfieModelMutualWeight):
         Z_full.matrices['S'][part_o, part_o] = np.vstack((np.hstack((Z_self, Z_mutual)),
                                                           np.hstack((Z_mutual, -Z_self))))
         Z_full.matrices['L'][part_o, part_o] = 0.0
+
+    def impedance_self_stacked(self, s, part_o):
+        "Self impedance of one part at several frequencies"
+        return split_self_stacked(s, self.modes.s[0, part_o])
+
+
+class HermiteInterpolation(object):
+    """Interpolation of a set of matrices along a straight line in the
+    complex frequency plane, between a sparse set of anchor frequencies
+
+    The matrices and their frequency derivatives are calculated at the
+    anchor frequencies, and cubic Hermite interpolation is used between them.
+    A known retardation is factored out before interpolation, so that the
+    remaining variation is smooth. Anchors are inserted adaptively, by
+    comparing the interpolated matrices at the centre of each interval with
+    their exact values.
+    """
+
+    def __init__(self, func, s_start, s_end, delay=0.0, rel_tol=1e-6,
+                 max_anchors=100, num_initial=3):
+        """
+        Parameters
+        ----------
+        func : function
+            Given a frequency s, returns dictionaries of the matrices and
+            of their frequency derivatives
+        s_start, s_end : complex
+            The ends of the straight line in the complex frequency plane
+            over which the matrices will be interpolated
+        delay : ndarray or float, optional
+            The retardation of each element of the matrices
+        rel_tol : float, optional
+            The relative error in the interpolated matrices
+        max_anchors : integer, optional
+            The maximum number of anchor frequencies to use
+        num_initial : integer, optional
+            The number of equally spaced anchors to start with
+        """
+        self.func = func
+        self.s_start = s_start
+        self.s_end = s_end
+        self.delay = delay
+        self.num_evaluations = 0
+
+        self.anchors = []
+        self.values = []
+        self.derivatives = []
+        for t in np.linspace(0, 1, max(num_initial, 2)):
+            self._add_anchor(t)
+
+        # Check the centre of each interval, and split it if the error is too
+        # large. The point checked is always kept as an anchor.
+        intervals = list(zip(self.anchors[:-1], self.anchors[1:]))
+        while intervals:
+            t_a, t_b = intervals.pop()
+            if len(self.anchors) >= max_anchors:
+                logging.warn("Maximum number of anchors reached, "
+                             "interpolation may be inaccurate")
+                break
+            t_m = 0.5*(t_a + t_b)
+            predicted = self._hermite(t_m, self.anchors.index(t_a))[0]
+            exact = self.values[self._add_anchor(t_m)]
+
+            error = max(np.max(np.abs(predicted[name] - exact[name])) /
+                        np.max(np.abs(exact[name])) for name in exact)
+            if error > rel_tol:
+                intervals.extend([(t_a, t_m), (t_m, t_b)])
+
+        logging.info("Interpolated with %d anchors" % len(self.anchors))
+
+    def _s(self, t):
+        "The frequency at some position along the line"
+        return self.s_start + t*(self.s_end - self.s_start)
+
+    def _add_anchor(self, t):
+        """Calculate the matrices at a new anchor frequency, returning the
+        index of the new anchor"""
+        s = self._s(t)
+        exact_values, exact_derivatives = self.func(s)
+        self.num_evaluations += 1
+
+        # remove the retardation
+        phase = np.exp(s*self.delay)
+        values = {}
+        derivatives = {}
+        for name, mat in exact_values.items():
+            values[name] = mat*phase
+            derivatives[name] = (exact_derivatives[name] +
+                                 self.delay*mat)*phase
+
+        index = np.searchsorted(self.anchors, t)
+        self.anchors.insert(index, t)
+        self.values.insert(index, values)
+        self.derivatives.insert(index, derivatives)
+        return index
+
+    def _hermite(self, t, index):
+        """Interpolate the matrices and their derivatives between the anchor
+        `index` and the following one, without the retardation. If `t` is an
+        array, then the results are stacked along the first axis."""
+        t_a = self.anchors[index]
+        t_b = self.anchors[index+1]
+        ds = self._s(t_b) - self._s(t_a)
+        u = (t - t_a)/(t_b - t_a)
+
+        # Hermite basis functions and their derivatives with respect to u
+        h = (2*u**3 - 3*u**2 + 1, u**3 - 2*u**2 + u, -2*u**3 + 3*u**2,
+             u**3 - u**2)
+        dh = (6*u**2 - 6*u, 3*u**2 - 4*u + 1, -6*u**2 + 6*u, 3*u**2 - 2*u)
+
+        values = {}
+        derivatives = {}
+        for name, value_a in self.values[index].items():
+            # broadcast the coefficients over the matrix dimensions
+            shape = np.shape(t) + (1,)*value_a.ndim
+            terms = (value_a, ds*self.derivatives[index][name],
+                     self.values[index+1][name],
+                     ds*self.derivatives[index+1][name])
+            values[name] = sum(np.reshape(h_n, shape)*term
+                               for h_n, term in zip(h, terms))
+            derivatives[name] = sum(np.reshape(dh_n, shape)*term
+                                    for dh_n, term in zip(dh, terms))/ds
+        return values, derivatives
+
+    def _interpolate(self, t):
+        """Interpolate the matrices and their derivatives, without the
+        retardation. If `t` is an array, then the results are stacked along
+        the first axis."""
+        t = np.asarray(t)
+        index = np.clip(np.searchsorted(self.anchors, t) - 1, 0,
+                        len(self.anchors) - 2)
+        if t.ndim == 0:
+            return self._hermite(t, index)
+
+        # Interpolate all points within each interval together, directly
+        # into the stacked results
+        values = {}
+        derivatives = {}
+        for interval in np.unique(index):
+            points = index == interval
+            values_n, derivatives_n = self._hermite(t[points], interval)
+            for name, value in values_n.items():
+                if name not in values:
+                    values[name] = np.empty(t.shape+value.shape[1:],
+                                            value.dtype)
+                    derivatives[name] = np.empty_like(values[name])
+                values[name][points] = value
+                derivatives[name][points] = derivatives_n[name]
+        return values, derivatives
+
+    def __call__(self, s):
+        """The interpolated matrices and their frequency derivatives
+
+        Parameters
+        ----------
+        s : complex or array
+            The frequency, which must lie on the line between `s_start` and
+            `s_end`. If an array of frequencies is given, then the matrices
+            at each frequency are stacked along the first axis.
+        """
+        s = np.asarray(s)
+        t = (s - self.s_start)/(self.s_end - self.s_start)
+        if (np.any(abs(t.imag) > 1e-10) or np.any(t.real < -1e-10) or
+                np.any(t.real > 1 + 1e-10)):
+            raise ValueError("Frequency %s is outside the interpolated range"
+                             % s)
+        t = np.clip(t.real, 0.0, 1.0)
+
+        values, derivatives = self._interpolate(t)
+
+        # restore the retardation
+        matrix_dims = next(iter(values.values())).ndim - s.ndim
+        phase = np.exp(-s.reshape(s.shape + (1,)*matrix_dims)*self.delay)
+        for name in values:
+            derivatives[name] = (derivatives[name] -
+                                 self.delay*values[name])*phase
+            values[name] = values[name]*phase
+        return values, derivatives
+
+
+class ModelHermiteInterpolation(object):
+    """A model of the full impedance matrix over a range of frequencies, found
+    by interpolating the impedance between a sparse set of anchor frequencies
+
+    The matrices making up the impedance (e.g. `L` and `S` for the EFIE) and
+    their frequency derivatives are calculated at the anchor frequencies, and
+    cubic Hermite interpolation is used between them. The retardation
+    between the centres of different parts is factored out before
+    interpolation, so that the remaining variation is smooth. Anchors are
+    inserted adaptively, by comparing the interpolated matrices at the centre
+    of each interval with their exact values.
+    """
+
+    def __init__(self, operator, part, s_start, s_end, rel_tol=1e-6,
+                 max_anchors=100, num_initial=3):
+        """
+        Parameters
+        ----------
+        operator : Operator
+            The operator used to calculate the impedance, which must provide
+            frequency derivatives
+        part : Part
+            The part for which the impedance is modelled
+        s_start, s_end : complex
+            The ends of the straight line in the complex frequency plane
+            over which the impedance will be modelled
+        rel_tol : float, optional
+            The relative error in the interpolated matrices
+        max_anchors : integer, optional
+            The maximum number of anchor frequencies to use
+        num_initial : integer, optional
+            The number of equally spaced anchors to start with
+        """
+        if not operator.frequency_derivatives:
+            raise ValueError("Interpolation requires an operator with "
+                             "frequency derivatives")
+
+        self.operator = operator
+        self.part = part
+        self.s_start = s_start
+        self.s_end = s_end
+        self.rel_tol = rel_tol
+
+        self.interpolation = HermiteInterpolation(self._exact_impedance,
+                                                  s_start, s_end,
+                                                  self._part_delays(),
+                                                  rel_tol, max_anchors,
+                                                  num_initial)
+
+    @property
+    def num_assemblies(self):
+        "The number of times the full impedance matrix was calculated"
+        return self.interpolation.num_evaluations
+
+    def _part_delays(self):
+        """The retardation between the centres of each pair of parts, with
+        the same layout as the impedance matrices"""
+        container = self.operator.basis_container
+        delay = LookupArray(((self.part, container), (self.part, container)),
+                            dtype=np.float64)
+        delay[:] = 0.0
+        for part_o in self.part.iter_single():
+            for part_s in self.part.iter_single():
+                delay[part_o, part_s] = part_delay(part_o, part_s)
+        return delay.simple_view()
+
+    def _exact_impedance(self, s):
+        "Calculate the impedance matrices at an anchor frequency"
+        Z = self.operator.impedance(s, self.part, self.part,
+                                    frequency_derivatives=True)
+
+        if isinstance(Z, PenetrableImpedanceMatrixLA):
+            raise NotImplementedError("Interpolation of penetrable impedance "
+                                      "matrices")
+        self.metadata = Z.md
+        self.impedance_class = Z.__class__
+
+        values = {name: Z.matrices[name].simple_view()
+                  for name in Z.matrix_names}
+        derivatives = {name: Z.der[name].simple_view()
+                       for name in Z.matrix_names}
+        return values, derivatives
+
+    def impedance(self, s):
+        """Impedance matrix
+
+        Parameters
+        ----------
+        s : complex
+            Frequency at which to calculate impedance, which must lie on the
+            line between `s_start` and `s_end`
+        """
+        values, derivatives = self.interpolation(s)
+
+        container = self.operator.basis_container
+        Z = self.impedance_class(self.part, self.part, container,
+                                 self.operator.sources, self.operator.unknowns)
+        Z.md.update(self.metadata)
+        Z.md['s'] = s
+        for name in values:
+            Z.matrices[name].simple_view()[:] = values[name]
+            Z.der[name].simple_view()[:] = derivatives[name]
+        return Z
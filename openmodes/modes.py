@@ -22,7 +22,7 @@ from __future__ import division
 
 import numpy as np
 
-from openmodes.array import LookupArray
+from openmodes.array import LookupArray, part_ranges
 from openmodes.basis import BasisContainer, MacroBasis
 from openmodes.helpers import cached_property
 
@@ -35,7 +35,14 @@ def is_real_pole(s):
 
 class AbstractModes(object):
     """A class for holding a set of modes, enabling a matrix or vector to be
-    easily projected onto them"""
+    easily projected onto them
+
+    The modes of each part are only non-zero on that part's own basis
+    functions, so the eigenvectors are stored as one block per part. The
+    methods `project`, `expand` and `project_matrix` operate on these blocks
+    directly. The dense eigenvectors `vr` and `vl` are only created if they
+    are requested.
+    """
 
     def __init__(self, parent_part, parts, modes_of_parts, operator,
                  orig_container, macro_container=None):
@@ -83,9 +90,117 @@ class AbstractModes(object):
             res[:, part] = self.modes_of_parts[part.unique_id]['s']
         return res
 
+    @cached_property
+    def vr_blocks(self):
+        "The right eigenvectors of each part, as a dictionary of LookupArrays"
+        return {part: self[part].vr for part in self.parts}
+
+    @cached_property
+    def vl_blocks(self):
+        "The left eigenvectors of each part, as a dictionary of LookupArrays"
+        return {part: self[part].vl for part in self.parts}
+
+    @cached_property
+    def block_indices(self):
+        """For each part, the indices of its basis functions within the simple
+        view of the unknowns, and the slice of its modes"""
+        basis_ranges = part_ranges(self.parent_part, self.orig_container)
+        mode_ranges = part_ranges(self.parent_part, self.macro_container)
+        num_basis = basis_ranges[self.parent_part].stop
+
+        indices = {}
+        for part in self.parts:
+            # the quantities are the slowest varying index in the simple view
+            rows = np.arange(basis_ranges[part].start, basis_ranges[part].stop)
+            rows = np.hstack([rows+count*num_basis for count
+                              in range(len(self.operator.unknowns))])
+            indices[part] = (rows, mode_ranges[part])
+        return indices
+
+    def project(self, vec):
+        """Project a source vector onto the left eigenvectors
+
+        Parameters
+        ----------
+        vec : LookupArray or ndarray
+            The source vector. If it has two dimensions, each column is
+            projected separately
+
+        Returns
+        -------
+        vec_modes : LookupArray
+            The source vector in the basis of the modes
+        """
+        if isinstance(vec, LookupArray):
+            vec = vec.simple_view()
+
+        lookup = (('modes',), (self.parent_part, self.macro_container))
+        if len(vec.shape) > 1:
+            lookup = lookup+(vec.shape[1],)
+
+        res = LookupArray(lookup, dtype=np.complex128)
+        res_simp = res.simple_view()
+        for part, (rows, modes) in self.block_indices.items():
+            res_simp[modes] = self.vl_blocks[part].simple_view().dot(vec[rows])
+        return res
+
+    def expand(self, vec_modes):
+        """Expand a solution in the basis of the modes into the original basis
+        functions, using the right eigenvectors
+
+        Parameters
+        ----------
+        vec_modes : LookupArray or ndarray
+            The coefficient of each mode. If it has two dimensions, each
+            column is expanded separately
+
+        Returns
+        -------
+        vec : LookupArray
+            The solution in terms of the original basis functions
+        """
+        if isinstance(vec_modes, LookupArray):
+            vec_modes = vec_modes.simple_view()
+
+        lookup = (self.operator.unknowns, (self.parent_part,
+                                           self.orig_container))
+        if len(vec_modes.shape) > 1:
+            lookup = lookup+(vec_modes.shape[1],)
+
+        res = LookupArray(lookup, dtype=np.complex128)
+        res_simp = res.simple_view()
+        res_simp[:] = 0.0
+        for part, (rows, modes) in self.block_indices.items():
+            res_simp[rows] = self.vr_blocks[part].simple_view().dot(vec_modes[modes])
+        return res
+
+    def project_matrix(self, Z):
+        """Project a matrix onto the left and right eigenvectors
+
+        Parameters
+        ----------
+        Z : ndarray
+            The simple view of the matrix
+
+        Returns
+        -------
+        Z_modes : ndarray
+            The matrix in the basis of the modes
+        """
+        num_modes = len(self)
+        res = np.empty((num_modes, num_modes), np.complex128)
+
+        for part_o, (rows_o, modes_o) in self.block_indices.items():
+            Z_left = self.vl_blocks[part_o].simple_view().dot(Z[rows_o])
+            for part_s, (rows_s, modes_s) in self.block_indices.items():
+                res[modes_o, modes_s] = Z_left[:, rows_s].dot(
+                                    self.vr_blocks[part_s].simple_view())
+        return res
+
     @cached_property
     def vr(self):
-        "The right eigenvectors"
+        """The right eigenvectors, as a dense array including the zero blocks
+        between different parts"""
 
         res = LookupArray((self.operator.unknowns, (self.parent_part, self.orig_container),
                           ('modes',), (self.parent_part, self.macro_container)),
@@ -98,7 +213,8 @@ class AbstractModes(object):
 
     @cached_property
     def vl(self):
-        "The left eigenvectors"
+        """The left eigenvectors, as a dense array including the zero blocks
+        between different parts"""
         res = LookupArray((('modes',), (self.parent_part, self.macro_container),
                           self.operator.sources, (self.parent_part, self.orig_container)),
                          dtype=np.complex128)
@@ -24,6 +24,64 @@ from scipy.special import factorial
 
 from openmodes.constants import eta_0
 
+# The approximate number of elements in the temporary arrays of each point,
+# order and solution when decomposing many solutions at once
+CHUNK_ELEMENTS = 2**22
+
+
+def associated_legendre(max_l, theta):
+    """Calculate the associated Legendre functions of cos(theta) and their
+    derivatives with respect to theta, for many angles at once
+
+    The functions are found by recurrence over l, with all points and all
+    m calculated together. They include the Condon-Shortley phase, as for
+    `scipy.special.lpmn`.
+
+    Parameters
+    ----------
+    max_l : integer
+        The maximum order of the functions
+    theta : ndarray (num_points)
+        The polar angles
+
+    Returns
+    -------
+    P_lm : ndarray (num_points, max_l+1, max_l+1)
+        The associated Legendre functions, with indices l, m. Values with
+        m > l are zero.
+    tau_lm : ndarray (num_points, max_l+1, max_l+1)
+        The derivatives of P_lm(cos(theta)) with respect to theta
+    """
+    num_l = max_l + 1
+    ct = np.cos(theta)
+    st = np.sin(theta)
+
+    P_lm = np.zeros((len(theta), num_l, num_l))
+
+    # The diagonal terms P_mm = (-1)^m (2m-1)!! sin(theta)^m
+    P_lm[:, 0, 0] = 1.0
+    for m in range(1, num_l):
+        P_lm[:, m, m] = -(2*m-1)*st*P_lm[:, m-1, m-1]
+
+    # Recurrence over l, for all m < l together
+    for l in range(1, num_l):
+        m = np.arange(l)
+        if l == 1:
+            P_lm[:, 1, 0] = ct
+            continue
+        P_lm[:, l, :l] = ((2*l-1)*ct[:, None]*P_lm[:, l-1, :l] -
+                          (l+m-1)*P_lm[:, l-2, :l])/(l-m)
+
+    # From http://dlmf.nist.gov/14.10, eq 14.10.5, where P_(l-1),l = 0
+    l = np.arange(num_l)[:, None]
+    m = np.arange(num_l)[None, :]
+    P_prev = np.zeros_like(P_lm)
+    P_prev[:, 1:] = P_lm[:, :-1]
+    tau_lm = (l*ct[:, None, None]*P_lm -
+              (l+m)*P_prev)/st[:, None, None]
+
+    return P_lm, tau_lm
+
 
 def multipole_fixed(max_l, points):
     """Calculate all frequency-independent quantities for the multipole
@@ -53,29 +111,20 @@ def multipole_fixed(max_l, points):
 
     exp_imp = np.exp(-1j*m[None, :, :]*phi[:, None, None])
 
-    P_lm = np.zeros((len(ct), len(l), m.shape[1]))
-    dP_lm = np.zeros_like(P_lm)
-
-    for point_count, ct_n in enumerate(ct):
-
-        # associated Legendre function and its derivative
-        P_lmp, dP_lmp = scipy.special.lpmn(max_l, max_l, ct_n)
-        P_lmp = P_lmp.T
-        dP_lmp = dP_lmp.T
+    # associated Legendre function and its theta derivative
+    P_lmp, tau_lmp = associated_legendre(max_l, theta)
 
-        # Comes from http://dlmf.nist.gov/14.9, eq 14.9.13
-        # Calculate negative values of m from positive
-        # Does some relation apply to derivatives??
-        P_neg = (-1)**m_pos*factorial(l-m_pos)/factorial(l+m_pos)
-        P_lmn = P_neg*P_lmp
-        dP_lmn = P_neg*dP_lmp
+    # Comes from http://dlmf.nist.gov/14.9, eq 14.9.13
+    # Calculate negative values of m from positive, where the factor is
+    # zero for the invalid values m > l
+    P_neg = (-1)**m_pos*factorial(l-m_pos)/factorial(l+m_pos)
+    P_lmn = P_neg*P_lmp
+    tau_lmn = P_neg*tau_lmp
 
-        # combine positive and negative P_lmn
-        P_lm[point_count] = np.hstack((P_lmp,  P_lmn[:, :0:-1]))
-        dP_lm[point_count] = np.hstack((dP_lmp, dP_lmn[:, :0:-1]))
+    # combine positive and negative P_lmn
+    P_lm = np.concatenate((P_lmp, P_lmn[:, :, :0:-1]), axis=2)
+    tau_lm = np.concatenate((tau_lmp, tau_lmn[:, :, :0:-1]), axis=2)
 
-    # theta derivative of P_lm(cos\theta)
-    tau_lm = -st[:, None, None]*dP_lm
     pi_lm = P_lm*m/st[:, None, None]
 
     return (r, theta, phi, r_hat, theta_hat, phi_hat, P_lm, exp_imp,
@@ -94,31 +143,39 @@ def spherical_multipoles(max_l, k, points, current, current_M, eta=eta_0,
     Formulas have been modified to incorporate the factor of sqrt(2l+1)
     into the multipole coefficients.
 
+    Several current distributions can be decomposed at once, each with its
+    own wave-number, in which case the sums over the points are performed as
+    matrix products over the whole batch.
+
     Parameters
     ----------
     max_l : integer
         The maximum order of multipole to consider
-    k : complex
-        The wave-number in the background medium
+    k : complex or array (num_batch)
+        The wave-number in the background medium, for each current
+        distribution
     points : array
         The array of points at which to integrate
-    current : array
+    current : array (num_points, 3) or (num_points, 3, num_batch)
         The current vector calculated at each point. Any weights from
         the integration rule should already be applied.
-    current_M : array
+    current_M : array (num_points, 3) or (num_points, 3, num_batch)
         The equivalent magnetic current for surface equivalent description of
         dielectrics
+    eta : complex or array (num_batch), optional
+        The impedance of the background medium
 
     Returns
     -------
     a_e : (max_l+1 x 2*max_l+1) array
-        The electric multipole coefficients of order l, m
+        The electric multipole coefficients of order l, m. If a batch of
+        currents was given, there is an additional last dimension over the
+        batch.
     a_m : (max_l+1 x 2*max_l+1) array
         The magnetic multipole coefficients of order l, m
     """
 
     num_l = max_l + 1
-    num_points = len(points)
 
     l = np.arange(num_l)[:, None]
     m_pos = np.arange(num_l)[None, :]
@@ -132,53 +189,79 @@ def spherical_multipoles(max_l, k, points, current, current_M, eta=eta_0,
         (r, theta, phi, r_hat, theta_hat, phi_hat, P_lm, exp_imp, tau_lm,
          pi_lm) = multipole_fixed(max_l, points)
 
-    jl = np.empty((num_points, num_l, 1))
+    # all quantities have a last dimension over the batch
+    batch = current.ndim == 3
+    if not batch:
+        current = current[:, :, None]
+        current_M = current_M[:, :, None]
+    num_batch = current.shape[2]
+    k = np.broadcast_to(k, (num_batch,))
+    eta = np.broadcast_to(eta, (num_batch,))
+
+    # spherical Bessel functions of all points, orders and wave-numbers,
+    # with dimensions num points, l, batch
+    kr = r[:, None, None]*k[None, None, :]
+    jl = scipy.special.spherical_jn(l[None, :, :], kr)
+
+    # Calculate derivative explicitly using the same formula as scipy
+    # https://docs.scipy.org/doc/scipy/reference/generated/scipy.special.spherical_jn.html
     djl = np.empty_like(jl)
-
-    # spherical Bessel functions must be calculated per point
-    for n in range(num_points):
-        jl[n, :, :] = scipy.special.spherical_jn(l, k*r[n])
-        # Calculate derivative explicitly using the same formula as scipy
-        # https://docs.scipy.org/doc/scipy/reference/generated/scipy.special.spherical_jn.html
-        djl[n, 0, 0] = -jl[n, 1, 0]
-        djl[n, 1:, 0] = jl[n, :-1, 0] - (l[1:, 0]+1)/(k*r[n])*jl[n, 1:, 0]
-        
+    djl[:, 0] = -jl[:, 1]
+    djl[:, 1:] = jl[:, :-1] - (l[None, 1:]+1)/kr*jl[:, 1:]
 
     ll = l[None, 1:]
     # Riccati Bessel function plus its second derivative
-    ric_plus_second = np.zeros((num_points, num_l, 1))
-    ric_plus_second[:, 1:] = ll*(ll+1)*jl[:, 1:]/(k*r[:, None, None])
+    ric_plus_second = np.zeros_like(jl)
+    ric_plus_second[:, 1:] = ll*(ll+1)*jl[:, 1:]/kr
 
     # First derivative, divided by kr
-    ric_der = np.zeros_like(ric_plus_second)
-    ric_der[:, 1:] = jl[:, 1:]/(k*r[:, None, None]) + djl[:, 1:]
-
-    # components of current
-    J_r = np.sum(r_hat*current, axis=1)[:, None, None]
-    J_theta = np.sum(theta_hat*current, axis=1)[:, None, None]
-    J_phi = np.sum(phi_hat*current, axis=1)[:, None, None]
-    M_r = np.sum(r_hat*current_M, axis=1)[:, None, None]
-    M_theta = np.sum(theta_hat*current_M, axis=1)[:, None, None]
-    M_phi = np.sum(phi_hat*current_M, axis=1)[:, None, None]
+    ric_der = np.zeros_like(jl)
+    ric_der[:, 1:] = jl[:, 1:]/kr + djl[:, 1:]
+
+    # components of current, with dimensions num points, 1, batch
+    def component(unit, J):
+        return np.einsum('px,pxb->pb', unit, J)[:, None, :]
+
+    J_r = component(r_hat, current)
+    J_theta = component(theta_hat, current)
+    J_phi = component(phi_hat, current)
+    M_r = component(r_hat, current_M)
+    M_theta = component(theta_hat, current_M)
+    M_phi = component(phi_hat, current_M)
+
+    # Sum over points of the angular terms (num points, l, m) times the
+    # radial terms (num points, l, batch), giving l, m, batch
+    def contract(angular, radial):
+        return np.matmul(np.ascontiguousarray(angular.transpose(1, 2, 0)),
+                         np.ascontiguousarray(radial.transpose(1, 0, 2)))
+
+    A_P = exp_imp*P_lm
+    A_tau = exp_imp*tau_lm
+    A_pi = 1j*exp_imp*pi_lm
 
     # indices l, m.
     # Note that for m, negative indices are used for negative m,
     # and values with |m| > l should be ignored
-    a_e = np.sum(exp_imp*(ric_plus_second*P_lm*J_r +
-                 ric_der*(tau_lm*J_theta - 1j*pi_lm*J_phi) +
-                 jl*(1j*pi_lm*M_theta + tau_lm*M_phi)), axis=0)
-    a_m = np.sum(exp_imp*(jl*(1j*pi_lm*J_theta + tau_lm*J_phi) +
-                 ric_plus_second*P_lm*M_r +
-                 ric_der*(tau_lm*M_theta - 1j*pi_lm*M_phi)), axis=0)
+    a_e = (contract(A_P, ric_plus_second*J_r) +
+           contract(A_tau, ric_der*J_theta + jl*M_phi) +
+           contract(A_pi, jl*M_theta - ric_der*J_phi))
+    a_m = (contract(A_P, ric_plus_second*M_r) +
+           contract(A_tau, jl*J_phi + ric_der*M_theta) +
+           contract(A_pi, jl*J_theta - ric_der*M_phi))
 
     # Ignore divide by zero and resulting NaN, which will occur for invalid
     # combinations of l, m
     with np.errstate(invalid='ignore', divide='ignore'):
-        common_factor = (np.sqrt(eta)*k**2/(2*np.pi) *
-                         np.sqrt(factorial(l-m)/factorial(l+m)) /
+        common_factor = ((1j)**(l-1)*np.sqrt(factorial(l-m)/factorial(l+m)) /
                          np.sqrt(l*(l+1))*np.sqrt(2*l+1))
-        a_e *= (1j)**(l-1)*common_factor
-        a_m *= (1j)**(l-1)*common_factor
+        common_factor = (common_factor[:, :, None] *
+                         (np.sqrt(eta)*k**2/(2*np.pi))[None, None, :])
+        a_e *= common_factor
+        a_m *= common_factor
+
+    if not batch:
+        a_e = a_e[:, :, 0]
+        a_m = a_m[:, :, 0]
 
     return a_e, a_m
 
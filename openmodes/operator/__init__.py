@@ -20,4 +20,4 @@
 Operator classes
 """
 
-from .pec import EfieOperator, MfieOperator, CfieOperator
+from .pec import EfieOperator, MfieOperator, CfieOperator, EfieSeriesOperator
@@ -21,15 +21,21 @@
 import numpy as np
 import logging
 
-from openmodes.eig import (eig_linearised, eig_newton, poles_cauchy,
-                           ConvergenceError)
+from openmodes.eig import (eig_linearised, eig_newton, eig_newton_block,
+                           poles_cauchy, ConvergenceError)
 from openmodes.array import LookupArray
+from openmodes.helpers import equivalence
 
 
 class Operator(object):
     "A base class for operator equations"
 
-    def impedance(self, s, parent_o, parent_s,  metadata=None):
+    # Whether `impedance` can calculate the second frequency derivatives
+    second_frequency_derivatives = False
+
+    def impedance(self, s, parent_o, parent_s,  metadata=None,
+                  frequency_derivatives=False, second_derivatives=False,
+                  storage=None):
         """Evaluate the self and mutual impedances of all parts in the
         simulation. Return an `ImpedancePart` object which can calculate
         several derived impedance quantities
@@ -40,6 +46,17 @@ class Operator(object):
             Complex frequency at which to calculate impedance (in rad/s)
         parent : Part
             Only this part and its sub-parts will be calculated
+        frequency_derivatives : boolean, optional
+            If True, the frequency derivatives are calculated together with
+            the impedance matrix. Otherwise their calculation is deferred
+            until they are first accessed, which should be avoided as it
+            repeats the calculation of the impedance matrix.
+        second_derivatives : boolean, optional
+            If True, the second derivatives with respect to frequency are also
+            calculated. Only valid if `second_frequency_derivatives` is True.
+        storage : ScratchStorage, optional
+            If specified, the matrices are stored in memory-mapped files
+            created by this object, and are calculated one tile at a time.
 
         Returns
         -------
@@ -51,24 +68,92 @@ class Operator(object):
         metadata = metadata or dict()
         symmetric = self.reciprocal and (parent_o == parent_s)
 
+        if second_derivatives and not self.second_frequency_derivatives:
+            raise NotImplementedError("Operator %s cannot calculate second "
+                                      "derivatives" % type(self).__name__)
+
         Z = self.impedance_class(parent_o, parent_s, self.basis_container,
-                                 self.sources, self.unknowns)
+                                 self.sources, self.unknowns,
+                                 derivatives=(None if frequency_derivatives or
+                                              second_derivatives else False),
+                                 second_derivatives=second_derivatives or None,
+                                 storage=storage)
 
         # set the common metadata
         Z.md['s'] = s
         Z.md['symmetric'] = symmetric
         Z.md['operator'] = self
+        Z.md['position_hash'] = {part: part.position_hash for part in
+                                 set(parent_o.iter_single()) |
+                                 set(parent_s.iter_single())}
         Z.md.update(metadata)
 
+        # For a symmetric matrix, the blocks below the diagonal are only
+        # filled in when the matrix is used
+        unmirrored = []
         for count_o, part_o in enumerate(parent_o.iter_single()):
             for count_s, part_s in enumerate(parent_s.iter_single()):
                 if symmetric and count_s < count_o:
-                    Z[part_o, part_s] = Z[part_s, part_o].T
+                    unmirrored.append((part_o, part_s))
                 else:
                     self.impedance_single_parts(Z, s, part_o, part_s)
+        Z.defer_mirror(unmirrored)
         return Z
 
 
+    def update_impedance(self, Z):
+        """Update an impedance matrix after some of its parts have been moved
+
+        The position of each part when the matrix was calculated is tracked
+        by its `position_hash`. Only the mutual impedance blocks involving
+        parts which have since been translated or rotated are recalculated,
+        as the self impedance of each part is unchanged. If the matrix has
+        already been factorised, the factorisation is not recalculated, but
+        is corrected for the changed rows and columns when solving.
+
+        Parameters
+        ----------
+        Z : ImpedanceMatrixLA
+            The impedance matrix, which is modified in place
+
+        Returns
+        -------
+        moved : list
+            The parts which have been moved since the matrix was calculated
+        """
+        parent_o = Z.part_o
+        parent_s = Z.part_s
+        s = Z.md['s']
+        position_hash = Z.md['position_hash']
+        moved = [part for part, hash_value in position_hash.items()
+                 if part.position_hash != hash_value]
+
+        if len(moved) == 0:
+            return moved
+
+        logging.info("Updating impedance for %d moved parts" % len(moved))
+
+        if parent_o == parent_s:
+            Z.record_update(np.hstack([Z.part_indices(part)[1]
+                                       for part in moved]))
+
+        symmetric = Z.md['symmetric']
+        unmirrored = []
+        for count_o, part_o in enumerate(parent_o.iter_single()):
+            for count_s, part_s in enumerate(parent_s.iter_single()):
+                if part_o == part_s or (part_o not in moved and
+                                        part_s not in moved):
+                    continue
+                if symmetric and count_s < count_o:
+                    unmirrored.append((part_o, part_s))
+                else:
+                    self.impedance_single_parts(Z, s, part_o, part_s)
+        Z.defer_mirror(unmirrored)
+
+        for part in moved:
+            position_hash[part] = part.position_hash
+        return moved
+
     def gram_matrix(self, part):
         """Create a Gram matrix as a LookupArray"""
         G = self.basis_container[part].gram_matrix
@@ -82,7 +167,7 @@ class Operator(object):
 
     def estimate_poles(self, contour, part, threshold=1e-11,
                        previous_result=None, cauchy_integral=True, modes=None,
-                       **kwargs):
+                       linearised_method='dense', **kwargs):
         """Estimate pole location for an operator by Cauchy integration or
         the simpler quasi-static method"""
 
@@ -90,12 +175,18 @@ class Operator(object):
             # Use the simpler quasi-static method (contour will actually
             # just be a starting frequency)
             Z = self.impedance(contour, part, part)
-            estimate_s, estimate_vr = eig_linearised(Z, modes)
+            estimate_s, estimate_vr = eig_linearised(Z, modes,
+                                                     linearised_method)
             result = {'s': estimate_s, 'vr': estimate_vr, 'vl': estimate_vr}
         else:
+            # the inverse is found in place, so the same array can hold the
+            # impedance matrix at each point on the contour
+            workspace = {}
+
             def Z_func(s):
                 Z = self.impedance(s, part, part)
-                return Z.val().simple_view()
+                workspace['val'] = Z.val(out=workspace.get('val'))
+                return workspace['val'].simple_view()
 
             result = poles_cauchy(Z_func, contour, threshold,
                                   previous_result=previous_result, **kwargs)
@@ -103,7 +194,8 @@ class Operator(object):
         return result
 
     def refine_poles(self, estimates, part, rel_tol, max_iter,
-                     iter_wrap = lambda x: x):
+                     iter_wrap = lambda x: x, cluster_tol=None,
+                     second_derivatives=False):
         """Find the poles of the operator applied to a specified part
 
         Parameters
@@ -115,6 +207,14 @@ class Operator(object):
         max_iter : integer
             The maximum number of iterations to use when searching for
             singularities
+        cluster_tol : float, optional
+            If specified, estimated poles whose relative separation is less
+            than this value are refined together as a cluster by block Newton
+            iteration, which prevents them from converging onto the same mode
+        second_derivatives : boolean, optional
+            If True, and the operator can calculate the second frequency
+            derivatives of the impedance, then isolated poles are refined by
+            Halley iteration, which generally requires fewer iterations
 
         Returns
         -------
@@ -131,19 +231,40 @@ class Operator(object):
         refined['vr'] = []
         refined['vl'] = []
 
+        # With exact derivatives, the values from the previous iteration are
+        # not needed, so the same arrays are reused at every iteration
+        workspace = {}
+
+        def evaluate(Z, method):
+            workspace[method] = getattr(Z, method)(out=workspace.get(method))
+            return workspace[method].simple_view()
+
         # Adaptively check if the operator provides frequency derivatives, and
         # if so use them in the Newton iteration to find the poles.
         if self.frequency_derivatives:
             logging.info("Using exact impedance derivatives")
             def Z_func(s):
-                Z = self.impedance(s, part, part)
-                return Z.val().simple_view(), Z.frequency_derivative().simple_view()
+                Z = self.impedance(s, part, part, frequency_derivatives=True)
+                return (evaluate(Z, 'val'),
+                        evaluate(Z, 'frequency_derivative'))
         else:
             logging.info("Using approximate impedance derivatives")
             def Z_func(s):
                 Z = self.impedance(s, part, part)
                 return Z.val().simple_view()
 
+        use_der2 = second_derivatives and self.second_frequency_derivatives
+        if use_der2:
+            logging.info("Using second impedance derivatives")
+            def Z_func_der2(s):
+                Z = self.impedance(s, part, part, second_derivatives=True)
+                return (evaluate(Z, 'val'),
+                        evaluate(Z, 'frequency_derivative'),
+                        evaluate(Z, 'frequency_second_derivative'))
+        elif second_derivatives:
+            logging.warn("Operator does not provide second derivatives, "
+                         "using Newton iteration")
+
         symmetric = self.reciprocal
 
         # weight_type = 'max element'
@@ -152,17 +273,54 @@ class Operator(object):
         else:
             weight_type = 'rayleigh asymmetric'
 
+        # Group together any clustered poles, which need to be refined
+        # simultaneously. Every mode is related to itself, so that isolated
+        # modes form a group of their own.
+        relations = [(mode, mode) for mode in range(num_modes)]
+        if cluster_tol is not None:
+            s_est = estimates['s']
+            for mode1 in range(num_modes):
+                for mode2 in range(mode1+1, num_modes):
+                    if (abs(s_est[mode1]-s_est[mode2]) <
+                            cluster_tol*abs(s_est[mode1])):
+                        relations.append((mode1, mode2))
+        clusters = sorted(sorted(group) for group in equivalence(relations))
+
         # Note that mode refers to the position in the array modes, which
         # at this point need not correspond to the original mode numbering
-        for mode in iter_wrap(range(num_modes)):
+        for cluster in iter_wrap(clusters):
+            if len(cluster) > 1:
+                logging.info("Searching for cluster of modes %s" % cluster)
+                vl_0 = None if symmetric else estimates['vl'][cluster, :]
+                try:
+                    res = eig_newton_block(Z_func, estimates['s'][cluster],
+                                           estimates['vr'][:, cluster],
+                                           vl_0=vl_0, w_tol=rel_tol,
+                                           max_iter=max_iter,
+                                           func_gives_der=self.frequency_derivatives)
+                except (ConvergenceError, ValueError):
+                    logging.warn("Cluster {} convergence failed, modes "
+                                 "discarded".format(cluster))
+                    continue
+
+                logging.info("Converged after %d iterations" % res['iter_count'])
+                refined['s'].extend(res['w'])
+                refined['vr'].extend(res['vr'].T)
+                refined['vl'].extend(res['vl'])
+                continue
+
+            mode = cluster[0]
             logging.info("Searching for mode %d"%mode)
             try:
-                res = eig_newton(Z_func, estimates['s'][mode],
+                res = eig_newton(Z_func_der2 if use_der2 else Z_func,
+                                 estimates['s'][mode],
                                  estimates['vr'][:, mode],
                                  weight=weight_type, lambda_tol=rel_tol,
                                  max_iter=max_iter,
                                  func_gives_der=self.frequency_derivatives,
-                                 y_0=estimates['vl'][mode, :])
+                                 y_0=estimates['vl'][mode, :],
+                                 func_gives_der2=use_der2,
+                                 symmetric=symmetric)
             except (ConvergenceError, ValueError):
                 logging.warn("Mode {} convergence failed, mode discarded".format(mode))
                 continue
@@ -184,6 +342,15 @@ class Operator(object):
         refined['vl'] = np.array(refined['vl'])
         return refined
 
+    def source_lookup(self, fields, parent, source_field):
+        """The index data of a source vector. For a collection of sources,
+        such as `PlaneWaveSources`, the source vector has an additional
+        dimension, with a column for each source."""
+        index_data = (fields, (parent, self.basis_container))
+        if hasattr(source_field, '__len__'):
+            index_data += (len(source_field),)
+        return index_data
+
     def source_vector(self, source_field, s, parent, extinction_field=False):
         "Calculate the relevant source vector for this operator"
 
@@ -192,7 +359,7 @@ class Operator(object):
         else:
             fields = self.sources
 
-        V = LookupArray((fields, (parent, self.basis_container)),
+        V = LookupArray(self.source_lookup(fields, parent, source_field),
                         dtype=np.complex128)
 
         # define the functions to interpolate over the mesh
@@ -20,14 +20,16 @@
 
 import logging
 import numpy as np
+from scipy.sparse.linalg import LinearOperator, splu
 
-from openmodes.basis import LinearTriangleBasis
+from openmodes.basis import (LinearTriangleBasis, DivRwgBasis,
+                             BuffaChristiansenBasis, BasisContainer)
 from openmodes.impedance import (EfieImpedanceMatrixLA,
                                  CfieImpedanceMatrixLA, ImpedanceMatrixLA)
 
 from openmodes.operator.operator import Operator
 from openmodes.operator import rwg
-from openmodes.constants import epsilon_0, mu_0
+from openmodes.constants import epsilon_0, mu_0, c
 from openmodes.array import LookupArray
 
 
@@ -59,6 +61,10 @@ class EfieOperator(Operator):
 
         self.extinction_fields = ("E",)
         self.frequency_derivatives = True
+        self.second_frequency_derivatives = True
+
+        # dual basis functions for Calderon preconditioning
+        self.dual_basis_container = BasisContainer(BuffaChristiansenBasis)
 
         logging.info("Creating EFIE operator, tangential form: %s"
                      % str(tangential_form))
@@ -81,30 +87,167 @@ class EfieOperator(Operator):
         basis_s = self.basis_container[part_s]
 
         eps = self.background_material.epsilon_r(s)
-        mu = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
 
         normals = basis_o.mesh.surface_normals
 
-        if isinstance(basis_o, LinearTriangleBasis):
-            res = rwg.impedance_G(s, self.integration_rule, basis_o,
-                                  part_o.nodes, basis_s, part_s.nodes,
-                                  normals, part_o == part_s, eps, mu,
-                                  self.num_singular_terms,
-                                  self.singularity_accuracy, True)
+        # second derivatives are only calculated if storage has been allocated
+        if Z.der2 is not None:
+            derivatives = 2
         else:
+            derivatives = not Z.deferred_derivatives
+
+        if not isinstance(basis_o, LinearTriangleBasis):
             raise NotImplementedError
 
-        L, S, dL_ds, dS_ds = res
+        if Z.storage is not None:
+            self.impedance_single_parts_tiled(Z, s, part_o, part_s)
+            return
+
+        res = rwg.impedance_G(s, self.integration_rule, basis_o,
+                              part_o.nodes, basis_s, part_s.nodes,
+                              normals, part_o == part_s, eps, mu,
+                              self.num_singular_terms,
+                              self.singularity_accuracy, derivatives)
+
+        # all matrices share the same lookup of the parts
+        block = Z.matrices['L'].index_plan((part_o, part_s))
+
+        Z.matrices['L'][block] = res[0]*(mu*mu_0)
+        Z.matrices['S'][block] = res[1]/(eps*epsilon_0)
+
+        if derivatives:
+            Z.der['L'][block] = res[2]*(mu*mu_0)
+            Z.der['S'][block] = res[3]/(eps*epsilon_0)
 
-        Z.matrices['L'][part_o, part_s] = L*(mu*mu_0)
-        Z.matrices['S'][part_o, part_s] = S/(eps*epsilon_0)
-        Z.der['L'][part_o, part_s] = dL_ds*(mu*mu_0)
-        Z.der['S'][part_o, part_s] = dS_ds/(eps*epsilon_0)
+        if Z.der2 is not None:
+            Z.der2['L'][block] = res[4]*(mu*mu_0)
+            Z.der2['S'][block] = res[5]/(eps*epsilon_0)
+
+    def impedance_single_parts_tiled(self, Z, s, part_o, part_s):
+        """Calculate a self or mutual impedance matrix for an impedance
+        matrix held in scratch storage. The rows are calculated one tile at a
+        time, and are added to the stored matrices, so that the whole matrix
+        is never held in memory.
+
+        Parameters
+        ----------
+        s : complex
+            Complex frequency at which to calculate impedance
+        part_o : SinglePart
+            The observing part, which must be a single part, not a composite
+        part_s : SinglePart, optional
+            The source part, if not specified will default to observing part
+        """
+        basis_o = self.basis_container[part_o]
+        basis_s = self.basis_container[part_s]
+
+        eps = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
+
+        normals = basis_o.mesh.surface_normals
+        if Z.der2 is not None:
+            derivatives = 2
+        else:
+            derivatives = not Z.deferred_derivatives
+
+        plan = Z.matrices['L'].index_plan((part_o, part_s))
+        blocks = [Z.matrices['L'][plan], Z.matrices['S'][plan]]
+        if derivatives:
+            blocks += [Z.der['L'][plan], Z.der['S'][plan]]
+        if Z.der2 is not None:
+            blocks += [Z.der2['L'][plan], Z.der2['S'][plan]]
+        scale = [mu*mu_0, 1.0/(eps*epsilon_0)]
+
+        for block in blocks:
+            block[:] = 0.0
+
+        tiles = rwg.impedance_G_tiles(s, self.integration_rule, basis_o,
+                                      part_o.nodes, basis_s, part_s.nodes,
+                                      normals, part_o == part_s, eps, mu,
+                                      self.num_singular_terms,
+                                      self.singularity_accuracy, derivatives,
+                                      tile_memory=Z.storage.tile_memory)
+
+        for rows, res in tiles:
+            for count, (block, tile) in enumerate(zip(blocks, res)):
+                block[rows] += tile*scale[count % 2]
+
+    def calderon_preconditioner(self, s, parent):
+        """A Calderon multiplicative preconditioner for the EFIE
+
+        This is based on the property of the EFIE operator that its square is
+        a compact perturbation of the identity. The second application of the
+        operator is discretised with Buffa-Christiansen basis functions, which
+        are dual to the RWG functions, giving a preconditioned system whose
+        condition number does not grow as the mesh is refined.
+
+        The preconditioner is block diagonal, with a block for the self
+        interaction of each single part, which is calculated once for each
+        distinct part. Only closed parts with RWG basis functions are
+        supported.
+
+        Parameters
+        ----------
+        s : complex
+            The complex frequency
+        parent : Part
+            The part for which to create the preconditioner
+
+        Returns
+        -------
+        M : LinearOperator
+            The preconditioner, which can be passed to
+            `ImpedanceMatrixLA.solve_iterative`
+
+        See:
+        F. P. Andriulli et al., "A Multiplicative Calderon Preconditioner for
+        the Electric Field Integral Equation," IEEE Trans. Antennas Propag.,
+        vol. 56, no. 8, pp. 2398-2412, 2008.
+        """
+
+        eps = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
+
+        index = LookupArray((self.unknowns, (parent, self.basis_container)),
+                            dtype=np.int64)
+        index.simple_view()[:] = np.arange(index.size)
+
+        blocks = []
+        factors = {}
+        for part in parent.iter_single():
+            if not isinstance(self.basis_container[part], DivRwgBasis):
+                raise NotImplementedError("Calderon preconditioner requires "
+                                          "RWG basis functions")
+
+            if part.unique_id not in factors:
+                dual = self.dual_basis_container[part]
+                nodes = dual.node_transform.dot(part.nodes)
+                L, S = rwg.impedance_G(s, self.integration_rule, dual, nodes,
+                                       dual, nodes, dual.mesh.surface_normals,
+                                       True, eps, mu, self.num_singular_terms,
+                                       self.singularity_accuracy)
+                Z_dual = s*L*(mu*mu_0) + S/(eps*epsilon_0*s)
+                gram_lu = splu(dual.mixed_gram_matrix.astype(np.complex128).tocsc())
+                factors[part.unique_id] = (Z_dual, gram_lu)
+
+            blocks.append((np.asarray(index[:, part]).ravel(),
+                           factors[part.unique_id]))
+
+        def precondition(x):
+            y = np.empty_like(x, dtype=np.complex128)
+            for indices, (Z_dual, gram_lu) in blocks:
+                y[indices] = gram_lu.solve(Z_dual.dot(gram_lu.solve(x[indices])),
+                                           trans='T')
+            return y
+
+        return LinearOperator((index.size, index.size), matvec=precondition,
+                              dtype=np.complex128)
 
     def source_vector(self, source_field, s, parent, extinction_field):
         "Calculate the relevant source vector for this operator"
 
-        V = LookupArray((("E"), (parent, self.basis_container)),
+        V = LookupArray(self.source_lookup(("E"), parent, source_field),
                         dtype=np.complex128)
 
         for part in parent.iter_single():
@@ -122,6 +265,159 @@ class EfieOperator(Operator):
                                      part.nodes, self.source_cross)
 
 
+class EfieSeriesOperator(EfieOperator):
+    """An EFIE operator where the Green's function is expanded as a power
+    series in the wavenumber.
+
+    The frequency independent coefficient matrices are calculated once for
+    each pair of parts, after which the impedance matrix at any frequency is
+    a cheap sum of these matrices. This is only accurate for parts which are
+    small compared to the wavelength, as the number of terms required grows
+    with the electrical size of the parts. The background material is assumed
+    to be non-dispersive.
+    """
+
+    def __init__(self, integration_rule, basis_container, background_material,
+                 tangential_form=True, num_singular_terms=2,
+                 singularity_accuracy=1e-5, impedance_class=None,
+                 series_tol=1e-10, max_terms=40):
+        """
+        Parameters
+        ----------
+        series_tol : float, optional
+            The relative error allowed due to truncation of the series
+        max_terms : integer, optional
+            The maximum number of terms which will be used in the series
+        """
+        super(EfieSeriesOperator, self).__init__(integration_rule,
+                                                 basis_container,
+                                                 background_material,
+                                                 tangential_form,
+                                                 num_singular_terms,
+                                                 singularity_accuracy,
+                                                 impedance_class)
+        self.series_tol = series_tol
+        self.max_terms = max_terms
+        self.series_cache = {}
+
+    def series_order(self, gamma_0, part_o, part_s):
+        """The number of terms of the series required for a pair of parts
+
+        The largest distance between the parts is estimated from the size of
+        their meshes, and the number of terms is chosen so that the first
+        neglected term is smaller than the tolerance.
+        """
+        size_o = np.sqrt(3)*part_o.mesh.fast_size()
+        size_s = np.sqrt(3)*part_s.mesh.fast_size()
+        if part_o == part_s:
+            max_distance = size_o
+        else:
+            centre_o = np.mean(part_o.nodes, axis=0)
+            centre_s = np.mean(part_s.nodes, axis=0)
+            max_distance = (np.sqrt(np.sum((centre_o - centre_s)**2)) +
+                            size_o + size_s)
+
+        x = abs(gamma_0)*max_distance
+        term = 1.0
+        for num_terms in range(1, self.max_terms):
+            term *= x/num_terms
+            if term < self.series_tol:
+                return num_terms + 1
+
+        logging.warning("Power series for %s and %s did not converge with "
+                        "%d terms" % (part_o.id, part_s.id, self.max_terms))
+        return self.max_terms
+
+    def series_coefficients(self, part_o, part_s, num_terms):
+        """The coefficient matrices of the series for a pair of parts, which
+        are cached for re-use at other frequencies"""
+
+        if part_o == part_s:
+            # The self terms are independent of position
+            key = (part_o.mesh.id,)
+        else:
+            key = (part_o.id, part_s.id)
+        nodes_o = part_o.nodes
+        nodes_s = part_s.nodes
+
+        num_calculated = num_terms
+        try:
+            L_n, S_n, cached_o, cached_s = self.series_cache[key]
+            if (part_o == part_s or (np.array_equal(cached_o, nodes_o) and
+                                     np.array_equal(cached_s, nodes_s))):
+                if len(L_n) >= num_terms:
+                    return L_n[:num_terms], S_n[:num_terms]
+                # Calculate extra terms, to avoid repeated recalculation
+                # when frequency is gradually increased
+                num_calculated = min(max(num_terms, 2*len(L_n)),
+                                     self.max_terms)
+        except KeyError:
+            pass
+
+        basis_o = self.basis_container[part_o]
+        basis_s = self.basis_container[part_s]
+        if not isinstance(basis_o, LinearTriangleBasis):
+            raise NotImplementedError
+
+        L_n, S_n = rwg.impedance_G_series(self.integration_rule, basis_o,
+                                          nodes_o, basis_s, nodes_s,
+                                          basis_o.mesh.surface_normals,
+                                          part_o == part_s, num_calculated,
+                                          self.num_singular_terms,
+                                          self.singularity_accuracy)
+        self.series_cache[key] = (L_n, S_n, nodes_o, nodes_s)
+        return L_n[:num_terms], S_n[:num_terms]
+
+    def impedance_single_parts(self, Z, s, part_o, part_s):
+        """Calculate a self or mutual impedance matrix at a given complex
+        frequency, by summing the power series
+
+        Parameters
+        ----------
+        s : complex
+            Complex frequency at which to calculate impedance
+        part_o : SinglePart
+            The observing part, which must be a single part, not a composite
+        part_s : SinglePart, optional
+            The source part, if not specified will default to observing part
+        """
+        eps = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
+        c_mat = c/np.sqrt(eps*mu)
+        gamma_0 = s/c_mat
+
+        num_terms = self.series_order(gamma_0, part_o, part_s)
+        L_n, S_n = self.series_coefficients(part_o, part_s, num_terms)
+
+        # The powers of gamma_0, and their derivatives with respect to s
+        n = np.arange(num_terms)
+        powers = np.zeros((3 if Z.der2 is not None else 2, num_terms),
+                          np.complex128)
+        powers[0] = gamma_0**n
+        powers[1, 1:] = n[1:]*gamma_0**(n[1:]-1)/c_mat
+        if Z.der2 is not None:
+            powers[2, 2:] = n[2:]*(n[2:]-1)*gamma_0**(n[2:]-2)/c_mat**2
+
+        # The coefficients are real, so summing the real and imaginary parts
+        # separately avoids converting them to complex
+        shape = (len(powers),) + L_n.shape[1:]
+        L_n = L_n.reshape(num_terms, -1)
+        S_n = S_n.reshape(num_terms, -1)
+        L = (powers.real.dot(L_n) + 1j*powers.imag.dot(L_n)).reshape(shape)
+        S = (powers.real.dot(S_n) + 1j*powers.imag.dot(S_n)).reshape(shape)
+
+        block = Z.matrices['L'].index_plan((part_o, part_s))
+        Z.matrices['L'][block] = L[0]*(mu*mu_0)
+        Z.matrices['S'][block] = S[0]/(eps*epsilon_0)
+        if not Z.deferred_derivatives:
+            Z.der['L'][block] = L[1]*(mu*mu_0)
+            Z.der['S'][block] = S[1]/(eps*epsilon_0)
+
+        if Z.der2 is not None:
+            Z.der2['L'][block] = L[2]*(mu*mu_0)
+            Z.der2['S'][block] = S[2]/(eps*epsilon_0)
+
+
 class MfieOperator(Operator):
     """An operator for the magnetic field integral equation, discretised with
     respect to some set of basis functions. Assumes that Galerkin's method is
@@ -188,7 +484,7 @@ class MfieOperator(Operator):
         basis_s = self.basis_container[part_s]
 
         eps = self.background_material.epsilon_r(s)
-        mu = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
 
         if not (basis_o.mesh.closed_surface and basis_s.mesh.closed_surface):
             raise ValueError("MFIE can only be solved for closed objects")
@@ -206,7 +502,8 @@ class MfieOperator(Operator):
             raise NotImplementedError
 
         Z.matrices['Z'][part_o, part_s] = res[0]
-        Z.der['Z'][part_o, part_s] = res[1]
+        if not Z.deferred_derivatives:
+            Z.der['Z'][part_o, part_s] = res[1]
 
 
 class TMfieOperator(MfieOperator):
@@ -245,7 +542,7 @@ class CfieOperator(Operator):
         self.sources = ("E+nxH",)
 
         self.extinction_fields = ("E",)
-        self.frequency_derivatives = False
+        self.frequency_derivatives = True
 
     def source_vector(self, source_field, s, parent, extinction_field=False):
         "Calculate the relevant source vector for this operator"
@@ -255,7 +552,7 @@ class CfieOperator(Operator):
 
         fields = ("E", "nxH")
 
-        V = LookupArray((fields, (parent, self.basis_container)),
+        V = LookupArray(self.source_lookup(fields, parent, source_field),
                         dtype=np.complex128)
 
         # define the functions to interpolate over the mesh
@@ -278,15 +575,20 @@ class CfieOperator(Operator):
                 V[field, part] = basis.weight_function(field_func, self.integration_rule,
                                                        part.nodes, source_cross)
 
-        V_final = LookupArray((self.sources, (parent, self.basis_container)),
+        V_final = LookupArray(self.source_lookup(self.sources, parent,
+                                                 source_field),
                               dtype=np.complex128)
         V_final[:] = self.alpha*V["E"]+(1.0-self.alpha)*V["nxH"]
 
         return V_final
 
-    def impedance(self, s, parent_o, parent_s):
+    def impedance(self, s, parent_o, parent_s, frequency_derivatives=False,
+                  storage=None):
         metadata = {'alpha': self.alpha}
-        return super(CfieOperator, self).impedance(s, parent_o, parent_s, metadata)
+        return super(CfieOperator, self).impedance(s, parent_o, parent_s,
+                                                   metadata,
+                                                   frequency_derivatives,
+                                                   storage=storage)
 
     def impedance_single_parts(self, Z, s, part_o, part_s=None):
         """Calculate a self or mutual impedance matrix at a given complex
@@ -309,30 +611,38 @@ class CfieOperator(Operator):
         basis_s = self.basis_container[part_s]
 
         eps = self.background_material.epsilon_r(s)
-        mu = self.background_material.epsilon_r(s)
+        mu = self.background_material.mu_r(s)
 
         normals = basis_o.mesh.surface_normals
 
         if not (basis_o.mesh.closed_surface and basis_s.mesh.closed_surface):
             raise ValueError("CFIE can only be solved for closed objects")
 
+        derivatives = not Z.deferred_derivatives
+
         if isinstance(basis_o, LinearTriangleBasis):
-            L, S = rwg.impedance_G(s, self.integration_rule, basis_o,
-                                   part_o.nodes, basis_s, part_s.nodes,
-                                   normals, part_o == part_s, eps, mu,
-                                   self.num_singular_terms,
-                                   self.singularity_accuracy)
-
-            M, _ = rwg.impedance_curl_G(s, self.integration_rule, basis_o,
-                                     part_o.nodes, basis_s, part_s.nodes,
-                                     normals, part_o == part_s, eps, mu,
-                                     self.num_singular_terms,
-                                     self.singularity_accuracy,
-                                     tangential_form=False)
+            res = rwg.impedance_G(s, self.integration_rule, basis_o,
+                                  part_o.nodes, basis_s, part_s.nodes,
+                                  normals, part_o == part_s, eps, mu,
+                                  self.num_singular_terms,
+                                  self.singularity_accuracy, derivatives)
+
+            M, dM_ds = rwg.impedance_curl_G(s, self.integration_rule, basis_o,
+                                            part_o.nodes, basis_s, part_s.nodes,
+                                            normals, part_o == part_s, eps, mu,
+                                            self.num_singular_terms,
+                                            self.singularity_accuracy,
+                                            tangential_form=False)
 
         else:
             raise NotImplementedError
 
-        Z.matrices['L'][part_o, part_s] = L*(mu*mu_0)
-        Z.matrices['S'][part_o, part_s] = S/(eps*epsilon_0)
-        Z.matrices['M'][part_o, part_s] = M
+        block = Z.matrices['L'].index_plan((part_o, part_s))
+        Z.matrices['L'][block] = res[0]*(mu*mu_0)
+        Z.matrices['S'][block] = res[1]/(eps*epsilon_0)
+        Z.matrices['M'][block] = M
+
+        if derivatives:
+            Z.der['L'][block] = res[2]*(mu*mu_0)
+            Z.der['S'][block] = res[3]/(eps*epsilon_0)
+            Z.der['M'][block] = dM_ds
@@ -29,6 +29,18 @@ from openmodes.operator import rwg
 from openmodes.constants import epsilon_0, mu_0, c, eta_0
 
 
+def scalar_derivative(func, s, *args):
+    """Derivative of a scalar function of frequency, such as a material
+    parameter or equation weighting, by central differences. Exact for
+    constant functions.
+
+    If the function returns a tuple, then the derivative of each element is
+    returned as an array
+    """
+    h = 1e-5*abs(s)
+    return (np.array(func(s+h, *args)) - np.array(func(s-h, *args)))/(2*h)
+
+
 class TOperator(Operator):
     """General tangential-form operator for penetrable objects
 
@@ -64,9 +76,10 @@ class TOperator(Operator):
         self.sources = ("E", "H")
         self.extinction_fields = ("E", "H")
         self.impedance_class = impedance_class or PenetrableImpedanceMatrixLA
-        self.frequency_derivatives = False
+        self.frequency_derivatives = True
 
-    def impedance(self, s, parent_o, parent_s, metadata=None):
+    def impedance(self, s, parent_o, parent_s, metadata=None,
+                  frequency_derivatives=False, storage=None):
 
         metadata = metadata or dict()
 
@@ -76,11 +89,22 @@ class TOperator(Operator):
         metadata['w_EFIE_i'] = {}
         metadata['w_MFIE_i'] = {}
 
+        # frequency derivatives of the material dependent quantities
+        metadata['eta_o_ds'] = scalar_derivative(self.background_material.eta_r, s)
+        metadata['eta_i_ds'] = {}
+        metadata['w_EFIE_o_ds'], metadata['w_MFIE_o_ds'] = scalar_derivative(self.weights_o, s)
+        metadata['w_EFIE_i_ds'] = {}
+        metadata['w_MFIE_i_ds'] = {}
+
         for part in parent_s.iter_single():
             metadata['eta_i'][part] = part.material.eta_r(s)
             metadata['w_EFIE_i'][part], metadata['w_MFIE_i'][part] = self.weights_i(s, part)
+            metadata['eta_i_ds'][part] = scalar_derivative(part.material.eta_r, s)
+            metadata['w_EFIE_i_ds'][part], metadata['w_MFIE_i_ds'][part] = scalar_derivative(self.weights_i, s, part)
 
-        return super(TOperator, self).impedance(s, parent_o, parent_s, metadata)
+        return super(TOperator, self).impedance(s, parent_o, parent_s, metadata,
+                                                frequency_derivatives,
+                                                storage=storage)
 
     def impedance_single_parts(self, Z, s, part_o, part_s=None):
         """Calculate a self or mutual impedance matrix at a given complex
@@ -118,7 +142,18 @@ class TOperator(Operator):
         c_i = c/np.sqrt(eps_i*mu_i)
         c_o = c/np.sqrt(eps_o*mu_o)
 
+        # The impedance routines give derivatives for fixed material
+        # parameters. For dispersive materials, the wavenumber has an
+        # additional frequency dependence through the refractive index.
+        n_i = part_s.material.n(s)
+        n_o = self.background_material.n(s)
+        dn_i = scalar_derivative(part_s.material.n, s)
+        dn_o = scalar_derivative(self.background_material.n, s)
+        f_i = 1.0 + s*dn_i/n_i
+        f_o = 1.0 + s*dn_o/n_o
+
         is_self_term = part_o == part_s
+        derivatives = not Z.deferred_derivatives
 
         matrix_names = ('L_o', 'S_o', 'K_o')
         if isinstance(basis_o, LinearTriangleBasis):
@@ -127,9 +162,12 @@ class TOperator(Operator):
                                       part_o.nodes, basis_s, part_s.nodes,
                                       -normals, is_self_term, eps_i, mu_i,
                                       self.num_singular_terms,
-                                      self.singularity_accuracy)
+                                      self.singularity_accuracy, derivatives)
                 L_i = res[0]/c_i*eta_0
                 S_i = res[1]*c_i*eta_0
+                if derivatives:
+                    dL_i = res[2]*f_i/c_i*eta_0 + L_i*dn_i/n_i
+                    dS_i = res[3]*f_i*c_i*eta_0 - S_i*dn_i/n_i
 
                 # note opposite sign of normals for interior problem
                 res = rwg.impedance_curl_G(s, self.integration_rule, basis_o,
@@ -139,6 +177,7 @@ class TOperator(Operator):
                                            self.singularity_accuracy,
                                            tangential_form=True)
                 K_i = res[0]*eta_0
+                dK_i = res[1]*f_i*eta_0
 
                 matrix_names += ('L_i', 'S_i', 'K_i')
 
@@ -146,12 +185,15 @@ class TOperator(Operator):
                                   part_o.nodes, basis_s, part_s.nodes,
                                   normals, is_self_term, eps_o, mu_o,
                                   self.num_singular_terms,
-                                  self.singularity_accuracy)
+                                  self.singularity_accuracy, derivatives)
 
             # This scaling ensures that this operator has the same definition
             # as cursive D defined by Yla-Oijala, Radio Science 2005.
             L_o = res[0]/c_o*eta_0
             S_o = res[1]*c_o*eta_0
+            if derivatives:
+                dL_o = res[2]*f_o/c_o*eta_0 + L_o*dn_o/n_o
+                dS_o = res[3]*f_o*c_o*eta_0 - S_o*dn_o/n_o
 
             res = rwg.impedance_curl_G(s, self.integration_rule, basis_o,
                                        part_o.nodes, basis_s, part_s.nodes,
@@ -160,6 +202,7 @@ class TOperator(Operator):
                                        self.singularity_accuracy,
                                        tangential_form=True)
             K_o = res[0]*eta_0
+            dK_o = res[1]*f_o*eta_0
         else:
             raise NotImplementedError
 
@@ -169,6 +212,8 @@ class TOperator(Operator):
         loc = locals()
         for name in matrix_names:
             Z.matrices[name][part_o, part_s] = loc[name]
+            if derivatives:
+                Z.der[name][part_o, part_s] = loc['d'+name]
 
     def source_vector(self, source_field, s, parent, extinction_field=False):
         V = super(TOperator, self).source_vector(source_field, s, parent,
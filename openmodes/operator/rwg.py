@@ -24,6 +24,8 @@ import numpy as np
 from openmodes.operator.singularities import singular_impedance_rwg
 from openmodes.core import z_mfie_faces_self, z_mfie_faces_mutual
 from openmodes.core import z_efie_faces_self, z_efie_faces_mutual
+from openmodes.core import (z_efie_faces_series_self,
+                            z_efie_faces_series_mutual)
 from openmodes.constants import pi, c
 
 
@@ -106,10 +108,18 @@ def impedance_G(s, integration_rule, basis_o, nodes_o, basis_s, nodes_s,
 
     No factors of epsilon/mu are included, as these can vary depending on
     the operator
+
+    If `frequency_derivatives` is True, the derivatives of L and S with
+    respect to s are also returned. If it is 2, then the second derivatives
+    are returned as well.
     """
 
     transform_L_o, transform_S_o = basis_o.transformation_matrices
     num_faces_o = len(basis_o.mesh.polygons)
+    if frequency_derivatives == 2:
+        derivative_order = 2
+    else:
+        derivative_order = 1 if frequency_derivatives else 0
 
     c_mat = c/np.sqrt(epsilon*mu)
     gamma_0 = s/c_mat
@@ -129,7 +139,8 @@ def impedance_G(s, integration_rule, basis_o, nodes_o, basis_s, nodes_s,
         num_faces_s = num_faces_o
         res = z_efie_faces_self(nodes_o, basis_o.mesh.polygons, gamma_0,
                                 integration_rule.points,
-                                integration_rule.weights, *singular_terms)
+                                integration_rule.weights, *singular_terms,
+                                derivative_order=derivative_order)
 
         transform_L_s = transform_L_o
         transform_S_s = transform_S_o
@@ -142,18 +153,28 @@ def impedance_G(s, integration_rule, basis_o, nodes_o, basis_s, nodes_s,
         res = z_efie_faces_mutual(nodes_o, basis_o.mesh.polygons, nodes_s,
                                   basis_s.mesh.polygons, gamma_0,
                                   integration_rule.points,
-                                  integration_rule.weights)
+                                  integration_rule.weights,
+                                  derivative_order=derivative_order)
 
         transform_L_s, transform_S_s = basis_s.transformation_matrices
 
-    A_faces, phi_faces, A_dgamma_faces, phi_dgamma_faces = res
+    return faces_to_basis(res, transform_L_o, transform_S_o, transform_L_s,
+                          transform_S_s, c_mat, frequency_derivatives)
+
+
+def faces_to_basis(res, transform_L_o, transform_S_o, transform_L_s,
+                   transform_S_s, c_mat, frequency_derivatives):
+    """Transform the face to face interaction terms into L and S matrices
+    between basis functions, and their frequency derivatives, as returned
+    by `impedance_G`"""
+
+    A_faces, phi_faces, A_dgamma_faces, phi_dgamma_faces = res[:4]
+    num_faces_o = A_faces.shape[0]
+    num_faces_s = A_faces.shape[2]
 
     if np.any(np.isnan(A_faces)) or np.any(np.isnan(phi_faces)):
         raise ValueError("NaN returned in impedance matrix")
 
-    if np.any(np.isnan(A_dgamma_faces)) or np.any(np.isnan(phi_dgamma_faces)):
-        raise ValueError("NaN returned in impedance matrix derivative")
-
     L = transform_L_o.dot(transform_L_s.dot(A_faces.reshape(num_faces_o*3,
                                                             num_faces_s*3,
                                                             order='C').T).T)
@@ -165,6 +186,9 @@ def impedance_G(s, integration_rule, basis_o, nodes_o, basis_s, nodes_s,
     if not frequency_derivatives:
         return L, S
 
+    if np.any(np.isnan(A_dgamma_faces)) or np.any(np.isnan(phi_dgamma_faces)):
+        raise ValueError("NaN returned in impedance matrix derivative")
+
     # transform the frequency derivatives
     dL_ds = transform_L_o.dot(transform_L_s.dot(A_dgamma_faces.reshape(num_faces_o*3,
                                                                 num_faces_s*3,
@@ -174,4 +198,214 @@ def impedance_G(s, integration_rule, basis_o, nodes_o, basis_s, nodes_s,
     dL_ds /= c_mat*4*pi
     dS_ds /= c_mat*pi
 
-    return L, S, dL_ds, dS_ds
+    if frequency_derivatives != 2:
+        return L, S, dL_ds, dS_ds
+
+    A_d2gamma_faces, phi_d2gamma_faces = res[4:]
+
+    if (np.any(np.isnan(A_d2gamma_faces)) or
+            np.any(np.isnan(phi_d2gamma_faces))):
+        raise ValueError("NaN returned in impedance matrix second derivative")
+
+    d2L_ds2 = transform_L_o.dot(transform_L_s.dot(A_d2gamma_faces.reshape(num_faces_o*3,
+                                                                    num_faces_s*3,
+                                                                    order='C').T).T)
+    d2S_ds2 = transform_S_o.dot(transform_S_s.dot(phi_d2gamma_faces.T).T)
+
+    d2L_ds2 /= c_mat**2*4*pi
+    d2S_ds2 /= c_mat**2*pi
+
+    return L, S, dL_ds, dS_ds, d2L_ds2, d2S_ds2
+
+
+def impedance_G_tiles(s, integration_rule, basis_o, nodes_o, basis_s,
+                      nodes_s, normals, self_impedance, epsilon, mu,
+                      num_singular_terms, singularity_accuracy,
+                      frequency_derivatives=False, tile_memory=2**30):
+    """Calculates the same matrices as `impedance_G`, but one tile of rows at
+    a time, so that the whole matrix never needs to be held in memory.
+
+    Each tile contains the rows of the basis functions which are defined
+    over a range of observer faces. As basis functions may extend over faces
+    in adjacent tiles, the rows from all tiles must be summed to give the
+    complete matrix.
+
+    For the self impedance, the touching face pairs within each tile are
+    found from the singular terms, and their interaction is calculated for
+    the neighbourhood of faces surrounding the tile.
+
+    Parameters
+    ----------
+    tile_memory : integer, optional
+        The approximate number of bytes of memory to use for each tile
+
+    Yields
+    ------
+    rows : ndarray
+        The rows of the matrices within this tile
+    matrices : tuple
+        The rows of L and S, and their frequency derivatives
+    """
+
+    transform_L_o, transform_S_o = basis_o.transformation_matrices
+    transform_L_o = transform_L_o.tocsc()
+    transform_S_o = transform_S_o.tocsc()
+    polygons_o = basis_o.mesh.polygons
+    num_faces_o = len(polygons_o)
+    if frequency_derivatives == 2:
+        derivative_order = 2
+    else:
+        derivative_order = 1 if frequency_derivatives else 0
+
+    c_mat = c/np.sqrt(epsilon*mu)
+    gamma_0 = s/c_mat
+
+    if self_impedance:
+        singular_terms = singular_impedance_rwg(basis_o,
+                                                num_terms=num_singular_terms,
+                                                rel_tol=singularity_accuracy,
+                                                normals=normals)
+        phi_precalc, A_precalc, indices, indptr = singular_terms["T_EFIE"]
+        if np.any(np.isnan(phi_precalc)) or np.any(np.isnan(A_precalc)):
+            raise ValueError("NaN returned in singular impedance terms")
+
+        basis_s = basis_o
+        nodes_s = nodes_o
+
+    transform_L_s, transform_S_s = basis_s.transformation_matrices
+    polygons_s = basis_s.mesh.polygons
+    num_faces_s = len(polygons_s)
+
+    # the memory of the face interaction terms for each observer face, and
+    # of the interactions within the neighbourhood of each tile
+    face_memory = 2*16*10*(derivative_order+1)*num_faces_s
+    tile_faces = max(1, min(tile_memory//face_memory,
+                            int(np.sqrt(tile_memory/face_memory*num_faces_s))//4))
+
+    for start in range(0, num_faces_o, tile_faces):
+        stop = min(start+tile_faces, num_faces_o)
+
+        res = z_efie_faces_mutual(nodes_o, polygons_o[start:stop], nodes_s,
+                                  polygons_s, gamma_0,
+                                  integration_rule.points,
+                                  integration_rule.weights,
+                                  derivative_order=derivative_order)
+
+        if self_impedance:
+            # the touching face pairs within this tile
+            face_p = np.repeat(np.arange(start, stop),
+                               np.diff(indptr[start:stop+1]))
+            face_q = indices[indptr[start]:indptr[stop]]
+
+            neighbourhood = np.unique(np.hstack((np.arange(start, stop),
+                                                 face_q)))
+            local = np.empty(num_faces_o, np.int32)
+            local[:] = -1
+            local[neighbourhood] = np.arange(len(neighbourhood))
+
+            # the singular terms between faces in the neighbourhood
+            entries = np.hstack([np.arange(indptr[face], indptr[face+1])
+                                 for face in neighbourhood])
+            entry_rows = np.repeat(np.arange(len(neighbourhood)),
+                                   np.diff(indptr)[neighbourhood])
+            keep = local[indices[entries]] >= 0
+            entries = entries[keep]
+            local_indptr = np.zeros(len(neighbourhood)+1, np.int32)
+            local_indptr[1:] = np.cumsum(np.bincount(entry_rows[keep],
+                                                     minlength=len(neighbourhood)))
+
+            res_local = z_efie_faces_self(nodes_o, polygons_o[neighbourhood],
+                                          gamma_0, integration_rule.points,
+                                          integration_rule.weights,
+                                          np.asfortranarray(phi_precalc[entries]),
+                                          np.asfortranarray(A_precalc[entries]),
+                                          local[indices[entries]],
+                                          local_indptr,
+                                          derivative_order=derivative_order)
+
+            tile_p = face_p-start
+            local_p = local[face_p]
+            local_q = local[face_q]
+            # the arrays of derivatives which are not requested are empty
+            for term, term_local in zip(res[:2*derivative_order+2],
+                                        res_local[:2*derivative_order+2]):
+                if term.ndim == 4:
+                    term[tile_p, :, face_q, :] = term_local[local_p, :, local_q, :]
+                else:
+                    term[tile_p, face_q] = term_local[local_p, local_q]
+
+        # the basis functions which are defined over faces in this tile
+        tile_L_o = transform_L_o[:, 3*start:3*stop]
+        tile_S_o = transform_S_o[:, start:stop]
+        rows = np.union1d(tile_L_o.nonzero()[0], tile_S_o.nonzero()[0])
+
+        yield rows, faces_to_basis(res, tile_L_o[rows], tile_S_o[rows],
+                                   transform_L_s, transform_S_s, c_mat,
+                                   frequency_derivatives)
+
+
+def impedance_G_series(integration_rule, basis_o, nodes_o, basis_s, nodes_s,
+                       normals, self_impedance, num_terms, num_singular_terms,
+                       singularity_accuracy):
+    """Calculates the coefficients of the power series in gamma_0 of the
+    matrices returned by `impedance_G`
+
+    The coefficients do not depend on frequency, so that
+    L = sum(L_n*gamma_0**n) and S = sum(S_n*gamma_0**n), where gamma_0 is the
+    complex wavenumber of the background medium.
+
+    Returns
+    -------
+    L_n, S_n : ndarray
+        The coefficients, with the first index corresponding to the power
+        of gamma_0
+    """
+
+    transform_L_o, transform_S_o = basis_o.transformation_matrices
+    num_faces_o = len(basis_o.mesh.polygons)
+
+    if (self_impedance):
+        singular_terms = singular_impedance_rwg(basis_o,
+                                                num_terms=num_singular_terms,
+                                                rel_tol=singularity_accuracy,
+                                                normals=normals)
+        singular_terms = singular_terms["T_EFIE"]
+        if (np.any(np.isnan(singular_terms[0])) or
+                np.any(np.isnan(singular_terms[1]))):
+            raise ValueError("NaN returned in singular impedance terms")
+
+        num_faces_s = num_faces_o
+        A_faces, phi_faces = z_efie_faces_series_self(nodes_o,
+                                                      basis_o.mesh.polygons,
+                                                      integration_rule.points,
+                                                      integration_rule.weights,
+                                                      *singular_terms,
+                                                      num_terms=num_terms)
+
+        transform_L_s = transform_L_o
+        transform_S_s = transform_S_o
+
+    else:
+        num_faces_s = len(basis_s.mesh.polygons)
+
+        A_faces, phi_faces = z_efie_faces_series_mutual(nodes_o,
+                                                        basis_o.mesh.polygons,
+                                                        nodes_s,
+                                                        basis_s.mesh.polygons,
+                                                        integration_rule.points,
+                                                        integration_rule.weights,
+                                                        num_terms)
+
+        transform_L_s, transform_S_s = basis_s.transformation_matrices
+
+    if np.any(np.isnan(A_faces)) or np.any(np.isnan(phi_faces)):
+        raise ValueError("NaN returned in impedance matrix series")
+
+    L_n = []
+    S_n = []
+    for n in range(num_terms):
+        A_n = A_faces[..., n].reshape(num_faces_o*3, num_faces_s*3, order='C')
+        L_n.append(transform_L_o.dot(transform_L_s.dot(A_n.T).T)/(4*pi))
+        S_n.append(transform_S_o.dot(transform_S_s.dot(phi_faces[..., n].T).T)/pi)
+
+    return np.array(L_n), np.array(S_n)
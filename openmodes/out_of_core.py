@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+"""Storage of large matrices in memory-mapped files, and linear algebra
+routines which operate on them one tile at a time"""
+
+from __future__ import division
+
+import logging
+import os.path as osp
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import scipy.linalg as la
+
+from openmodes.array import LookupArray, build_lookup
+
+
+class ScratchStorage(object):
+    """Creates arrays which are stored in memory-mapped files within a
+    scratch directory, rather than in memory.
+
+    Passing this object as the `storage` argument when calculating an
+    impedance matrix allows problems to be solved which are larger than
+    the available memory. Operations on the arrays are performed on tiles
+    which are loaded into memory one at a time. The directory and all its
+    files are deleted when this object is no longer referenced.
+    """
+
+    def __init__(self, directory=None, tile_memory=2**32):
+        """
+        Parameters
+        ----------
+        directory : string, optional
+            The directory in which to create the scratch files, which should
+            be on a fast local disk. If not specified, the system temporary
+            directory is used.
+        tile_memory : integer, optional
+            The approximate number of bytes of memory to use for each tile
+        """
+        self.directory = tempfile.mkdtemp(prefix='openmodes_', dir=directory)
+        self.tile_memory = tile_memory
+        self.num_files = 0
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory,
+                                         True)
+        logging.info("Storing arrays in scratch directory %s"
+                     % self.directory)
+
+    def empty(self, shape, dtype=np.complex128):
+        """Create a new memory-mapped array, initialised to zero
+
+        Parameters
+        ----------
+        shape : tuple
+            The shape of the array
+        dtype : dtype, optional
+            The data type of the array
+        """
+        filename = osp.join(self.directory, "array_%d.dat" % self.num_files)
+        self.num_files += 1
+        return np.memmap(filename, dtype=dtype, mode='w+', shape=tuple(shape))
+
+    def lookup_array(self, index_data, dtype=np.complex128):
+        """Create a memory-mapped LookupArray, initialised to zero
+
+        Parameters
+        ----------
+        index_data : tuple
+            The indices of the array, as for `LookupArray`
+        dtype : dtype, optional
+            The data type of the array
+        """
+        lookup, shape = build_lookup(index_data)
+        array = self.empty(shape, dtype).view(LookupArray)
+        array.lookup = lookup
+        return array
+
+    def tile_size(self, row_length, itemsize=16, copies=2):
+        """The number of rows or columns of a matrix in each tile
+
+        Parameters
+        ----------
+        row_length : integer
+            The length of each row or column of the tile
+        itemsize : integer, optional
+            The size of each element in bytes
+        copies : integer, optional
+            The number of tiles which will be in memory at the same time
+        """
+        return max(1, self.tile_memory//(row_length*itemsize*copies))
+
+    def cleanup(self):
+        "Delete the scratch directory and all arrays stored within it"
+        self._cleanup()
+
+
+def lu_factor_tiled(A, tile_size):
+    """LU factorisation with partial pivoting of a matrix which is too large
+    to be stored in memory.
+
+    This is a blocked right-looking algorithm. Each panel of `tile_size`
+    columns is factorised in memory, then the remainder of the matrix is
+    updated one tile of columns at a time. The factorisation is performed in
+    place.
+
+    Parameters
+    ----------
+    A : ndarray or memmap (N, N)
+        The matrix to factorise, which will be overwritten
+    tile_size : integer
+        The number of columns in each tile
+
+    Returns
+    -------
+    factors : tuple
+        The factors L and U stored in `A`, the permutation of the rows and
+        the tile size, for use with `lu_solve_tiled`
+    """
+    N = A.shape[0]
+    perm = np.arange(N)
+
+    for k in range(0, N, tile_size):
+        k_end = min(k+tile_size, N)
+        logging.debug("Tiled LU factorisation of columns %d to %d of %d"
+                      % (k, k_end, N))
+
+        panel_lu, panel_piv = la.lu_factor(A[k:, k:k_end])
+        A[k:, k:k_end] = panel_lu
+
+        # convert the sequence of row swaps into a permutation
+        panel_perm = np.arange(N-k)
+        for row, swap_row in enumerate(panel_piv):
+            panel_perm[[row, swap_row]] = panel_perm[[swap_row, row]]
+        perm[k:] = perm[k:][panel_perm]
+
+        L_11 = panel_lu[:k_end-k]
+        L_21 = panel_lu[k_end-k:]
+
+        # the previously factorised columns only need their rows swapped
+        for j in range(0, k, tile_size):
+            j_end = min(j+tile_size, k)
+            A[k:, j:j_end] = A[k:, j:j_end][panel_perm]
+
+        # update the remaining columns
+        for j in range(k_end, N, tile_size):
+            j_end = min(j+tile_size, N)
+            tile = A[k:, j:j_end][panel_perm]
+            tile[:k_end-k] = la.solve_triangular(L_11, tile[:k_end-k],
+                                                 lower=True,
+                                                 unit_diagonal=True)
+            tile[k_end-k:] -= L_21.dot(tile[:k_end-k])
+            A[k:, j:j_end] = tile
+
+    if isinstance(A, np.memmap):
+        A.flush()
+
+    return A, perm, tile_size
+
+
+def lu_solve_tiled(factors, b):
+    """Solve a linear system which has been factorised by `lu_factor_tiled`
+
+    Parameters
+    ----------
+    factors : tuple
+        The factorised matrix returned by `lu_factor_tiled`
+    b : ndarray (N) or (N, M)
+        The right hand side
+
+    Returns
+    -------
+    x : ndarray
+        The solution
+    """
+    LU, perm, tile_size = factors
+    N = LU.shape[0]
+    x = np.array(b, dtype=np.complex128)[perm]
+
+    # forward substitution for L, reading one tile of columns at a time
+    for k in range(0, N, tile_size):
+        k_end = min(k+tile_size, N)
+        panel = LU[k:, k:k_end]
+        x[k:k_end] = la.solve_triangular(panel[:k_end-k], x[k:k_end],
+                                         lower=True, unit_diagonal=True)
+        x[k_end:] -= panel[k_end-k:].dot(x[k:k_end])
+
+    # back substitution for U
+    for k in reversed(range(0, N, tile_size)):
+        k_end = min(k+tile_size, N)
+        panel = LU[:k_end, k:k_end]
+        x[k:k_end] = la.solve_triangular(panel[k:], x[k:k_end], lower=False)
+        x[:k] -= panel[:k].dot(x[k:k_end])
+
+    return x
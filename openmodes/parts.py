@@ -240,6 +240,12 @@ class MultiPart(Part):
         """Check if the given part is stored within this tree of parts"""
         return self == key or any(key in part for part in self.children)
 
+    def _position_updated(self):
+        """Called when position or orientation is updated, which also moves
+        all the child parts"""
+        for part in getattr(self, 'children', []):
+            part._position_updated()
+
 
 class CompositePart(MultiPart):
     """A composite part containing sub-parts which can be treated as a
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+"""Saving and loading of modes and impedance matrices
+
+Each set of data is stored in a directory. The arrays are stored in separate
+`.npy` files, so that they can be memory-mapped when they are loaded, and
+are only read from disk when they are used. Memory-mapped arrays are
+copy-on-write, so modifying them does not change the saved data. The
+description of the parts and basis functions is stored in the file
+`metadata.json`.
+
+Parts are identified by the content of their meshes and by the name of their
+material, so that the data can be attached to the parts of a different
+`Simulation`, such as one created in another process, provided that it
+contains the same parts.
+"""
+
+from __future__ import division
+
+import json
+import logging
+import numbers
+import os
+import os.path as osp
+
+import numpy as np
+import six
+
+from openmodes.array import LookupArray, build_lookup
+from openmodes.basis import MacroBasis
+from openmodes.modes import Modes, ConjugateModes, SplitModes
+from openmodes import impedance
+
+FORMAT_VERSION = 1
+METADATA_FILE = 'metadata.json'
+
+MODES_CLASSES = {cls.__name__: cls for cls in (Modes, ConjugateModes,
+                                               SplitModes)}
+
+# metadata which is recreated when an impedance matrix is loaded
+SKIPPED_METADATA = ('operator', 'position_hash')
+
+
+def describe_parts(parent_part):
+    "Describe each single part within a parent part, so it can be identified"
+    return [{'mesh': part.mesh.content_hash,
+             'material': part.material.name,
+             'transformation': part.complete_transformation.tolist()}
+            for part in parent_part.iter_single()]
+
+
+def match_parts(description, parent_part, check_location=False):
+    """Find the single parts within a parent part which match the saved
+    description
+
+    Parameters
+    ----------
+    description : list
+        The saved description of the parts, from `describe_parts`
+    parent_part : Part
+        The part which should contain the same parts as the saved data
+    check_location : boolean, optional
+        Whether the parts must be in the same location as when saved
+
+    Returns
+    -------
+    single_parts : list
+        The single parts of `parent_part`
+    """
+    single_parts = list(parent_part.iter_single())
+    if len(single_parts) != len(description):
+        raise ValueError("Saved data has %d parts, but the part given has %d"
+                         % (len(description), len(single_parts)))
+
+    for part, saved in zip(single_parts, description):
+        if (part.mesh.content_hash != saved['mesh'] or
+                part.material.name != saved['material']):
+            raise ValueError("Part %s does not match the saved data"
+                             % str(part.id))
+        if check_location and not np.allclose(part.complete_transformation,
+                                               saved['transformation']):
+            raise ValueError("Part %s has been moved since the data was saved"
+                             % str(part.id))
+    return single_parts
+
+
+def write_metadata(directory, metadata):
+    "Write the metadata file"
+    metadata['format_version'] = FORMAT_VERSION
+    with open(osp.join(directory, METADATA_FILE), 'w') as outfile:
+        json.dump(metadata, outfile, indent=1)
+
+
+def read_metadata(directory, data_type, operator):
+    "Read the metadata file, and check that it is compatible with an operator"
+    with open(osp.join(directory, METADATA_FILE), 'r') as infile:
+        metadata = json.load(infile)
+
+    if metadata.get('format_version') != FORMAT_VERSION:
+        raise ValueError("Unsupported format version %s"
+                         % metadata.get('format_version'))
+    if metadata['type'] != data_type:
+        raise ValueError("Directory %s contains %s, not %s"
+                         % (directory, metadata['type'], data_type))
+    if metadata['operator'] != type(operator).__name__:
+        raise ValueError("Data was calculated with operator %s, not %s"
+                         % (metadata['operator'], type(operator).__name__))
+    basis_class = operator.basis_container.basis_class.__name__
+    if metadata['basis'] != basis_class:
+        raise ValueError("Data was calculated with basis functions %s, not %s"
+                         % (metadata['basis'], basis_class))
+    return metadata
+
+
+def save_arrays(directory, prefix, arrays):
+    """Save a dictionary of arrays to separate files, returning a dictionary
+    of the file names"""
+    filenames = {}
+    for name, array in arrays.items():
+        filename = "%s_%s.npy" % (prefix, name)
+        np.save(osp.join(directory, filename), np.asarray(array))
+        filenames[name] = filename
+    return filenames
+
+
+def load_arrays(directory, filenames, mmap, lookup=None):
+    """Load a dictionary of arrays which were saved by `save_arrays`,
+    optionally converting them to LookupArrays"""
+    arrays = {}
+    for name, filename in filenames.items():
+        array = np.load(osp.join(directory, filename),
+                        mmap_mode='c' if mmap else None)
+        if lookup is not None:
+            array = array.view(LookupArray)
+            array.lookup = lookup
+        arrays[name] = array
+    return arrays
+
+
+def save_modes(modes, directory):
+    """Save a set of modes
+
+    Parameters
+    ----------
+    modes : Modes
+        The modes to save
+    directory : string
+        The directory in which to save the modes, which will be created if it
+        does not exist
+    """
+    single_parts = list(modes.parent_part.iter_single())
+    for part in modes.parts:
+        if part not in single_parts:
+            raise NotImplementedError("Can only save modes of single parts")
+
+    metadata = {'type': 'modes',
+                'class': type(modes).__name__,
+                'operator': type(modes.operator).__name__,
+                'basis': modes.orig_container.basis_class.__name__,
+                'parent_part': describe_parts(modes.parent_part),
+                'parts': [single_parts.index(part) for part in modes.parts],
+                'modes_of_parts': []}
+
+    if not osp.exists(directory):
+        os.makedirs(directory)
+
+    # parts with the same unique_id share their modes, so they are only saved
+    # once
+    saved_ids = set()
+    for part in modes.parts:
+        if part.unique_id in saved_ids:
+            continue
+        saved_ids.add(part.unique_id)
+        part_num = single_parts.index(part)
+
+        arrays = {}
+        for name, value in modes.modes_of_parts[part.unique_id].items():
+            if isinstance(value, np.ndarray):
+                arrays[name] = value
+            else:
+                logging.warning("Not saving mode data %s of type %s"
+                                % (name, type(value)))
+
+        filenames = save_arrays(directory, "modes_%d" % part_num, arrays)
+        metadata['modes_of_parts'].append({'part': part_num,
+                                           'arrays': filenames})
+
+    write_metadata(directory, metadata)
+
+
+def load_modes(directory, sim, parent_part=None, mmap=True):
+    """Load a set of modes, which were saved by `save_modes`
+
+    Parameters
+    ----------
+    directory : string
+        The directory containing the saved modes
+    sim : Simulation
+        The simulation containing the parts for which the modes were found
+    parent_part : Part, optional
+        The part containing the same parts as when the modes were saved. If
+        not specified, all parts of the simulation are used.
+    mmap : boolean, optional
+        If True, the arrays are memory-mapped, so that they are only read
+        from disk when they are used
+
+    Returns
+    -------
+    modes : Modes
+        The loaded modes
+    """
+    metadata = read_metadata(directory, 'modes', sim.operator)
+    parent_part = parent_part or sim.parts
+    single_parts = match_parts(metadata['parent_part'], parent_part)
+
+    modes_of_parts = {}
+    for saved in metadata['modes_of_parts']:
+        unique_id = single_parts[saved['part']].unique_id
+        modes_of_parts[unique_id] = load_arrays(directory, saved['arrays'],
+                                                mmap)
+
+    parts = [single_parts[part_num] for part_num in metadata['parts']]
+    modes_class = MODES_CLASSES[metadata['class']]
+    return modes_class(parent_part, parts, modes_of_parts, sim.operator,
+                       sim.basis_container)
+
+
+def save_impedance(Z, directory):
+    """Save an impedance matrix
+
+    Parameters
+    ----------
+    Z : ImpedanceMatrixLA
+        The impedance matrix to save
+    directory : string
+        The directory in which to save the matrix, which will be created if
+        it does not exist
+    """
+    if Z.basis_container.basis_class is MacroBasis:
+        raise NotImplementedError("Can only save impedance matrices of the "
+                                  "original basis functions")
+
+    # Only metadata containing numbers and strings can be saved. Complex
+    # numbers are stored as their real and imaginary parts.
+    real_md = {}
+    complex_md = {}
+    for key, value in Z.md.items():
+        if key in SKIPPED_METADATA:
+            continue
+        elif isinstance(value, (bool, six.string_types, numbers.Real)):
+            real_md[key] = value
+        elif isinstance(value, numbers.Complex):
+            complex_md[key] = [value.real, value.imag]
+        else:
+            raise NotImplementedError("Cannot save impedance matrix metadata "
+                                      "%s of type %s" % (key, type(value)))
+
+    metadata = {'type': 'impedance',
+                'class': type(Z).__name__,
+                'operator': type(Z.md['operator']).__name__,
+                'basis': Z.basis_container.basis_class.__name__,
+                'sources': list(Z.sources),
+                'unknowns': list(Z.unknowns),
+                'part_o': describe_parts(Z.part_o),
+                'part_s': describe_parts(Z.part_s),
+                'metadata': real_md,
+                'complex_metadata': complex_md}
+
+    if not osp.exists(directory):
+        os.makedirs(directory)
+
+    metadata['matrices'] = save_arrays(directory, 'Z', Z.matrices)
+    if Z.deferred_derivatives:
+        metadata['derivatives'] = None
+    else:
+        metadata['derivatives'] = save_arrays(directory, 'der', Z.der)
+    if Z.der2 is None:
+        metadata['second_derivatives'] = None
+    else:
+        metadata['second_derivatives'] = save_arrays(directory, 'der2', Z.der2)
+
+    write_metadata(directory, metadata)
+
+
+def load_impedance(directory, sim, part_o=None, part_s=None, mmap=True):
+    """Load an impedance matrix, which was saved by `save_impedance`
+
+    Parameters
+    ----------
+    directory : string
+        The directory containing the saved matrix
+    sim : Simulation
+        The simulation containing the parts for which the matrix was found
+    part_o, part_s : Part, optional
+        The observer and source parts, which must contain the same parts in
+        the same locations as when the matrix was saved. If not specified, all
+        parts of the simulation are used.
+    mmap : boolean, optional
+        If True, the arrays are memory-mapped, so that they are only read
+        from disk when they are used
+
+    Returns
+    -------
+    Z : ImpedanceMatrixLA
+        The loaded impedance matrix
+    """
+    metadata = read_metadata(directory, 'impedance', sim.operator)
+    part_o = part_o or sim.parts
+    part_s = part_s or sim.parts
+    single_o = match_parts(metadata['part_o'], part_o, check_location=True)
+    single_s = match_parts(metadata['part_s'], part_s, check_location=True)
+
+    md = dict(metadata['metadata'])
+    for key, (real, imag) in metadata['complex_metadata'].items():
+        md[key] = real + 1j*imag
+    md['operator'] = sim.operator
+    md['position_hash'] = {part: part.position_hash for part in
+                           set(single_o) | set(single_s)}
+
+    lookup, shape = build_lookup(((part_o, sim.basis_container),
+                                  (part_s, sim.basis_container)))
+
+    if metadata['derivatives'] is None:
+        derivatives = False
+    else:
+        derivatives = load_arrays(directory, metadata['derivatives'], mmap,
+                                  lookup)
+
+    if metadata['second_derivatives'] is None:
+        second_derivatives = None
+    else:
+        second_derivatives = load_arrays(directory,
+                                         metadata['second_derivatives'], mmap,
+                                         lookup)
+
+    impedance_class = getattr(impedance, metadata['class'])
+    Z = impedance_class(part_o, part_s, sim.basis_container,
+                        tuple(metadata['sources']), tuple(metadata['unknowns']),
+                        md, derivatives=derivatives,
+                        second_derivatives=second_derivatives)
+
+    # replace the empty matrices, so that the loaded matrices are not copied
+    Z.matrices = load_arrays(directory, metadata['matrices'], mmap, lookup)
+    return Z
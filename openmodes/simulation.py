@@ -39,9 +39,11 @@ from openmodes.mesh import TriangularSurfaceMesh
 from openmodes.helpers import Identified
 from openmodes.material import FreeSpace, PecMaterial
 from openmodes.modes import Modes
-from openmodes.multipole import spherical_multipoles, multipole_fixed
+from openmodes.multipole import (spherical_multipoles, multipole_fixed,
+                                 CHUNK_ELEMENTS)
 from openmodes.constants import c
 from openmodes.array import LookupArray
+from openmodes.serialisation import load_modes, load_impedance
 
 
 class Simulation(Identified):
@@ -188,7 +190,8 @@ class Simulation(Identified):
                     logging.info(log_label+" %d/%d" % (freq_count, num_freqs))
                 yield freq_count, 2j*np.pi*freq
 
-    def impedance(self, s, parent=None):
+    def impedance(self, s, parent=None, frequency_derivatives=False,
+                  storage=None):
         """Evaluate the self and mutual impedances of all parts in the
         simulation. Return an `ImpedancePart` object which can calculate
         several derived impedance quantities
@@ -200,6 +203,14 @@ class Simulation(Identified):
         parent : Part, optional
             If specified, then only this part and its sub-parts will be
             calculated
+        frequency_derivatives : boolean, optional
+            If True, the frequency derivatives of the impedance matrix are
+            also calculated. Otherwise they are only calculated if they are
+            later accessed.
+        storage : ScratchStorage, optional
+            If specified, the impedance matrix is held in memory-mapped files
+            created by this object, allowing problems larger than the
+            available memory to be solved
 
         Returns
         -------
@@ -209,7 +220,26 @@ class Simulation(Identified):
         """
 
         parent = parent or self.parts
-        return self.operator.impedance(s, parent, parent)
+        return self.operator.impedance(s, parent, parent,
+                                       frequency_derivatives=frequency_derivatives,
+                                       storage=storage)
+
+    def update_impedance(self, Z):
+        """Update an impedance matrix previously calculated by `impedance`,
+        after some parts have been moved by `translate` or `rotate`. Only the
+        interactions with the moved parts are recalculated.
+
+        Parameters
+        ----------
+        Z : ImpedanceMatrixLA
+            The impedance matrix, which is modified in place
+
+        Returns
+        -------
+        moved : list
+            The parts which had been moved
+        """
+        return self.operator.update_impedance(Z)
 
     def source_vector(self, source_field, s, parent=None,
                       extinction_field=False):
@@ -222,7 +252,10 @@ class Simulation(Identified):
         Parameters
         ----------
         source_field: source object
-            The object specifying the source field for arbitrary frequencies
+            The object specifying the source field for arbitrary frequencies.
+            If it is a collection of sources, such as `PlaneWaveSources`,
+            then the source vector has a column for each source, and all
+            columns can be solved together.
         s: complex
             The frequency at which to evaluate the source
         parent : Part, optional
@@ -245,7 +278,7 @@ class Simulation(Identified):
 
     def estimate_poles(self, contour, parts=None, threshold=1e-14,
                        previous_result=None, cauchy_integral=True, modes=None,
-                       **kwargs):
+                       linearised_method='dense', **kwargs):
         """Estimate the location of poles and their modes by Cauchy integration
         or a simpler quasi-static method
 
@@ -256,6 +289,10 @@ class Simulation(Identified):
         parts: Part or list, optional
             Which particular part or parts to calculate poles for. If not
             specified, then the whole system will be used
+        linearised_method: string, optional
+            If `cauchy_integral` is False, selects how the linearised problem
+            is solved. Use 'arpack' to find only the requested modes, which
+            is much faster for large meshes.
 
         Returns
         -------
@@ -286,7 +323,8 @@ class Simulation(Identified):
                         previous = previous_result.modes_of_parts[part.unique_id]
                     res[part.unique_id] = estimate(contour, part, threshold,
                                                    previous, cauchy_integral,
-                                                   modes, iter_wrap=iter_wrap)
+                                                   modes, linearised_method,
+                                                   iter_wrap=iter_wrap)
 
             # Find the parent part it it already exists, otherwise create a
             # MultiPart to hold the various parts
@@ -301,20 +339,33 @@ class Simulation(Identified):
                 previous_result = previous_result.modes_of_parts[parts]
             res = {parts.unique_id: estimate(contour, parts, threshold,
                                              previous_result, cauchy_integral,
-                                             modes, iter_wrap=iter_wrap)}
+                                             modes, linearised_method,
+                                             iter_wrap=iter_wrap)}
             parent_part = parts
             parts = [parts]
            
                                      
         return Modes(parent_part, parts, res, self.operator, self.basis_container)
 
-    def refine_poles(self, estimates, rel_tol=1e-8, max_iter=40):
+    def refine_poles(self, estimates, rel_tol=1e-8, max_iter=40,
+                     cluster_tol=None, second_derivatives=False):
         """Refine the location of poles by iterative search
 
         Parameters
         ----------
         estimates: dict
             The result returned from estimate_poles
+        rel_tol: float, optional
+            The relative tolerance on the pole frequencies
+        max_iter: integer, optional
+            The maximum number of iterations
+        cluster_tol: float, optional
+            Poles whose estimates are separated by less than this relative
+            distance are refined together by block Newton iteration. Useful
+            for degenerate modes of symmetric structures.
+        second_derivatives: boolean, optional
+            Use the second frequency derivatives of the impedance matrix to
+            refine the poles by Halley iteration, if the operator supports it.
 
         Results
         -------
@@ -331,11 +382,53 @@ class Simulation(Identified):
             uid = part.unique_id
             if uid not in refined:
                 refined[uid] = self.operator.refine_poles(estimates.modes_of_parts[uid],
-                                                          part, rel_tol, max_iter, iter_wrap)
+                                                          part, rel_tol, max_iter, iter_wrap,
+                                                          cluster_tol,
+                                                          second_derivatives)
 
         return Modes(estimates.parent_part, estimates.parts, refined,
                      self.operator, self.basis_container)
 
+    def load_modes(self, directory, parent_part=None):
+        """Load modes which were previously saved by
+        `openmodes.serialisation.save_modes`, possibly from a different
+        simulation containing the same parts
+
+        Parameters
+        ----------
+        directory : string
+            The directory containing the saved modes
+        parent_part : Part, optional
+            The part containing the same parts as when the modes were saved.
+            If not specified, all parts in the simulation are used.
+
+        Returns
+        -------
+        modes : Modes
+            The modes, with their arrays memory-mapped from the saved files
+        """
+        return load_modes(directory, self, parent_part)
+
+    def load_impedance(self, directory, parent=None):
+        """Load an impedance matrix which was previously saved by
+        `openmodes.serialisation.save_impedance`, possibly from a different
+        simulation containing the same parts in the same locations
+
+        Parameters
+        ----------
+        directory : string
+            The directory containing the saved matrix
+        parent : Part, optional
+            The part containing the same parts as when the matrix was saved.
+            If not specified, all parts in the simulation are used.
+
+        Returns
+        -------
+        Z : ImpedanceMatrixLA
+            The impedance matrix, memory-mapped from the saved files
+        """
+        return load_impedance(directory, self, parent, parent)
+
     def empty_array(self, part=None, extra_dims=()):
         """
         Create an empty array of the appropriate size to contain solutions for
@@ -500,15 +593,24 @@ class Simulation(Identified):
         phase between electric and magnetic should produce correct scattering
         cross-section.
 
+        Many solutions can be decomposed at once, such as all the columns of
+        `Modes.vr`, or the solutions of a frequency sweep stacked as columns.
+        The interpolation onto the integration points is then performed once
+        for all solutions, and the sums over the points become matrix
+        products.
+
         Parameters
         ----------
         solution : LookupArray
             The solution to decompose. It must include electric current "J",
-            and may optionally also include magnetic current "M".
+            and may optionally also include magnetic current "M". Any
+            dimensions after the first are treated as separate solutions.
         order: integer
             The order of the multipole expansion to perform
-        s : complex
-            The complex frequency at which to perform the decomposition
+        s : complex or array
+            The complex frequency at which to perform the decomposition. If
+            there are several solutions, then this may be an array of
+            frequencies, one for each solution, such as `Modes.s`.
         origin : array (len 3), optional
             The origin about which to calculate the expansion. If not
             specified, the global coordinate origin is used.
@@ -519,49 +621,78 @@ class Simulation(Identified):
             The spherical multipole coefficients, with indices l, m.
             Note that vales of |m| > l are invalid, so these parts of the
             arrays are undefined. Negative m are obtained with negative
-            array indices.
+            array indices. If there are several solutions, the arrays have
+            additional dimensions over the solutions.
         """
         container, parent_part = solution.lookup[1][1:]
 
-        a_e = np.zeros((order+1, 2*order+1), np.complex128)
-        a_m = np.zeros_like(a_e)
+        extra_shape = solution.simple_view().shape[1:]
+        num_solutions = int(np.prod(extra_shape))
+
+        s_array = np.asarray(s).view(np.ndarray).ravel()
+        if len(s_array) == 1:
+            s_array = np.repeat(s_array, num_solutions)
+        elif len(s_array) != num_solutions:
+            raise ValueError("Got %d frequencies for %d solutions" %
+                             (len(s_array), num_solutions))
 
-        k = (s/c/1j)
-        if np.isreal(k):
+        k = (s_array/c/1j)
+        if np.all(np.isreal(k)):
             # Suppress false warnings when dropping an imaginary part of 0
             k = k.real
+        eta = np.broadcast_to(self.background_material.eta(s_array),
+                              s_array.shape)
+
+        a_e = np.zeros((order+1, 2*order+1, num_solutions), np.complex128)
+        a_m = np.zeros_like(a_e)
 
         for part in parent_part.iter_single():
             basis = self.basis_container[part]
 
-            points, current_J = basis.interpolate_function(solution["J", part].simple_view(),
-                                                           int_weight=True, integration_rule=self.integration_rule,
-                                                           nodes=part.nodes)
+            points, interpolate = basis.interpolation_matrix(
+                                    part.nodes, self.integration_rule,
+                                    int_weight=True)
+            num_points = len(points)
+
+            J = solution["J", part].simple_view().reshape(len(basis), -1)
             try:
-                points, current_M = basis.interpolate_function(solution["M", part].simple_view(),
-                                                               int_weight=True, integration_rule=self.integration_rule,
-                                                               nodes=part.nodes)
+                M = solution["M", part].simple_view().reshape(len(basis), -1)
             except KeyError:
-                current_M = np.zeros_like(current_J)
+                M = None
 
             if origin is not None:
-                points -= origin
+                points = points - origin
 
-            cache_key = (part.position_hash, order)
+            # The fixed terms depend on the location of the points relative
+            # to the origin. The integration rule is the same for all parts.
+            cache_key = (part.position_hash, order,
+                         None if origin is None else tuple(origin))
             try:
                 fixed_terms = self.multipole_cache[cache_key]
             except KeyError:
                 fixed_terms = multipole_fixed(order, points)
                 self.multipole_cache[cache_key] = fixed_terms
 
-            n_e, n_m = spherical_multipoles(order, k, points, current_J,
-                                            1j*current_M,
-                                            self.background_material.eta(s),
-                                            fixed_terms)
-            a_e += n_e
-            a_m += n_m
-
-        return a_e, a_m
+            # Limit the size of the temporary arrays of Bessel functions
+            chunk = max(1, CHUNK_ELEMENTS//(num_points*(order+1)))
+            for start in range(0, num_solutions, chunk):
+                cols = slice(start, start+chunk)
+                current_J = interpolate.dot(J[:, cols]).reshape(num_points,
+                                                                3, -1)
+                if M is None:
+                    current_M = np.zeros_like(current_J)
+                else:
+                    current_M = interpolate.dot(M[:, cols]).reshape(
+                                                            num_points, 3, -1)
+
+                n_e, n_m = spherical_multipoles(order, k[cols], points,
+                                                current_J, 1j*current_M,
+                                                eta[cols], fixed_terms)
+                a_e[:, :, cols] += n_e
+                a_m[:, :, cols] += n_m
+
+        new_shape = a_e.shape[:2]+extra_shape
+        return a_e.reshape(new_shape), a_m.reshape(new_shape)
 
     def __iter_wrap(self, description):
         "Generate a wrapper iterator if using the notebook"
@@ -115,6 +115,99 @@ class PlaneWaveSource(object):
         return h_inc*np.exp(np.dot(r, -jk))[..., None]
 
 
+class PlaneWaveSources(object):
+    def __init__(self, sources):
+        """A collection of plane waves, whose fields are calculated together
+
+        The fields have an additional dimension for the plane waves, so that
+        the source vectors of all plane waves are found at once, as separate
+        columns of a single source vector.
+
+        Parameters
+        ----------
+        sources : list of PlaneWaveSource
+            The plane waves, which must all be in the same background
+            material
+        """
+        self.sources = list(sources)
+        if len(self.sources) == 0:
+            raise ValueError("At least one plane wave is required")
+
+        self.material = self.sources[0].material
+        if any(source.material != self.material for source in self.sources):
+            raise ValueError("All plane waves must be in the same background "
+                             "material")
+
+        self.e_inc = np.array([source.e_inc for source in self.sources])
+        self.k_hat = np.array([source.k_hat for source in self.sources])
+        self.h_inc = np.array([source.h_inc for source in self.sources])
+
+        # plane waves without power scaling are given a NaN incident power
+        self.p_inc = np.array([np.nan if source.p_inc is None else
+                               source.p_inc for source in self.sources])
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __getitem__(self, index):
+        return self.sources[index]
+
+    def scaling(self, s):
+        "The factor by which each field is scaled to give its incident power"
+        h_inc = self.h_inc/self.material.eta(s)
+        p_unscaled = np.sqrt(np.sum(np.cross(self.e_inc, h_inc.conj()).real,
+                                    axis=-1)**2)
+        scale = np.sqrt(self.p_inc/p_unscaled)
+        scale[np.isnan(self.p_inc)] = 1.0
+        return scale
+
+    def electric_field(self, s, r):
+        """Calculate the electric field distribution of all plane waves at a
+        given frequency
+
+        Parameters
+        ----------
+        s : complex
+            Complex frequency at which to evaluate fields
+        r : ndarray, real
+            The locations at which to calculate the field. This array can have
+            an arbitrary number of dimensions. The last dimension must of size
+            3, corresponding to the three cartesian coordinates
+
+        Returns
+        -------
+        E : ndarray, complex
+            An array with the dimensions of r, with an additional dimension
+            before the last for each plane wave
+        """
+        jk = self.k_hat*self.material.n(s)*s/c
+        e_inc = self.e_inc*self.scaling(s)[:, None]
+        return e_inc*np.exp(np.dot(r, -jk.T))[..., None]
+
+    def magnetic_field(self, s, r):
+        """Calculate the magnetic field distribution of all plane waves at a
+        given frequency
+
+        Parameters
+        ----------
+        s : complex
+            Complex frequency at which to evaluate fields
+        r : ndarray, real
+            The locations at which to calculate the field. This array can have
+            an arbitrary number of dimensions. The last dimension must of size
+            3, corresponding to the three cartesian coordinates
+
+        Returns
+        -------
+        H : ndarray, complex
+            An array with the dimensions of r, with an additional dimension
+            before the last for each plane wave
+        """
+        jk = self.k_hat*self.material.n(s)*s/c
+        h_inc = self.h_inc/self.material.eta(s)*self.scaling(s)[:, None]
+        return h_inc*np.exp(np.dot(r, -jk.T))[..., None]
+
+
 def planewave_angles(theta, phi, alpha, degrees=True, material=FreeSpace,
                      p_inc=1.0):
     """Create a plane-wave with direction and (linear) polarisation specified
@@ -0,0 +1,22 @@
+!     -*- f90 -*-
+!     This file is autogenerated with f2py (version:1.23.5)
+!     It contains Fortran 90 wrappers to fortran functions.
+
+      
+      subroutine f2pyinitcore_for(f2pysetupfunc)
+      use core_for, only : c
+      use core_for, only : pi
+      external f2pysetupfunc
+      call f2pysetupfunc(c,pi)
+      end subroutine f2pyinitcore_for
+
+      
+      subroutine f2pyinitconstants(f2pysetupfunc)
+      use constants, only : sp
+      use constants, only : dp
+      use constants, only : wp
+      external f2pysetupfunc
+      call f2pysetupfunc(sp,dp,wp)
+      end subroutine f2pyinitconstants
+
+
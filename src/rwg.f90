@@ -254,8 +254,9 @@ end subroutine
 
 subroutine Z_EFIE_faces_mutual(num_nodes_o, num_triangles_o, num_nodes_s, num_triangles_s, &
                                num_integration, nodes_o, triangle_nodes_o, nodes_s, triangle_nodes_s, &
-                                gamma_0, xi_eta_eval, weights, &
-                                A_face, phi_face, A_dgamma_face, phi_dgamma_face)
+                                gamma_0, xi_eta_eval, weights, derivative_order, num_dgamma, num_d2gamma, &
+                                A_face, phi_face, A_dgamma_face, phi_dgamma_face, &
+                                A_d2gamma_face, phi_d2gamma_face)
     ! Calculate the face to face interaction terms used to build the impedance matrix
     ! For mutual coupling terms between different parts
     !
@@ -266,11 +267,20 @@ subroutine Z_EFIE_faces_mutual(num_nodes_o, num_triangles_o, num_nodes_s, num_tr
     ! omega - evaulation frequency in rad/s
     ! gamma_0 - complex wavenumber of background
     ! xi_eta_eval, weights - quadrature rule over the triangle (weights normalised to 0.5)
+    ! derivative_order - if 0, only the values are calculated, if 1 the first
+    !                    derivatives with respect to gamma_0 are also calculated,
+    !                    and if 2 the second derivatives as well. The arrays of
+    !                    derivatives which are not calculated are empty
+    ! num_dgamma - equal to (derivative_order+1)/2, so that the arrays of first
+    !              derivatives have zero size unless they are calculated
+    ! num_d2gamma - equal to derivative_order/2, so that the arrays of second
+    !               derivatives have zero size unless they are calculated
 
     use core_for
     implicit none
 
     integer, intent(in) :: num_nodes_o, num_triangles_o, num_nodes_s, num_triangles_s, num_integration
+    integer, intent(in) :: derivative_order, num_dgamma, num_d2gamma
 
     real(WP), intent(in), dimension(0:num_nodes_o-1, 0:2) :: nodes_o
     integer, intent(in), dimension(0:num_triangles_o-1, 0:2) :: triangle_nodes_o
@@ -282,18 +292,27 @@ subroutine Z_EFIE_faces_mutual(num_nodes_o, num_triangles_o, num_nodes_s, num_tr
     real(WP), intent(in), dimension(0:num_integration-1, 0:1) :: xi_eta_eval
     real(WP), intent(in), dimension(0:num_integration-1) :: weights
 
-    complex(WP), intent(out), dimension(0:num_triangles_o-1, 0:2, 0:num_triangles_s-1, 0:2) :: A_face, A_dgamma_face
-    complex(WP), intent(out), dimension(0:num_triangles_o-1, 0:num_triangles_s-1) :: phi_face, phi_dgamma_face
+    complex(WP), intent(out), dimension(0:num_triangles_o-1, 0:2, 0:num_triangles_s-1, 0:2) :: A_face
+    complex(WP), intent(out), dimension(0:num_triangles_o-1, 0:num_triangles_s-1) :: phi_face
+    complex(WP), intent(out), dimension(0:num_dgamma*num_triangles_o-1, 0:2, &
+                                        0:num_dgamma*num_triangles_s-1, 0:2) :: A_dgamma_face
+    complex(WP), intent(out), dimension(0:num_dgamma*num_triangles_o-1, &
+                                        0:num_dgamma*num_triangles_s-1) :: phi_dgamma_face
+    complex(WP), intent(out), dimension(0:num_d2gamma*num_triangles_o-1, 0:2, &
+                                        0:num_d2gamma*num_triangles_s-1, 0:2) :: A_d2gamma_face
+    complex(WP), intent(out), dimension(0:num_d2gamma*num_triangles_o-1, &
+                                        0:num_d2gamma*num_triangles_s-1) :: phi_d2gamma_face
     
     real(WP), dimension(0:2, 0:2) :: nodes_p, nodes_q
-    complex(WP), dimension(3, 3) :: I_A, I_A_dgamma
-    complex(WP) :: I_phi, I_phi_dgamma
+    complex(WP), dimension(3, 3) :: I_A, I_A_dgamma, I_A_d2gamma
+    complex(WP) :: I_phi, I_phi_dgamma, I_phi_d2gamma
 
     integer :: p, q
 
     ! calculate all the integrations for each face pair
     !$OMP PARALLEL DO SCHEDULE(DYNAMIC) DEFAULT(SHARED) &
-    !$OMP PRIVATE (p, q, nodes_p, nodes_q, I_A, I_phi)
+    !$OMP PRIVATE (p, q, nodes_p, nodes_q, I_A, I_phi, I_A_dgamma, I_phi_dgamma, &
+    !$OMP I_A_d2gamma, I_phi_d2gamma)
     do p = 0,num_triangles_o-1 ! p is the index of the observer face:
         nodes_p = nodes_o(triangle_nodes_o(p, :), :)
         do q = 0,num_triangles_s-1 ! q is the index of the source face
@@ -303,13 +322,21 @@ subroutine Z_EFIE_faces_mutual(num_nodes_o, num_triangles_o, num_nodes_s, num_tr
             ! As per RWG, triangle area must be cancelled in the integration
             ! for non-singular terms the weights are unity and we DON't want to scale to triangle area
             call EFIE_face_integrals(num_integration, xi_eta_eval, weights, nodes_q, &
-                                num_integration, xi_eta_eval, weights, nodes_p, gamma_0, 0, I_A, I_phi, I_A_dgamma, I_phi_dgamma)
+                                num_integration, xi_eta_eval, weights, nodes_p, gamma_0, 0, derivative_order, &
+                                I_A, I_phi, I_A_dgamma, I_phi_dgamma, I_A_d2gamma, I_phi_d2gamma)
             ! by symmetry of Galerkin procedure, transposed components are identical (but transposed node indices)
             A_face(p, :, q, :) = I_A
             phi_face(p, q) = I_phi
 
-            A_dgamma_face(p, :, q, :) = I_A_dgamma
-            phi_dgamma_face(p, q) = I_phi_dgamma
+            if (derivative_order > 0) then
+                A_dgamma_face(p, :, q, :) = I_A_dgamma
+                phi_dgamma_face(p, q) = I_phi_dgamma
+            end if
+
+            if (derivative_order > 1) then
+                A_d2gamma_face(p, :, q, :) = I_A_d2gamma
+                phi_d2gamma_face(p, q) = I_phi_d2gamma
+            end if
             
         end do
     end do
@@ -319,7 +346,8 @@ end subroutine Z_EFIE_faces_mutual
 
 
 subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta_o, &
-        weights_o, nodes_o_in, gamma_0, degree_singular, I_A, I_phi, I_A_dgamma, I_phi_dgamma)
+        weights_o, nodes_o_in, gamma_0, degree_singular, derivative_order, &
+        I_A, I_phi, I_A_dgamma, I_phi_dgamma, I_A_d2gamma, I_phi_d2gamma)
     ! Fully integrated over source and observer, vector kernel of the MOM for RWG basis functions
     ! NB: includes the 1/4A**2 prefactor
     !
@@ -328,6 +356,7 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
     ! nodes_s/o - the nodes of the source and observer triangles
     ! gamma_0 - *complex* free space wavenumber, j*k_0
     ! nodes - the position of the triangle nodes
+    ! derivative_order - if 2, then second derivatives are calculated
 
     use core_for
     implicit none
@@ -343,15 +372,15 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
     real(WP), intent(in), dimension(0:n_o-1, 2) :: xi_eta_o
     real(WP), intent(in), dimension(0:n_o-1) :: weights_o
 
-    integer, intent(in) :: degree_singular
+    integer, intent(in) :: degree_singular, derivative_order
 
-    complex(WP), intent(out), dimension(3, 3) :: I_A, I_A_dgamma
-    complex(WP), intent(out) :: I_phi, I_phi_dgamma
+    complex(WP), intent(out), dimension(3, 3) :: I_A, I_A_dgamma, I_A_d2gamma
+    complex(WP), intent(out) :: I_phi, I_phi_dgamma, I_phi_d2gamma
 
     real(WP) :: xi_s, eta_s, zeta_s, xi_o, eta_o, zeta_o, R, w_s, w_o
     real(WP), dimension(3) :: r_s, r_o
-    real(WP), dimension(3, 3) :: rho_s, rho_o
-    complex(WP) :: g, g_dgamma
+    real(WP), dimension(3, 3) :: rho_s, rho_o, rho_rho
+    complex(WP) :: g, g_dgamma, g_d2gamma, exp_gr
     integer :: count_s, count_o, uu!, vv !, ww
     real(WP), dimension(3, 3) :: nodes_s, nodes_o
 
@@ -360,8 +389,8 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
 
     ! explictly copying the output arrays gives some small speedup,
     ! possibly by avoiding access to the shared target array
-    complex(WP) :: I_phi_int, I_phi_dgamma_int
-    complex(WP), dimension(3, 3) :: I_A_int, I_A_dgamma_int
+    complex(WP) :: I_phi_int, I_phi_dgamma_int, I_phi_d2gamma_int
+    complex(WP), dimension(3, 3) :: I_A_int, I_A_dgamma_int, I_A_d2gamma_int
 
     
     ! transpose for speed
@@ -374,6 +403,9 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
     I_A_dgamma_int = 0.0
     I_phi_dgamma_int = 0.0
 
+    I_A_d2gamma_int = 0.0
+    I_phi_d2gamma_int = 0.0
+
 
     ! The loop over the source is repeated many times. Therefore pre-calculate the source
     ! quantities to optimise speed (gives minor benefit)
@@ -415,28 +447,43 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
 
             R = sqrt(sum((r_s - r_o)**2))
 
-            g_dgamma = -exp(-gamma_0*R)
+            exp_gr = exp(-gamma_0*R)
+            g_dgamma = -exp_gr
+            g_d2gamma = R*exp_gr
                         
             if (degree_singular == 0) then 
-                g = exp(-gamma_0*R)/R
+                g = exp_gr/R
             else
                 if (abs(gamma_0*R) < 1e-8) then
                     ! give the explicit limit for R=0 
                     ! (could use a Taylor expansion for small k_0*R?)
                     g = -gamma_0
                 else
-                    g = (exp(-gamma_0*R) - 1.0)/R
+                    g = (exp_gr - 1.0)/R
                 end if
                 if (degree_singular > 1) then
+                    ! the derivatives of the extracted R term are added
+                    ! analytically by the caller
                     g = g - (gamma_0**2)*R/2.0
+                    g_dgamma = g_dgamma - gamma_0*R
+                    g_d2gamma = g_d2gamma - R
                 end if
             end if
 
+            rho_rho = matmul(transpose(rho_o), rho_s)
+
             I_phi_int = I_phi_int + g*w_s*w_o
-            I_A_int = I_A_int + g*w_s*w_o*matmul(transpose(rho_o), rho_s)
+            I_A_int = I_A_int + g*w_s*w_o*rho_rho
+
+            if (derivative_order > 0) then
+                I_phi_dgamma_int = I_phi_dgamma_int + g_dgamma*w_s*w_o
+                I_A_dgamma_int = I_A_dgamma_int + g_dgamma*w_s*w_o*rho_rho
+            end if
 
-            I_phi_dgamma_int = I_phi_dgamma_int + g_dgamma*w_s*w_o
-            I_A_dgamma_int = I_A_dgamma_int + g_dgamma*w_s*w_o*matmul(transpose(rho_o), rho_s)            
+            if (derivative_order > 1) then
+                I_phi_d2gamma_int = I_phi_d2gamma_int + g_d2gamma*w_s*w_o
+                I_A_d2gamma_int = I_A_d2gamma_int + g_d2gamma*w_s*w_o*rho_rho
+            end if
             
         end do
     end do
@@ -445,13 +492,17 @@ subroutine EFIE_face_integrals(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta
     I_phi = I_phi_int
     I_A_dgamma = I_A_dgamma_int
     I_phi_dgamma = I_phi_dgamma_int
+    I_A_d2gamma = I_A_d2gamma_int
+    I_phi_d2gamma = I_phi_d2gamma_int
 
 end subroutine EFIE_face_integrals
 
 
 subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_singular, degree_singular, &
                                 nodes, triangle_nodes, gamma_0, xi_eta_eval, weights, phi_precalc, A_precalc, &
-                                indices_precalc, indptr_precalc, A_face, phi_face, A_dgamma_face, phi_dgamma_face)
+                                indices_precalc, indptr_precalc, derivative_order, num_dgamma, num_d2gamma, &
+                                A_face, phi_face, A_dgamma_face, phi_dgamma_face, &
+                                A_d2gamma_face, phi_d2gamma_face)
     ! Calculate the face to face interaction terms used to build the impedance matrix
     !
     ! As per Rao, Wilton, Glisson, IEEE Trans AP-30, 409 (1982)
@@ -463,11 +514,20 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
     ! gamma_0 - complex background wavenumber
     ! xi_eta_eval, weights - quadrature rule over the triangle (weights normalised to 0.5)
     ! A_precalc, phi_precalc - precalculated 1/R singular terms
+    ! derivative_order - if 0, only the values are calculated, if 1 the first
+    !                    derivatives with respect to gamma_0 are also calculated,
+    !                    and if 2 the second derivatives as well. The arrays of
+    !                    derivatives which are not calculated are empty
+    ! num_dgamma - equal to (derivative_order+1)/2, so that the arrays of first
+    !              derivatives have zero size unless they are calculated
+    ! num_d2gamma - equal to derivative_order/2, so that the arrays of second
+    !               derivatives have zero size unless they are calculated
 
     use core_for
     implicit none
 
     integer, intent(in) :: num_nodes, num_triangles, num_integration, num_singular, degree_singular
+    integer, intent(in) :: derivative_order, num_dgamma, num_d2gamma
     ! f2py intent(hide) :: num_nodes, num_triangles, num_integration, num_singular
 
     real(WP), intent(in), dimension(0:num_nodes-1, 0:2) :: nodes
@@ -483,18 +543,27 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
     integer, intent(in), dimension(0:num_singular-1) :: indices_precalc
     integer, intent(in), dimension(0:num_triangles) :: indptr_precalc
 
-    complex(WP), intent(out), dimension(0:num_triangles-1, 0:2, 0:num_triangles-1, 0:2) :: A_face, A_dgamma_face
-    complex(WP), intent(out), dimension(0:num_triangles-1, 0:num_triangles-1) :: phi_face, phi_dgamma_face
+    complex(WP), intent(out), dimension(0:num_triangles-1, 0:2, 0:num_triangles-1, 0:2) :: A_face
+    complex(WP), intent(out), dimension(0:num_triangles-1, 0:num_triangles-1) :: phi_face
+    complex(WP), intent(out), dimension(0:num_dgamma*num_triangles-1, 0:2, &
+                                        0:num_dgamma*num_triangles-1, 0:2) :: A_dgamma_face
+    complex(WP), intent(out), dimension(0:num_dgamma*num_triangles-1, &
+                                        0:num_dgamma*num_triangles-1) :: phi_dgamma_face
+    complex(WP), intent(out), dimension(0:num_d2gamma*num_triangles-1, 0:2, &
+                                        0:num_d2gamma*num_triangles-1, 0:2) :: A_d2gamma_face
+    complex(WP), intent(out), dimension(0:num_d2gamma*num_triangles-1, &
+                                        0:num_d2gamma*num_triangles-1) :: phi_d2gamma_face
        
     real(WP), dimension(0:2, 0:2) :: nodes_p, nodes_q
-    complex(WP), dimension(3, 3) :: I_A, I_A_dgamma
-    complex(WP) :: I_phi, I_phi_dgamma
+    complex(WP), dimension(3, 3) :: I_A, I_A_dgamma, I_A_d2gamma
+    complex(WP) :: I_phi, I_phi_dgamma, I_phi_d2gamma
 
     integer :: p, q, index_singular
 
     ! calculate all the integrations for each face pair
     !$OMP PARALLEL DO SCHEDULE(DYNAMIC) DEFAULT(SHARED) &
-    !$OMP PRIVATE (p, q, nodes_p, nodes_q, I_A, I_phi, index_singular)
+    !$OMP PRIVATE (p, q, nodes_p, nodes_q, I_A, I_phi, index_singular, &
+    !$OMP I_A_dgamma, I_phi_dgamma, I_A_d2gamma, I_phi_d2gamma)
     do p = 0,num_triangles-1 ! p is the index of the observer face:
         nodes_p = nodes(triangle_nodes(p, :), :)
         do q = 0,p ! q is the index of the source face, need for elements below diagonal
@@ -504,7 +573,8 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
                 ! triangles have one or more common nodes, perform singularity extraction
                 call EFIE_face_integrals(num_integration, xi_eta_eval, weights, nodes_q, &
                                          num_integration, xi_eta_eval, weights, nodes_p, gamma_0, &
-                                         degree_singular, I_A, I_phi, I_A_dgamma, I_phi_dgamma)
+                                         degree_singular, derivative_order, I_A, I_phi, &
+                                         I_A_dgamma, I_phi_dgamma, I_A_d2gamma, I_phi_d2gamma)
         
                 ! the singular 1/R components are pre-calculated
                 index_singular = scr_index(p, q, indices_precalc, indptr_precalc)
@@ -512,10 +582,16 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
                 I_A = I_A + A_precalc(index_singular, 0, :, :)
                 I_phi = I_phi + phi_precalc(index_singular, 0)
                 
-                ! The R term
+                ! The R term, and its derivatives
                 if (degree_singular > 1) then
                     I_A = I_A + A_precalc(index_singular, 1, :, :)*gamma_0**2/2
                     I_phi = I_phi + phi_precalc(index_singular, 1)*gamma_0**2/2
+
+                    I_A_dgamma = I_A_dgamma + A_precalc(index_singular, 1, :, :)*gamma_0
+                    I_phi_dgamma = I_phi_dgamma + phi_precalc(index_singular, 1)*gamma_0
+
+                    I_A_d2gamma = I_A_d2gamma + A_precalc(index_singular, 1, :, :)
+                    I_phi_d2gamma = I_phi_d2gamma + phi_precalc(index_singular, 1)
                 end if
         
             else
@@ -524,7 +600,8 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
                 ! for non-singular terms the weights are unity and we DON't want to scale to triangle area
                 call EFIE_face_integrals(num_integration, xi_eta_eval, weights, nodes_q, &
                                          num_integration, xi_eta_eval, weights, nodes_p, &
-                                         gamma_0, 0, I_A, I_phi, I_A_dgamma, I_phi_dgamma)
+                                         gamma_0, 0, derivative_order, I_A, I_phi, &
+                                         I_A_dgamma, I_phi_dgamma, I_A_d2gamma, I_phi_d2gamma)
             end if
 
             ! by symmetry of Galerkin procedure, transposed components are identical (but transposed node indices)
@@ -533,10 +610,19 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
             phi_face(p, q) = I_phi
             phi_face(q, p) = I_phi
 
-            A_dgamma_face(p, :, q, :) = I_A_dgamma
-            A_dgamma_face(q, :, p, :) = transpose(I_A_dgamma)
-            phi_dgamma_face(p, q) = I_phi_dgamma
-            phi_dgamma_face(q, p) = I_phi_dgamma
+            if (derivative_order > 0) then
+                A_dgamma_face(p, :, q, :) = I_A_dgamma
+                A_dgamma_face(q, :, p, :) = transpose(I_A_dgamma)
+                phi_dgamma_face(p, q) = I_phi_dgamma
+                phi_dgamma_face(q, p) = I_phi_dgamma
+            end if
+
+            if (derivative_order > 1) then
+                A_d2gamma_face(p, :, q, :) = I_A_d2gamma
+                A_d2gamma_face(q, :, p, :) = transpose(I_A_d2gamma)
+                phi_d2gamma_face(p, q) = I_phi_d2gamma
+                phi_d2gamma_face(q, p) = I_phi_d2gamma
+            end if
             
         end do
     end do
@@ -544,6 +630,257 @@ subroutine Z_EFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
 
 end subroutine Z_EFIE_faces_self
 
+subroutine EFIE_face_integrals_series(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta_o, &
+        weights_o, nodes_o_in, num_terms, degree_singular, I_A, I_phi)
+    ! Coefficients of the power series in gamma_0 of the face integrals in
+    ! EFIE_face_integrals, i.e. the kernel exp(-gamma_0*R)/R is replaced by
+    ! (-R)**n/(n!*R) for the term n
+    !
+    ! xi_eta_s/o - list of coordinate pairs in source/observer triangle
+    ! weights_s/o - the integration weights of the source and observer
+    ! nodes_s/o - the nodes of the source and observer triangles
+    ! num_terms - the number of terms in the series
+    ! degree_singular - the number of singular terms which will be added
+    !                   analytically by the caller, and are excluded here
+
+    use core_for
+    implicit none
+
+    integer, intent(in) :: n_s, n_o, num_terms
+    real(WP), dimension(3, 3), intent(in) :: nodes_s_in, nodes_o_in
+
+    real(WP), intent(in), dimension(0:n_s-1, 2) :: xi_eta_s
+    real(WP), intent(in), dimension(0:n_s-1) :: weights_s
+
+    real(WP), intent(in), dimension(0:n_o-1, 2) :: xi_eta_o
+    real(WP), intent(in), dimension(0:n_o-1) :: weights_o
+
+    integer, intent(in) :: degree_singular
+
+    real(WP), intent(out), dimension(3, 3, 0:num_terms-1) :: I_A
+    real(WP), intent(out), dimension(0:num_terms-1) :: I_phi
+
+    real(WP) :: xi_s, eta_s, zeta_s, xi_o, eta_o, zeta_o, R, w_s, w_o, g
+    real(WP), dimension(3) :: r_s, r_o
+    real(WP), dimension(3, 3) :: rho_s, rho_o, rho_rho
+    integer :: count_s, count_o, uu, n
+    real(WP), dimension(3, 3) :: nodes_s, nodes_o
+
+    real(WP), dimension(3, 0:n_s-1) :: r_s_table
+    real(WP), dimension(3, 3, 0:n_s-1) :: rho_s_table
+
+    ! transpose for speed
+    nodes_s = transpose(nodes_s_in)
+    nodes_o = transpose(nodes_o_in)
+
+    I_A = 0.0
+    I_phi = 0.0
+
+    do count_s = 0,n_s-1
+
+        xi_s = xi_eta_s(count_s, 1)
+        eta_s = xi_eta_s(count_s, 2)
+
+        zeta_s = 1.0 - eta_s - xi_s
+        r_s = xi_s*nodes_s(:, 1) + eta_s*nodes_s(:, 2) + zeta_s*nodes_s(:, 3)
+        r_s_table(:, count_s) = r_s
+
+        forall (uu=1:3) rho_s_table(:, uu, count_s) = r_s - nodes_s(:, uu)
+
+    end do
+
+    do count_o = 0,n_o-1
+
+        w_o = weights_o(count_o)
+
+        xi_o = xi_eta_o(count_o, 1)
+        eta_o = xi_eta_o(count_o, 2)
+        zeta_o = 1.0 - eta_o - xi_o
+
+        r_o = xi_o*nodes_o(:, 1) + eta_o*nodes_o(:, 2) + zeta_o*nodes_o(:, 3)
+
+        forall (uu=1:3) rho_o(:, uu) = r_o - nodes_o(:, uu)
+
+        do count_s = 0,n_s-1
+    
+            w_s = weights_s(count_s)
+
+            r_s = r_s_table(:, count_s)
+            rho_s = rho_s_table(:, :, count_s)
+
+            R = sqrt(sum((r_s - r_o)**2))
+            rho_rho = matmul(transpose(rho_o), rho_s)
+
+            ! The terms are calculated recursively, avoiding division by R
+            ! which may be zero for self terms. Terms which are integrated
+            ! analytically are skipped.
+            do n = 0,num_terms-1
+                if (n == 0) then
+                    if (degree_singular > 0) cycle
+                    g = 1.0/R
+                elseif (n == 1) then
+                    g = -1.0
+                else
+                    g = -g*R/n
+                end if
+
+                if (degree_singular > 1 .and. n == 2) cycle
+
+                I_phi(n) = I_phi(n) + g*w_s*w_o
+                I_A(:, :, n) = I_A(:, :, n) + g*w_s*w_o*rho_rho
+            end do
+            
+        end do
+    end do
+
+end subroutine EFIE_face_integrals_series
+
+
+subroutine Z_EFIE_faces_series_self(num_nodes, num_triangles, num_integration, num_singular, degree_singular, &
+                                nodes, triangle_nodes, xi_eta_eval, weights, phi_precalc, A_precalc, &
+                                indices_precalc, indptr_precalc, num_terms, A_face, phi_face)
+    ! Calculate the coefficients of the power series in gamma_0 of the face to
+    ! face interaction terms, for the self impedance of a part
+    !
+    ! The coefficients are independent of frequency, so that the impedance
+    ! at any frequency can be found as a sum of these terms, provided that
+    ! gamma_0 multiplied by the size of the part is small.
+    !
+    ! nodes - position of all the triangle nodes
+    ! xi_eta_eval, weights - quadrature rule over the triangle (weights normalised to 0.5)
+    ! A_precalc, phi_precalc - precalculated 1/R and R singular terms
+    ! num_terms - the number of terms in the series
+
+    use core_for
+    implicit none
+
+    integer, intent(in) :: num_nodes, num_triangles, num_integration, num_singular, degree_singular
+    integer, intent(in) :: num_terms
+    ! f2py intent(hide) :: num_nodes, num_triangles, num_integration, num_singular
+
+    real(WP), intent(in), dimension(0:num_nodes-1, 0:2) :: nodes
+    integer, intent(in), dimension(0:num_triangles-1, 0:2) :: triangle_nodes
+
+    real(WP), intent(in), dimension(0:num_integration-1, 0:1) :: xi_eta_eval
+    real(WP), intent(in), dimension(0:num_integration-1) :: weights
+
+    real(WP), intent(in), dimension(0:num_singular-1, 0:degree_singular-1) :: phi_precalc
+    real(WP), intent(in), dimension(0:num_singular-1, 0:degree_singular-1, 3, 3) :: A_precalc
+    integer, intent(in), dimension(0:num_singular-1) :: indices_precalc
+    integer, intent(in), dimension(0:num_triangles) :: indptr_precalc
+
+    real(WP), intent(out), dimension(0:num_triangles-1, 0:2, 0:num_triangles-1, 0:2, 0:num_terms-1) :: A_face
+    real(WP), intent(out), dimension(0:num_triangles-1, 0:num_triangles-1, 0:num_terms-1) :: phi_face
+       
+    real(WP), dimension(0:2, 0:2) :: nodes_p, nodes_q
+    real(WP), dimension(3, 3, 0:num_terms-1) :: I_A
+    real(WP), dimension(0:num_terms-1) :: I_phi
+
+    integer :: p, q, n, index_singular
+
+    ! calculate all the integrations for each face pair
+    !$OMP PARALLEL DO SCHEDULE(DYNAMIC) DEFAULT(SHARED) &
+    !$OMP PRIVATE (p, q, n, nodes_p, nodes_q, I_A, I_phi, index_singular)
+    do p = 0,num_triangles-1 ! p is the index of the observer face:
+        nodes_p = nodes(triangle_nodes(p, :), :)
+        do q = 0,p ! q is the index of the source face, need for elements below diagonal
+
+            nodes_q = nodes(triangle_nodes(q, :), :)
+            if (any(triangle_nodes(p, :) == triangle_nodes(q, :))) then
+                ! triangles have one or more common nodes, perform singularity extraction
+                call EFIE_face_integrals_series(num_integration, xi_eta_eval, weights, nodes_q, &
+                                         num_integration, xi_eta_eval, weights, nodes_p, &
+                                         num_terms, degree_singular, I_A, I_phi)
+        
+                ! the singular 1/R components are pre-calculated
+                index_singular = scr_index(p, q, indices_precalc, indptr_precalc)
+
+                I_A(:, :, 0) = I_A(:, :, 0) + A_precalc(index_singular, 0, :, :)
+                I_phi(0) = I_phi(0) + phi_precalc(index_singular, 0)
+                
+                ! The R term
+                if (degree_singular > 1 .and. num_terms > 2) then
+                    I_A(:, :, 2) = I_A(:, :, 2) + A_precalc(index_singular, 1, :, :)/2
+                    I_phi(2) = I_phi(2) + phi_precalc(index_singular, 1)/2
+                end if
+        
+            else
+                ! just perform regular integration
+                call EFIE_face_integrals_series(num_integration, xi_eta_eval, weights, nodes_q, &
+                                         num_integration, xi_eta_eval, weights, nodes_p, &
+                                         num_terms, 0, I_A, I_phi)
+            end if
+
+            ! by symmetry of Galerkin procedure, transposed components are identical (but transposed node indices)
+            do n = 0,num_terms-1
+                A_face(p, :, q, :, n) = I_A(:, :, n)
+                A_face(q, :, p, :, n) = transpose(I_A(:, :, n))
+            end do
+            phi_face(p, q, :) = I_phi
+            phi_face(q, p, :) = I_phi
+
+        end do
+    end do
+    !$OMP END PARALLEL DO
+
+end subroutine Z_EFIE_faces_series_self
+
+
+subroutine Z_EFIE_faces_series_mutual(num_nodes_o, num_triangles_o, num_nodes_s, num_triangles_s, &
+                               num_integration, nodes_o, triangle_nodes_o, nodes_s, triangle_nodes_s, &
+                                xi_eta_eval, weights, num_terms, A_face, phi_face)
+    ! Calculate the coefficients of the power series in gamma_0 of the face to
+    ! face interaction terms, for mutual coupling terms between different parts
+    !
+    ! xi_eta_eval, weights - quadrature rule over the triangle (weights normalised to 0.5)
+    ! num_terms - the number of terms in the series
+
+    use core_for
+    implicit none
+
+    integer, intent(in) :: num_nodes_o, num_triangles_o, num_nodes_s, num_triangles_s, num_integration
+    integer, intent(in) :: num_terms
+
+    real(WP), intent(in), dimension(0:num_nodes_o-1, 0:2) :: nodes_o
+    integer, intent(in), dimension(0:num_triangles_o-1, 0:2) :: triangle_nodes_o
+    real(WP), intent(in), dimension(0:num_nodes_s-1, 0:2) :: nodes_s
+    integer, intent(in), dimension(0:num_triangles_s-1, 0:2) :: triangle_nodes_s
+
+    real(WP), intent(in), dimension(0:num_integration-1, 0:1) :: xi_eta_eval
+    real(WP), intent(in), dimension(0:num_integration-1) :: weights
+
+    real(WP), intent(out), dimension(0:num_triangles_o-1, 0:2, 0:num_triangles_s-1, 0:2, 0:num_terms-1) :: A_face
+    real(WP), intent(out), dimension(0:num_triangles_o-1, 0:num_triangles_s-1, 0:num_terms-1) :: phi_face
+    
+    real(WP), dimension(0:2, 0:2) :: nodes_p, nodes_q
+    real(WP), dimension(3, 3, 0:num_terms-1) :: I_A
+    real(WP), dimension(0:num_terms-1) :: I_phi
+
+    integer :: p, q, n
+
+    ! calculate all the integrations for each face pair
+    !$OMP PARALLEL DO SCHEDULE(DYNAMIC) DEFAULT(SHARED) &
+    !$OMP PRIVATE (p, q, n, nodes_p, nodes_q, I_A, I_phi)
+    do p = 0,num_triangles_o-1 ! p is the index of the observer face:
+        nodes_p = nodes_o(triangle_nodes_o(p, :), :)
+        do q = 0,num_triangles_s-1 ! q is the index of the source face
+            nodes_q = nodes_s(triangle_nodes_s(q, :), :)
+
+            call EFIE_face_integrals_series(num_integration, xi_eta_eval, weights, nodes_q, &
+                                num_integration, xi_eta_eval, weights, nodes_p, &
+                                num_terms, 0, I_A, I_phi)
+
+            do n = 0,num_terms-1
+                A_face(p, :, q, :, n) = I_A(:, :, n)
+            end do
+            phi_face(p, q, :) = I_phi
+            
+        end do
+    end do
+    !$OMP END PARALLEL DO
+
+end subroutine Z_EFIE_faces_series_mutual
+
 subroutine hanninen_inner(nodes_s, r_o, n_hat, h, m_hat, I_L_m1, I_L_1, I_L_3, I_S_m3_h, I_S_m1, I_S_1)
     ! Apply recursive formulae of Hanninen for a fixed observer point
     use constants
@@ -1091,6 +1428,9 @@ subroutine face_integral_MFIE(n_s, xi_eta_s, weights_s, nodes_s_in, n_o, xi_eta_
             end if
 
             g_dgamma = -gamma_0*exp_gr/R
+            if (num_singular_terms == 2) then
+                g_dgamma = g_dgamma + gamma_0/R
+            end if
 
             if (T_form) then
                 ! The tang RWG form
@@ -1269,9 +1609,10 @@ subroutine Z_MFIE_faces_self(num_nodes, num_triangles, num_integration, num_sing
                     I_Z = I_Z - Z_precalc(index_singular, 0, :, :)
                 end if
 
-                ! The R term
+                ! The R term, and its derivative
                 if (extract_singular > 1) then
                     I_Z = I_Z - Z_precalc(index_singular, 1, :, :)*gamma_0**2/2
+                    I_Z_dgamma = I_Z_dgamma - Z_precalc(index_singular, 1, :, :)*gamma_0
                 end if
 
                 I_Z = I_Z/4.0/pi
@@ -18,7 +18,7 @@
 # -----------------------------------------------------------------------------
 
 import os.path as osp
-from openmodes.array import LookupArray
+from openmodes.array import LookupArray, IndexPlan
 import openmodes
 import numpy as np
 import pytest
@@ -77,5 +77,43 @@ def test_list_indexing():
         res[0, :, 0, [2]]
 
 
+def test_index_plan():
+    "Compiled indices give the same results, and part ranges are updated"
+
+    sim = openmodes.Simulation()
+    mesh = sim.load_mesh(osp.join(osp.split(__file__)[0], 'input',
+                                  'test_poles', 'srr.msh'))
+    srr1 = sim.place_part(mesh)
+    srr2 = sim.place_part(mesh, location=[15e-3, 0, 0])
+
+    A = LookupArray(((sim.parts, sim.basis_container),
+                     (sim.parts, sim.basis_container)))
+    A[:] = np.arange(A.size).reshape(A.shape)
+    B = LookupArray(((sim.parts, sim.basis_container),
+                     (sim.parts, sim.basis_container)))
+    B[:] = 0
+
+    plan = A.index_plan((srr1, srr2))
+    assert(isinstance(plan, IndexPlan))
+    assert(np.all(A[plan] == A[srr1, srr2]))
+    assert(A[plan].lookup == A[srr1, srr2].lookup)
+
+    # the same plan can be used with any array with the same lookup
+    B[plan] = A[plan]
+    assert(np.all(B[srr1, srr2] == A[srr1, srr2]))
+    assert(np.all(B[srr2, srr1] == 0))
+
+    # the cached ranges must include a newly added part
+    basis_len = len(sim.basis_container[srr1])
+    srr3 = sim.place_part(mesh, location=[30e-3, 0, 0])
+    C = LookupArray(((sim.parts, sim.basis_container),))
+    assert(C.shape == (3*basis_len,))
+    C[:] = 0
+    C[srr3] = 1.0
+    assert(np.sum(C) == basis_len)
+    assert(np.all(C[2*basis_len:] == 1.0))
+
+
 if __name__ == "__main__":
     test_indexing()
+    test_index_plan()
@@ -23,7 +23,8 @@ import matplotlib.pyplot as plt
 import os.path as osp
 
 import openmodes
-from openmodes.basis import DivRwgBasis, LoopStarBasis
+from openmodes.basis import (DivRwgBasis, LoopStarBasis,
+                             BuffaChristiansenBasis)
 from openmodes.integration import DunavantRule
 from openmodes import Simulation
 from openmodes.visualise import write_vtk
@@ -124,6 +125,37 @@ def test_interpolate_loop_star(plot=False, write_reference=False,
         plt.show()
 
 
+def test_buffa_christiansen(print_output=False):
+    "Properties of the Buffa-Christiansen dual basis functions on a sphere"
+    sim = Simulation()
+    mesh = sim.load_mesh(osp.join(tests_location, 'input', 'test_sphere',
+                                  'sphere.msh'))
+    basis = BuffaChristiansenBasis(mesh)
+    rwg = DivRwgBasis(mesh)
+
+    assert(len(basis) == len(rwg))
+    assert(len(basis.mesh.polygons) == 6*len(mesh.polygons))
+
+    # Each function carries a unit flux between the two dual cells, with
+    # an equal divergence within every refined triangle of each cell
+    _, scalar_transform = basis.transformation_matrices
+    for divergence in scalar_transform.toarray()[:20]:
+        assert_allclose(divergence.sum(), 0.0, atol=1e-12)
+        assert_allclose(divergence[divergence > 0].sum(), 1.0)
+        for sign in (1, -1):
+            cell = divergence[sign*divergence > 1e-12]
+            assert_allclose(cell, cell[0])
+            assert_allclose(abs(cell[0]), 1.0/len(cell))
+
+    # The mixed Gram matrix should be well conditioned
+    G = basis.mixed_gram_matrix.toarray()
+    condition = np.linalg.cond(G)
+    if print_output:
+        print("Condition number of mixed Gram matrix:", condition)
+    assert(condition < 10)
+
+
 if __name__ == "__main__":
     test_interpolate_rwg(plot=True)#, skip_asserts=True)
     test_interpolate_loop_star(plot=True) #, skip_asserts=True)
+    test_buffa_christiansen(print_output=True)
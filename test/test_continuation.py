@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+
+from __future__ import print_function
+
+import os.path as osp
+
+import numpy as np
+import scipy.linalg as la
+from numpy.testing import assert_allclose
+
+import openmodes
+from openmodes.basis import LoopStarBasis
+from openmodes.mesh import TriangularSurfaceMesh
+from openmodes.operator import EfieOperator
+from openmodes.continuation import track_poles
+
+tests_location = osp.split(__file__)[0]
+meshfile = osp.join(tests_location, 'input', 'test_poles', 'srr.msh')
+
+
+def srr_pair(separation):
+    "A pair of SRRs with a variable separation"
+    sim = openmodes.Simulation(basis_class=LoopStarBasis,
+                               operator_class=EfieOperator)
+    mesh = sim.load_mesh(meshfile)
+    sim.place_part(mesh)
+    sim.place_part(mesh, location=[0, 0, separation])
+    return sim
+
+
+def test_track_separation(print_output=False):
+    "Track the poles of an SRR pair as their separation is varied"
+    s_start = 2j*np.pi*5e9
+    num_modes = 4
+
+    separations = np.linspace(1e-3, 3e-3, 5)
+    sim = srr_pair(separations[0])
+    estimates = sim.estimate_poles(s_start, cauchy_integral=False,
+                                   modes=num_modes)
+    tracked = track_poles(srr_pair, separations, estimates)
+
+    assert(len(tracked) == len(separations))
+
+    # Compare against poles found independently at each separation
+    for separation, modes in zip(separations, tracked):
+        sim = srr_pair(separation)
+        estimates = sim.estimate_poles(s_start, cauchy_integral=False,
+                                       modes=num_modes)
+        refined = sim.refine_poles(estimates)
+
+        if print_output:
+            print(separation, modes.s.simple_view())
+
+        assert_allclose(modes.s.simple_view(), refined.s.simple_view(),
+                        rtol=1e-6)
+
+
+def square_plate(width, cells):
+    """A square plate, meshed with four triangles in each cell, so that the
+    mesh is symmetric under rotation by 90 degrees"""
+    x = np.linspace(-0.5*width, 0.5*width, cells+1)
+    centres = 0.5*(x[1:]+x[:-1])
+    corner_nodes = [(x_n, y_n, 0) for y_n in x for x_n in x]
+    centre_nodes = [(x_n, y_n, 0) for y_n in centres for x_n in centres]
+    nodes = np.array(corner_nodes+centre_nodes)
+
+    triangles = []
+    for row in range(cells):
+        for col in range(cells):
+            centre = len(corner_nodes) + row*cells + col
+            a = row*(cells+1) + col
+            b = a + 1
+            c = a + cells + 2
+            d = a + cells + 1
+            triangles.extend([(a, b, centre), (b, c, centre),
+                              (c, d, centre), (d, a, centre)])
+    return TriangularSurfaceMesh({'nodes': nodes,
+                                  'triangles': np.array(triangles)})
+
+
+def test_track_degenerate(print_output=False):
+    "Track degenerate poles of a stack of two square plates"
+    plate = square_plate(10e-3, 4)
+    num_calls = [0]
+
+    def plate_stack(separation):
+        num_calls[0] += 1
+        sim = openmodes.Simulation(basis_class=LoopStarBasis,
+                                   operator_class=EfieOperator)
+        sim.place_part(plate)
+        sim.place_part(plate, location=[0, 0, separation])
+        return sim
+
+    separations = np.linspace(2e-3, 3e-3, 3)
+    estimates = plate_stack(separations[0]).estimate_poles(
+                    2j*np.pi*12e9, cauchy_integral=False, modes=4)
+    num_calls[0] = 0
+    tracked = track_poles(plate_stack, separations, estimates)
+
+    # The degenerate pair is tracked without reducing the step
+    assert(num_calls[0] == len(separations))
+
+    for modes in tracked:
+        s = modes.s.simple_view()
+        if print_output:
+            print(s)
+        assert(len(s) == 4)
+        assert_allclose(s[0], s[1], rtol=1e-5)
+
+        # the degenerate modes are distinct
+        vr = modes.vr.simple_view()
+        overlap = abs(np.vdot(vr[:, 0], vr[:, 1]))
+        assert(overlap < 0.9*la.norm(vr[:, 0])*la.norm(vr[:, 1]))
+
+
+if __name__ == "__main__":
+    test_track_separation(print_output=True)
+    test_track_degenerate(print_output=True)
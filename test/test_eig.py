@@ -23,7 +23,8 @@ import numpy as np
 import scipy.linalg as la
 from numpy.testing import assert_allclose
 
-from openmodes.eig import eig_newton_bordered, eig_newton
+from openmodes.eig import (eig_newton_bordered, eig_newton, eig_newton_block,
+                           ldl_factor, ldl_solve)
 
 
 def test_bordered(print_output=False):
@@ -210,6 +211,138 @@ def test_newton(print_output=False):
     print("Normalisation of eigenvector:", np.dot(result['eigvec'], result['eigvec_left']))
 
 
+def test_newton_block(print_output=False):
+    "Test block Newton iteration for degenerate and clustered eigenvalues"
+
+    np.random.seed(5182)
+
+    size = 10
+    Q = la.qr(np.random.rand(size, size))[0]
+
+    # a symmetric matrix with a degenerate pair of eigenvalues, and a third
+    # eigenvalue very close by
+    w = np.array([1.0, 1.0, 1.001, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    M_sym = Q.dot(np.diag(w).dot(Q.T))
+    func = lambda x: (M_sym - x*np.eye(size), -np.eye(size))
+
+    # Create an intial estimate by adding noise to the exact results
+    cluster = [0, 1, 2]
+    w_0 = w[cluster]*np.array([1.02, 0.99, 1.01])
+    vr_0 = Q[:, cluster] + np.random.rand(size, 3)*0.1
+
+    result = eig_newton_block(func, w_0, vr_0, w_tol=1e-12,
+                              func_gives_der=True)
+
+    assert_allclose(np.sort(result['w'].real), w[cluster])
+    assert_allclose(result['w'].imag, 0.0, atol=1e-12)
+
+    # all modes should be distinct, and satisfy the normalisation
+    assert_allclose(result['vl'].dot(result['vr']), -np.eye(3), atol=1e-8)
+    for n in range(3):
+        residual = func(result['w'][n])[0].dot(result['vr'][:, n])
+        assert_allclose(residual, 0.0, atol=1e-6)
+
+    if print_output:
+        print("Block Newton eigenvalues:", result['w'])
+        print("Iterations:", result['iter_count'])
+
+    # Now a complex asymmetric quadratic problem with a cluster
+    np.random.seed(2271)
+    w = np.linspace(1.0, 10.0, size) + 1j*np.random.rand(size)
+    w[1] = w[0]*1.002
+    V = np.random.rand(size, size)+1j*np.random.rand(size, size)
+    K = V.dot(np.diag(w).dot(la.inv(V)))
+    C = np.random.rand(size, size)*1e-3
+
+    func = lambda x: (K + x**2*C - x*np.eye(size), 2*x*C - np.eye(size))
+
+    # start from the solution of the linear part of the problem
+    cluster = [0, 1]
+    vr_0 = V[:, cluster]
+    vl_0 = la.inv(V)[cluster, :]
+    result = eig_newton_block(func, w[cluster], vr_0, vl_0=vl_0, w_tol=1e-12,
+                              func_gives_der=True)
+
+    for n in range(2):
+        T, T_d = func(result['w'][n])
+        assert_allclose(T.dot(result['vr'][:, n]), 0.0, atol=1e-6)
+        assert_allclose(result['vl'][n].dot(T), 0.0, atol=1e-6)
+        assert_allclose(result['vl'][n].dot(T_d.dot(result['vr'][:, n])), 1.0)
+    assert_allclose(result['w'], w[cluster], rtol=1e-2)
+    assert(abs(result['w'][0]-result['w'][1]) > 1e-3)
+
+
+def test_newton_halley(print_output=False):
+    "Test Halley iteration for a quadratic eigenvalue problem"
+
+    np.random.seed(4410)
+
+    size = 10
+    K = np.random.rand(size, size) + 1j*np.random.rand(size, size)
+    K = K + K.T
+    C = np.random.rand(size, size)*0.1
+    C = C + C.T
+
+    func = lambda x: (K + x**2*C - x*np.eye(size), 2*x*C - np.eye(size),
+                      2*C)
+
+    # start from the solution of the linear part of the problem
+    w, vr = la.eig(K)
+    for n in range(3):
+        newton = eig_newton(lambda x: func(x)[:2], w[n], vr[:, n],
+                            lambda_tol=1e-12, func_gives_der=True)
+        halley = eig_newton(func, w[n], vr[:, n], lambda_tol=1e-12,
+                            func_gives_der2=True)
+
+        assert_allclose(halley['eigval'], newton['eigval'], rtol=1e-10)
+        T, T_d, T_d2 = func(halley['eigval'])
+        assert_allclose(T.dot(halley['eigvec']), 0.0, atol=1e-8)
+        assert(halley['iter_count'] < newton['iter_count'])
+
+        if print_output:
+            print("Newton iterations:", newton['iter_count'],
+                  "Halley iterations:", halley['iter_count'])
+
+def test_ldl(print_output=False):
+    "Test the symmetric factorisation for complex symmetric matrices"
+
+    np.random.seed(7211)
+
+    size = 20
+    A = np.random.rand(size, size) + 1j*np.random.rand(size, size)
+    A = A + A.T
+    b = np.random.rand(size, 3) + 1j*np.random.rand(size, 3)
+
+    factors = ldl_factor(A)
+    x = ldl_solve(factors, b)
+    assert_allclose(x, la.solve(A, b), rtol=1e-10)
+    assert_allclose(ldl_solve(factors, b[:, 0]), x[:, 0], rtol=1e-12)
+
+    # a zero diagonal forces 2x2 pivots
+    A_zero = A.copy()
+    np.fill_diagonal(A_zero, 0.0)
+    factors = ldl_factor(A_zero.copy(), overwrite_a=True)
+    assert(np.any(factors[1] < 0))
+    assert_allclose(ldl_solve(factors, b), la.solve(A_zero, b), rtol=1e-10)
+
+    # Newton iteration using the symmetric factorisation
+    func = lambda x: (A - x*np.eye(size), -np.eye(size))
+    w, vr = la.eig(A)
+    w_0 = w[0]*1.05
+    general = eig_newton(func, w_0, vr[:, 0], lambda_tol=1e-12,
+                         func_gives_der=True)
+    symmetric = eig_newton(func, w_0, vr[:, 0], lambda_tol=1e-12,
+                           func_gives_der=True, symmetric=True)
+    assert_allclose(symmetric['eigval'], w[0], rtol=1e-10)
+    assert_allclose(symmetric['eigval'], general['eigval'], rtol=1e-12)
+
+    if print_output:
+        print("LDL solution error:", np.max(abs(A.dot(x)-b)))
+
+
 if __name__ == "__main__":
     test_bordered()
     test_newton()
+    test_newton_block(print_output=True)
+    test_newton_halley(print_output=True)
+    test_ldl(print_output=True)
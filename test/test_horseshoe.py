@@ -30,6 +30,9 @@ import openmodes.basis
 from openmodes.sources import PlaneWaveSource
 from openmodes.constants import c
 from openmodes.integration import triangle_centres
+from openmodes.model import (ModelHermiteInterpolation, ModelMutualWeight,
+                             EfieModelMutualWeight, ModelSplit,
+                             EfieModelSplit)
 
 from helpers import (read_1d_complex, write_1d_complex,
                      read_2d_real, write_2d_real)
@@ -168,6 +171,294 @@ def test_extinction(plot_extinction=False, skip_asserts=False,
         plt.show()
 
 
+def test_extinction_interpolated(print_output=False):
+    "Extinction of a horseshoe with an interpolated impedance model"
+    sim = openmodes.Simulation(name='horseshoe_extinction_interpolated',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    sim.place_part(shoe)
+
+    num_freqs = 101
+    freqs = np.linspace(1e8, 20e9, num_freqs)
+
+    model = ModelHermiteInterpolation(sim.operator, sim.parts,
+                                      2j*np.pi*freqs[0], 2j*np.pi*freqs[-1])
+
+    extinction = np.empty(num_freqs, np.complex128)
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    for freq_count, s in sim.iter_freqs(freqs):
+        Z = model.impedance(s)
+        V = sim.source_vector(pw, s)
+        extinction[freq_count] = np.vdot(V, Z.solve(V))
+
+    if print_output:
+        print("Impedance calculated at %d frequencies"
+              % model.num_assemblies)
+
+    extinction_ref = read_1d_complex(osp.join(reference_dir, 'extinction.txt'))
+    assert_allclose(extinction, extinction_ref, rtol=1e-3)
+    assert(model.num_assemblies < num_freqs//2)
+
+
+def test_modes_blocks(print_output=False):
+    "Projection onto the modes of several parts, one block at a time"
+    sim = openmodes.Simulation(name='horseshoe_modes_blocks',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    for count in range(3):
+        sim.place_part(shoe, location=[count*15e-3, 0, 0])
+
+    estimates = sim.estimate_poles(2j*np.pi*5e9, parts=sim.parts.children,
+                                   modes=2, cauchy_integral=False)
+    modes = sim.refine_poles(estimates)
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s).val().simple_view()
+    V = np.random.rand(Z.shape[0], 2)
+
+    for test_modes in (modes, modes.add_conjugates(),
+                       modes.split_real_imag(), modes.select([1])):
+        # the dense eigenvectors are only created by this test
+        vr = test_modes.vr.simple_view()
+        vl = test_modes.vl.simple_view()
+        Z_modes = vl.dot(Z.dot(vr))
+        assert_allclose(test_modes.project_matrix(Z), Z_modes, rtol=1e-10,
+                        atol=1e-12*np.max(abs(Z_modes)))
+        V_modes = test_modes.project(V)
+        assert_allclose(V_modes.simple_view(), vl.dot(V), rtol=1e-10)
+        assert_allclose(test_modes.expand(V_modes).simple_view(),
+                        vr.dot(vl.dot(V)), rtol=1e-10)
+        assert_allclose(test_modes.project(V[:, 0]).simple_view(),
+                        vl.dot(V[:, 0]), rtol=1e-10)
+
+    if print_output:
+        print("Dense eigenvector size:", modes.vr.size,
+              "block size:", sum(block.size for block
+                                 in modes.vr_blocks.values()))
+
+
+def test_model_interpolated_mutual(print_output=False):
+    "Modal model of two horseshoes with interpolated mutual terms"
+    sim = openmodes.Simulation(name='horseshoe_model_interpolated',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    parts = [sim.place_part(shoe, location=[count*15e-3, 0, 0])
+             for count in range(2)]
+
+    estimates = sim.estimate_poles(2j*np.pi*5e9, parts=parts, modes=2,
+                                   cauchy_integral=False)
+    modes = sim.refine_poles(estimates)
+
+    s_start = 2j*np.pi*1e9
+    s_end = 2j*np.pi*15e9
+    exact = EfieModelMutualWeight(modes)
+    interpolated = EfieModelMutualWeight(modes, s_start=s_start, s_end=s_end,
+                                         rel_tol=1e-4)
+
+    s_values = 2j*np.pi*np.array([1e9, 4.3e9, 9.7e9, 15e9])
+    Z_stacked = interpolated.impedance_stacked(s_values)
+    for s, Z_s in zip(s_values, Z_stacked):
+        Z_exact = exact.impedance(s).val().simple_view()
+        Z_interp = interpolated.impedance(s).val().simple_view()
+        assert_allclose(Z_interp, Z_exact, rtol=1e-5,
+                        atol=1e-5*np.max(abs(Z_exact)))
+        assert_allclose(Z_s, Z_interp, rtol=1e-12)
+
+    interpolation = interpolated.mutual_interpolation[parts[0], parts[1]][0]
+    if print_output:
+        print("Mutual terms interpolated with %d anchors"
+              % interpolation.num_evaluations)
+
+    assert(interpolation.num_evaluations < 30)
+
+
+def test_model_stacked(print_output=False):
+    "Modal models of two horseshoes evaluated at several frequencies at once"
+    sim = openmodes.Simulation(name='horseshoe_model_stacked',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    parts = [sim.place_part(shoe, location=[count*15e-3, 0, 0])
+             for count in range(2)]
+
+    estimates = sim.estimate_poles(2j*np.pi*5e9, parts=parts, modes=2,
+                                   cauchy_integral=False)
+    modes = sim.refine_poles(estimates)
+
+    s_values = 2j*np.pi*np.array([3e9, 7e9])
+
+    for model_class in (ModelMutualWeight, EfieModelMutualWeight,
+                        ModelSplit, EfieModelSplit):
+        model = model_class(modes)
+        Z_stacked = model.impedance_stacked(s_values)
+        num_modes = Z_stacked.shape[1]
+        V = np.arange(1, num_modes+1, dtype=np.complex128)
+        I_stacked = model.solve_stacked(s_values, V)
+
+        if print_output:
+            print("%s: %d modes" % (model_class.__name__, num_modes))
+
+        for s, Z_s, I_s in zip(s_values, Z_stacked, I_stacked):
+            Z = model.impedance(s)
+            assert_allclose(Z_s, Z.val().simple_view(), rtol=1e-12)
+            assert_allclose(I_s, Z.solve(V).simple_view(), rtol=1e-10)
+
+        # several sources at each frequency
+        V_multiple = np.random.rand(len(s_values), num_modes, 3)
+        I_multiple = model.solve_stacked(s_values, V_multiple)
+        assert_allclose(np.einsum('fij,fjk->fik', Z_stacked, I_multiple),
+                        V_multiple, rtol=1e-10, atol=1e-12)
+
+
+def test_array_iterative_solve(print_output=False):
+    "Block-Jacobi preconditioned solution for an array of horseshoes"
+    sim = openmodes.Simulation(name='horseshoe_array_iterative',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    for count in range(3):
+        sim.place_part(shoe, location=[count*15e-3, 0, 0])
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s)
+    V = sim.source_vector(pw, s)
+
+    I_direct = Z.solve(V)
+    I_iterative = Z.solve_iterative(V, tol=1e-10)
+
+    # identical parts should share a single factorised block
+    factors = [id(block[2]) for block in Z.block_factored()]
+    assert(len(factors) == 3 and len(set(factors)) == 1)
+
+    if print_output:
+        print("Relative error of iterative solution:",
+              np.max(abs(I_iterative-I_direct))/np.max(abs(I_direct)))
+
+    assert_allclose(I_iterative, I_direct, rtol=1e-6,
+                    atol=1e-6*np.max(abs(I_direct)))
+
+
+def test_array_deflated_solve(print_output=False):
+    "Iterative solution for strongly coupled horseshoes, deflated by modes"
+    sim = openmodes.Simulation(name='horseshoe_array_deflated',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    for count in range(3):
+        sim.place_part(shoe, location=[0, 0, count*4e-3])
+
+    estimates = sim.estimate_poles(2j*np.pi*5e9, parts=sim.parts.children,
+                                   modes=3, cauchy_integral=False)
+    modes = sim.refine_poles(estimates)
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s)
+    V = sim.source_vector(pw, s)
+    I_direct = Z.solve(V)
+
+    iterations = []
+    for solve_modes in (None, modes):
+        residuals = []
+        I_iterative = Z.solve_iterative(V, tol=1e-10, modes=solve_modes,
+                                        callback=residuals.append)
+        assert_allclose(I_iterative, I_direct, rtol=1e-4,
+                        atol=1e-4*np.max(abs(I_direct)))
+        iterations.append(len(residuals))
+
+    if print_output:
+        print("Iterations without and with deflation:", iterations)
+
+    assert(iterations[1] < iterations[0])
+
+
+def test_moved_part_update(print_output=False):
+    "Update the impedance of an array after moving one part"
+    sim = openmodes.Simulation(name='horseshoe_array_update',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    parts = [sim.place_part(shoe, location=[count*15e-3, 0, 0])
+             for count in range(4)]
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s)
+    Z.solve(sim.source_vector(pw, s))
+
+    parts[1].translate([0, 3e-3, 0])
+    moved = sim.update_impedance(Z)
+    assert(moved == [parts[1]])
+    assert(hasattr(Z, 'update_base'))
+
+    Z_new = sim.impedance(s)
+    V = sim.source_vector(pw, s)
+    I_updated = Z.solve(V)
+    I_new = Z_new.solve(V)
+
+    if print_output:
+        print("Relative error of updated solution:",
+              np.max(abs(I_updated-I_new))/np.max(abs(I_new)))
+
+    assert_allclose(Z.val(), Z_new.val(), rtol=1e-10,
+                    atol=1e-10*np.max(abs(Z_new.val())))
+    assert_allclose(I_updated, I_new, rtol=1e-8,
+                    atol=1e-8*np.max(abs(I_new)))
+
+
+def test_symmetric_mirror(print_output=False):
+    "Blocks below the diagonal of a symmetric matrix are filled when used"
+    sim = openmodes.Simulation(name='horseshoe_symmetric_mirror',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    parts = [sim.place_part(shoe, location=[count*15e-3, 0, 0])
+             for count in range(3)]
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s, frequency_derivatives=True)
+    assert(Z.md['symmetric'])
+    assert(len(Z.unmirrored) == 3)
+
+    # the mirrored block is the same as if it was calculated directly
+    Z_block = sim.operator.impedance(s, parts[2], parts[0],
+                                     frequency_derivatives=True)
+    Z_mirrored = Z[parts[2], parts[0]]
+    assert(len(Z.unmirrored) == 0)
+
+    Z_direct = Z_block.val().simple_view()
+    assert_allclose(Z_mirrored.val().simple_view(), Z_direct, rtol=1e-10,
+                    atol=1e-12*np.max(abs(Z_direct)))
+    der_direct = Z_block.frequency_derivative()
+    assert_allclose(Z_mirrored.frequency_derivative(), der_direct,
+                    rtol=1e-10, atol=1e-12*np.max(abs(der_direct)))
+
+    # the mirrored block is exactly the transpose of the calculated block
+    Z_upper = Z[parts[0], parts[2]].val().simple_view()
+    assert(np.all(Z_mirrored.val().simple_view() == Z_upper.T))
+
+    if print_output:
+        print("Maximum difference of mirrored block:",
+              np.max(abs(Z_mirrored.val().simple_view()-Z_direct)))
+
+
 def horseshoe_extinction_modes():
     sim = openmodes.Simulation(name='horseshoe_extinction_modes',
                                basis_class=openmodes.basis.LoopStarBasis)
@@ -269,3 +560,11 @@ if __name__ == "__main__":
     test_horseshoe_modes(plot=True, skip_asserts=True)
     test_extinction(plot_extinction=True, skip_asserts=True)
     test_surface_normals(plot=True, skip_asserts=True)
+    test_extinction_interpolated(print_output=True)
+    test_modes_blocks(print_output=True)
+    test_model_interpolated_mutual(print_output=True)
+    test_model_stacked(print_output=True)
+    test_array_iterative_solve(print_output=True)
+    test_array_deflated_solve(print_output=True)
+    test_moved_part_update(print_output=True)
+    test_symmetric_mirror(print_output=True)
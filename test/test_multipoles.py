@@ -6,13 +6,18 @@ Created on Fri Mar 18 16:59:21 2016
 """
 
 import numpy as np
+from numpy.testing import assert_allclose
 import os.path as osp
 import matplotlib.pyplot as plt
+import scipy.special
+import pytest
 
 import openmodes
 from openmodes.mesh import gmsh
 from openmodes.constants import c
 from openmodes.sources import PlaneWaveSource
+from openmodes.multipole import associated_legendre
+from openmodes.array import LookupArray
 
 import helpers
 
@@ -103,6 +108,79 @@ def test_pec_sphere_multipoles():
     helpers.run_test(pec_sphere_multipoles, tests_filename)
 test_pec_sphere_multipoles.__doc__ = pec_sphere_multipoles.__doc__
 
+
+def test_associated_legendre():
+    "Associated Legendre functions at many points match scipy"
+    max_l = 12
+    theta = np.linspace(0.05, np.pi-0.05, 40)
+    P_lm, tau_lm = associated_legendre(max_l, theta)
+
+    for P, tau, theta_n in zip(P_lm, tau_lm, theta):
+        P_ref, dP_ref = scipy.special.lpmn(max_l, max_l, np.cos(theta_n))
+        tau_ref = -np.sin(theta_n)*dP_ref.T
+        assert_allclose(P, P_ref.T, rtol=1e-10,
+                        atol=1e-12*np.max(abs(P_ref)))
+        assert_allclose(tau, tau_ref, rtol=1e-10,
+                        atol=1e-12*np.max(abs(tau_ref)))
+
+
+def test_multipole_origin():
+    "Multipoles about different origins are not mixed up by the cache"
+    sim = openmodes.Simulation()
+    mesh = sim.load_mesh(meshfile)
+    sim.place_part(mesh)
+
+    s = 2j*np.pi*0.5*c/(2*np.pi)
+    pw = PlaneWaveSource([1, 0, 0], [0, 0, 1], p_inc=1.0)
+    I = sim.impedance(s).solve(sim.source_vector(pw, s))
+
+    origin = np.array([0, 0, 0.5])
+    a_e, a_m = sim.multipole_decomposition(I, 3, s)
+    a_e_shifted, a_m_shifted = sim.multipole_decomposition(I, 3, s, origin)
+
+    # a fresh simulation has nothing cached
+    sim_new = openmodes.Simulation()
+    sim_new.place_part(sim_new.load_mesh(meshfile))
+    a_e_ref, a_m_ref = sim_new.multipole_decomposition(I, 3, s, origin)
+
+    dipole = (1, [-1, 0, 1])
+    assert(not np.allclose(a_e[dipole], a_e_shifted[dipole]))
+    assert_allclose(a_e_shifted, a_e_ref, rtol=1e-12)
+    assert_allclose(a_m_shifted, a_m_ref, rtol=1e-12)
+
+
+def test_multipole_batch():
+    "Multipoles of many solutions at different frequencies found at once"
+    sim = openmodes.Simulation()
+    mesh = sim.load_mesh(meshfile)
+    sim.place_part(mesh)
+
+    freqs = np.linspace(0.2, 2, 5)*c/(2*np.pi)
+    pw = PlaneWaveSource([1, 0, 0], [0, 0, 1], p_inc=1.0)
+    order = 3
+
+    I_all = LookupArray((sim.operator.unknowns, (sim.parts, sim.basis_container),
+                         len(freqs)), dtype=np.complex128)
+    s_all = np.empty(len(freqs), np.complex128)
+    for freq_count, s in sim.iter_freqs(freqs):
+        I_all[:, :, freq_count] = sim.impedance(s).solve(sim.source_vector(pw, s))
+        s_all[freq_count] = s
+
+    a_e, a_m = sim.multipole_decomposition(I_all, order, s_all)
+    assert(a_e.shape == (order+1, 2*order+1, len(freqs)))
+
+    for freq_count, s in enumerate(s_all):
+        I = I_all[:, :, freq_count:freq_count+1]
+        a_e_single, a_m_single = sim.multipole_decomposition(I, order, s)
+        assert_allclose(a_e[..., freq_count], a_e_single[..., 0], rtol=1e-10,
+                        atol=1e-12*np.nanmax(abs(a_e_single)))
+        assert_allclose(a_m[..., freq_count], a_m_single[..., 0], rtol=1e-10,
+                        atol=1e-12*np.nanmax(abs(a_m_single)))
+
+    with pytest.raises(ValueError):
+        sim.multipole_decomposition(I_all, order, s_all[:2])
+
+
 if __name__ == "__main__":
     # Uncomment the following lines to update reference solutions
     # generate_mesh()
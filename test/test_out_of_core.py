@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+
+from __future__ import print_function
+
+import os.path as osp
+
+import numpy as np
+import scipy.linalg as la
+from numpy.testing import assert_allclose
+
+import openmodes
+import openmodes.basis
+from openmodes.sources import PlaneWaveSource
+from openmodes.material import IsotropicMaterial
+from openmodes.out_of_core import (ScratchStorage, lu_factor_tiled,
+                                   lu_solve_tiled)
+
+tests_location = osp.split(__file__)[0]
+mesh_dir = osp.join(tests_location, 'input', 'test_horseshoe')
+
+
+def test_lu_tiled(print_output=False):
+    "Tiled LU factorisation of a memory-mapped matrix"
+
+    np.random.seed(4810)
+
+    size = 53
+    A = np.random.rand(size, size) + 1j*np.random.rand(size, size)
+    b = np.random.rand(size, 2) + 1j*np.random.rand(size, 2)
+
+    storage = ScratchStorage(tile_memory=16*size*2*8)
+    A_stored = storage.empty((size, size))
+    A_stored[:] = A
+
+    # the tiles do not evenly divide the matrix
+    factors = lu_factor_tiled(A_stored, storage.tile_size(size))
+    assert(factors[2] == 8)
+
+    x = lu_solve_tiled(factors, b)
+    assert_allclose(x, la.solve(A, b), rtol=1e-10)
+    assert_allclose(lu_solve_tiled(factors, b[:, 0]), x[:, 0], rtol=1e-12)
+
+    directory = storage.directory
+    assert(osp.exists(directory))
+    storage.cleanup()
+    assert(not osp.exists(directory))
+
+    if print_output:
+        print("Tiled LU solution error:", np.max(abs(A.dot(x)-b)))
+
+
+def test_horseshoe_out_of_core(print_output=False):
+    "Impedance matrix of horseshoes calculated in scratch storage"
+    sim = openmodes.Simulation(name='horseshoe_out_of_core',
+                               basis_class=openmodes.basis.LoopStarBasis)
+
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    for count in range(2):
+        sim.place_part(shoe, location=[count*15e-3, 0, 0])
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s)
+
+    # a small tile size, so that several tiles are needed for each part
+    storage = ScratchStorage(tile_memory=2**22)
+    Z_stored = sim.impedance(s, storage=storage)
+    assert(isinstance(Z_stored.matrices['L'].base, np.memmap))
+
+    for name in Z.matrix_names:
+        assert_allclose(Z_stored.matrices[name], Z.matrices[name], rtol=1e-10,
+                        atol=1e-12*np.max(abs(Z.matrices[name])))
+        assert_allclose(Z_stored.der[name], Z.der[name], rtol=1e-10,
+                        atol=1e-12*np.max(abs(Z.der[name])))
+
+    V = sim.source_vector(pw, s)
+    I_stored = Z_stored.solve(V)
+    I_direct = la.solve(Z.val().simple_view(), V.simple_view())
+
+    if print_output:
+        print("Relative error of out-of-core solution:",
+              np.max(abs(I_stored.simple_view()-I_direct))/np.max(abs(I_direct)))
+
+    assert_allclose(I_stored.simple_view(), I_direct, rtol=1e-8,
+                    atol=1e-8*np.max(abs(I_direct)))
+
+
+def test_out_of_core_background(print_output=False):
+    "Impedance matrix in scratch storage within a background material"
+    s = 2j*np.pi*5e9
+    storage = ScratchStorage(tile_memory=2**20)
+
+    Z = {}
+    for eps, mu in ((2.0, 1.5), (1.5, 2.0)):
+        background = IsotropicMaterial("Background", eps, mu)
+        sim = openmodes.Simulation(name='horseshoe_out_of_core_background',
+                                   background_material=background)
+        shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+        sim.place_part(shoe)
+        sim.place_part(shoe, location=[15e-3, 0, 0])
+
+        Z_dense = sim.impedance(s)
+        Z[eps, mu] = sim.impedance(s, storage=storage)
+        for name in Z_dense.matrix_names:
+            assert_allclose(Z[eps, mu].matrices[name],
+                            Z_dense.matrices[name], rtol=1e-10,
+                            atol=1e-12*np.max(abs(Z_dense.matrices[name])))
+            assert_allclose(Z[eps, mu].der[name], Z_dense.der[name],
+                            rtol=1e-10,
+                            atol=1e-12*np.max(abs(Z_dense.der[name])))
+
+    # swapping the permittivity and permeability keeps the refractive index,
+    # so L scales with the permeability and S with the inverse permittivity
+    L = Z[2.0, 1.5].matrices['L']
+    S = Z[2.0, 1.5].matrices['S']
+    L_swapped = Z[1.5, 2.0].matrices['L']
+    S_swapped = Z[1.5, 2.0].matrices['S']
+
+    if print_output:
+        print("Error of scaled L:", np.max(abs(L*2.0/1.5 - L_swapped)),
+              "scaled S:", np.max(abs(S*2.0/1.5 - S_swapped)))
+
+    assert_allclose(L*2.0/1.5, L_swapped, rtol=1e-10,
+                    atol=1e-12*np.max(abs(L_swapped)))
+    assert_allclose(S*2.0/1.5, S_swapped, rtol=1e-10,
+                    atol=1e-12*np.max(abs(S_swapped)))
+
+if __name__ == "__main__":
+    test_lu_tiled(print_output=True)
+    test_horseshoe_out_of_core(print_output=True)
+    test_out_of_core_background(print_output=True)
@@ -15,7 +15,7 @@ import matplotlib.pyplot as plt
 
 import openmodes
 from openmodes.basis import LoopStarBasis
-from openmodes.operator import EfieOperator
+from openmodes.operator import EfieOperator, EfieSeriesOperator
 from openmodes.integration import ExternalModeContour
 from openmodes.mesh import gmsh
 
@@ -40,11 +40,11 @@ def generate_mesh():
 
 
 
-def srr_pair_combined_poles(plot=False):
+def srr_pair_combined_poles(plot=False, operator_class=EfieOperator):
     "Cauchy integral for poles of an SRR pair considered as a single part"
 
     sim = openmodes.Simulation(basis_class=LoopStarBasis,
-                               operator_class=EfieOperator)
+                               operator_class=operator_class)
 
     mesh = sim.load_mesh(meshfile)
     srr1 = sim.place_part(mesh)
@@ -76,6 +76,12 @@ def test_srr_pair_combined_poles():
 test_srr_pair_combined_poles.__doc__ = srr_pair_combined_poles.__doc__
 
 
+def test_srr_pair_series_poles():
+    "Poles of an SRR pair, with the impedance found from a power series"
+    helpers.run_test(lambda: srr_pair_combined_poles(
+                     operator_class=EfieSeriesOperator), tests_filename)
+
+
 def srr_pair_separate_poles(plot=False):
     "Cauchy integral for poles of an SRR pair considered as a single part"
 
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+
+from __future__ import print_function
+
+import os.path as osp
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+import openmodes
+import openmodes.basis
+from openmodes.sources import PlaneWaveSource
+from openmodes.serialisation import save_modes, save_impedance
+
+tests_location = osp.split(__file__)[0]
+mesh_dir = osp.join(tests_location, 'input', 'test_horseshoe')
+srr_file = osp.join(tests_location, 'input', 'test_poles', 'srr.msh')
+
+
+def horseshoe_simulation(num_parts=2):
+    "A simulation of several horseshoes"
+    sim = openmodes.Simulation(basis_class=openmodes.basis.LoopStarBasis)
+    shoe = sim.load_mesh(osp.join(mesh_dir, 'horseshoe_rect.msh'))
+    for count in range(num_parts):
+        sim.place_part(shoe, location=[count*15e-3, 0, 0])
+    return sim
+
+
+def test_save_load_modes(print_output=False):
+    "Modes saved and loaded into a new simulation"
+    sim = horseshoe_simulation()
+    estimates = sim.estimate_poles(2j*np.pi*5e9, parts=sim.parts.children,
+                                   modes=2, cauchy_integral=False)
+    modes = sim.refine_poles(estimates)
+
+    directory = tempfile.mkdtemp()
+    try:
+        for saved_modes in (modes, modes.split_real_imag()):
+            save_modes(saved_modes, directory)
+
+            # the meshes are loaded again, so they have different ids
+            new_sim = horseshoe_simulation()
+            loaded = new_sim.load_modes(directory)
+
+            assert(type(loaded) is type(saved_modes))
+            assert(loaded.parts == new_sim.parts.children)
+            for part in loaded.parts:
+                assert(isinstance(loaded.modes_of_parts[part.unique_id]['vr'],
+                                  np.memmap))
+            assert_allclose(loaded.s.simple_view(),
+                            saved_modes.s.simple_view())
+            assert_allclose(loaded.vr.simple_view(),
+                            saved_modes.vr.simple_view())
+            assert_allclose(loaded.vl.simple_view(),
+                            saved_modes.vl.simple_view())
+
+        # the modes cannot be attached to different parts
+        other_sim = openmodes.Simulation()
+        srr = other_sim.load_mesh(srr_file)
+        other_sim.place_part(srr)
+        other_sim.place_part(srr, location=[15e-3, 0, 0])
+        with pytest.raises(ValueError):
+            other_sim.load_modes(directory)
+    finally:
+        shutil.rmtree(directory)
+
+    if print_output:
+        print("Loaded poles", loaded.s)
+
+
+def test_save_load_impedance(print_output=False):
+    "Impedance matrix saved and loaded into a new simulation"
+    sim = horseshoe_simulation()
+    s = 2j*np.pi*5e9
+    Z = sim.impedance(s, frequency_derivatives=True)
+
+    e_inc = np.array([1, 0, 0], dtype=np.complex128)
+    k_hat = np.array([0, 0, 1], dtype=np.complex128)
+    pw = PlaneWaveSource(e_inc, k_hat)
+
+    directory = tempfile.mkdtemp()
+    try:
+        save_impedance(Z, directory)
+
+        new_sim = horseshoe_simulation()
+        Z_loaded = new_sim.load_impedance(directory)
+
+        assert(type(Z_loaded) is type(Z))
+        assert(Z_loaded.md['s'] == s)
+        assert(Z_loaded.md['symmetric'] == Z.md['symmetric'])
+        for name in Z.matrix_names:
+            assert(isinstance(Z_loaded.matrices[name].base, np.memmap))
+            assert_allclose(Z_loaded.matrices[name], Z.matrices[name])
+            assert_allclose(Z_loaded.der[name], Z.der[name])
+
+        V = new_sim.source_vector(pw, s)
+        I_loaded = Z_loaded.solve(V)
+        I = Z.solve(sim.source_vector(pw, s))
+        assert_allclose(I_loaded.simple_view(), I.simple_view(), rtol=1e-10)
+
+        # the loaded matrix can be updated after moving a part
+        new_sim.parts.children[1].translate([0, 3e-3, 0])
+        new_sim.update_impedance(Z_loaded)
+        Z_moved = new_sim.impedance(s).val().simple_view()
+        assert_allclose(Z_loaded.val().simple_view(), Z_moved, rtol=1e-10,
+                        atol=1e-12*np.max(abs(Z_moved)))
+
+        # the matrix cannot be attached to parts in different locations
+        with pytest.raises(ValueError):
+            new_sim.load_impedance(directory)
+    finally:
+        shutil.rmtree(directory)
+
+    if print_output:
+        print("Loaded impedance matrix of size", Z_loaded.val().shape)
+
+
+if __name__ == "__main__":
+    test_save_load_modes(print_output=True)
+    test_save_load_impedance(print_output=True)
@@ -10,14 +10,23 @@ from __future__ import print_function
 import os.path as osp
 
 import numpy as np
+import scipy.linalg as la
 from numpy.testing import assert_allclose
 import matplotlib.pyplot as plt
+import pytest
 
 import openmodes
-from openmodes.basis import DivRwgBasis
-from openmodes.sources import PlaneWaveSource
+from openmodes.basis import DivRwgBasis, LoopStarBasis
+from openmodes.sources import (PlaneWaveSource, PlaneWaveSources,
+                               planewave_angles)
 from openmodes.constants import c, eta_0
 from openmodes.operator import MfieOperator, EfieOperator, CfieOperator
+from openmodes.operator.penetrable import PMCHWTOperator, CTFOperator
+from openmodes.material import IsotropicMaterial
+from openmodes.eig import eig_linearised
+from openmodes.mesh import TriangularSurfaceMesh
+from openmodes.operator.singularities import singular_impedance_rwg
+from openmodes.core import z_efie_faces_self, z_efie_faces_mutual
 
 from helpers import read_1d_complex, write_1d_complex
 
@@ -120,5 +129,404 @@ def test_extinction_all(plot_extinction=False, skip_asserts=False,
             plt.ylim(ymin=0)
             plt.show()
 
+
+def test_linearised_arpack():
+    "Linearised modes of a sphere found by dense and shift-invert solvers"
+    sim = openmodes.Simulation(basis_class=LoopStarBasis)
+    sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+    sim.place_part(sphere)
+
+    s = 2j*np.pi*15e9
+    num_modes = 6
+    dense = sim.estimate_poles(s, cauchy_integral=False, modes=num_modes)
+    arpack = sim.estimate_poles(s, cauchy_integral=False, modes=num_modes,
+                                linearised_method='arpack')
+
+    assert_allclose(arpack.s, dense.s, rtol=1e-10)
+
+    # eigenvectors should be identical, apart from a phase factor
+    vr_dense = dense.vr.simple_view()
+    vr_arpack = arpack.vr.simple_view()
+    overlap = np.abs(np.sum(vr_dense.conj()*vr_arpack, axis=0))
+    overlap /= np.sqrt(np.sum(np.abs(vr_dense)**2, axis=0) *
+                       np.sum(np.abs(vr_arpack)**2, axis=0))
+    assert_allclose(overlap, 1.0, rtol=1e-6)
+
+
+def test_linearised_default_modes():
+    "Linearised modes of a sphere found without specifying the modes"
+    sim = openmodes.Simulation(basis_class=LoopStarBasis)
+    sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+    part = sim.place_part(sphere)
+
+    s = 2j*np.pi*15e9
+    num_modes = 6
+    lowest = sim.estimate_poles(s, cauchy_integral=False, modes=num_modes)
+    dense = sim.estimate_poles(s, cauchy_integral=False)
+    arpack = sim.estimate_poles(s, cauchy_integral=False,
+                                linearised_method='arpack')
+
+    # all physical modes are found, ordered by frequency
+    s_all = dense.s.simple_view()
+    assert(len(s_all) > num_modes)
+    assert(np.all(abs(s_all.real) <= abs(s_all.imag)))
+    assert(np.all(np.diff(abs(s_all.imag)) >= 0))
+    assert_allclose(s_all[:num_modes], lowest.s.simple_view(), rtol=1e-10)
+    assert_allclose(arpack.s.simple_view(), s_all, rtol=1e-10)
+
+    Z = sim.operator.impedance(s, part, part)
+    with pytest.raises(ValueError):
+        eig_linearised(Z, np.arange(num_modes), 'unknown')
+
+
+def test_frequency_derivatives():
+    "Impedance derivatives of PEC and penetrable operators for a sphere"
+
+    # A dispersive material, to check the derivatives of material parameters
+    def drude(s):
+        return 1.0 + (2*np.pi*30e9)**2/(-s*(s + 1e9))
+    dispersive = IsotropicMaterial("Drude", drude, 1.0)
+    dielectric = IsotropicMaterial("Dielectric", 6.0, 1.2)
+
+    tests = ((EfieOperator, None), (MfieOperator, None), (CfieOperator, None),
+             (PMCHWTOperator, dielectric),
+             (PMCHWTOperator, dispersive), (CTFOperator, dispersive))
+
+    s = 2j*np.pi*10e9 - 1e9
+    h = abs(s)*1e-6
+
+    for operator_class, material in tests:
+        sim = openmodes.Simulation(basis_class=DivRwgBasis,
+                                   operator_class=operator_class)
+        sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+        if material is None:
+            sim.place_part(sphere)
+        else:
+            sim.place_part(sphere, material=material)
+
+        assert(sim.operator.frequency_derivatives)
+        dZ = sim.impedance(s, frequency_derivatives=True).frequency_derivative().simple_view()
+        dZ_fd = (sim.impedance(s+h).val().simple_view() -
+                 sim.impedance(s-h).val().simple_view())/(2*h)
+
+        assert_allclose(dZ, dZ_fd, atol=1e-6*np.max(np.abs(dZ_fd)))
+
+        # derivatives which were not requested are calculated on access
+        Z = sim.impedance(s)
+        assert(Z.deferred_derivatives)
+        dZ_deferred = Z.frequency_derivative().simple_view()
+        assert(not Z.deferred_derivatives)
+        assert_allclose(dZ_deferred, dZ, rtol=1e-12,
+                        atol=1e-12*np.max(np.abs(dZ)))
+
+        # arrays returned at another frequency can be reused for the results
+        Z_out = sim.impedance(s+h, frequency_derivatives=True)
+        val_out = Z_out.val()
+        der_out = Z_out.frequency_derivative()
+        assert(Z.val(out=val_out) is val_out)
+        assert(Z.frequency_derivative(out=der_out) is der_out)
+        assert(np.all(val_out.simple_view() == Z.val().simple_view()))
+        assert(np.all(der_out.simple_view() == dZ_deferred))
+
+
+def test_dielectric_pole_refinement():
+    "Newton refinement of a dielectric resonator pole converges quickly"
+    # Stretching the sphere into an ellipsoid splits its degenerate modes
+    sphere = icosphere_mesh(5e-3, 1)
+    ellipsoid = TriangularSurfaceMesh({'nodes': sphere.nodes*[1.0, 1.15, 1.3],
+                                       'triangles': sphere.polygons})
+    dielectric = IsotropicMaterial("Dielectric", 6.0, 1.2)
+    s_0 = 2j*np.pi*9.5e9 - 6e9
+
+    for operator_class in (PMCHWTOperator, CTFOperator):
+        sim = openmodes.Simulation(basis_class=DivRwgBasis,
+                                   operator_class=operator_class)
+        part = sim.place_part(ellipsoid, material=dielectric)
+        assert(sim.operator.frequency_derivatives)
+
+        # The initial vectors are found by a single solve near the pole
+        Z = sim.impedance(s_0).val().simple_view()
+        b = np.random.RandomState(0).rand(Z.shape[0])
+        vr = la.solve(Z, b)
+        vl = la.solve(Z.T, b)
+        estimates = {'s': np.array([s_0]),
+                     'vr': (vr/np.linalg.norm(vr))[:, None],
+                     'vl': (vl/np.linalg.norm(vl))[None, :]}
+
+        # modes which do not converge within max_iter are discarded
+        refined = sim.operator.refine_poles(estimates, part, rel_tol=1e-10,
+                                            max_iter=6)
+        assert(len(refined['s']) == 1)
+
+        s = refined['s'][0]
+        vr = refined['vr'][:, 0]
+        Z = sim.impedance(s).val().simple_view()
+        # the CTF residual is limited by its poorer conditioning
+        residual = np.linalg.norm(Z.dot(vr))
+        assert(residual < 1e-6*np.linalg.norm(Z, 2)*np.linalg.norm(vr))
+
+
+def test_self_term_derivatives():
+    "Derivatives of the EFIE and MFIE self terms match finite differences"
+    s = 2j*np.pi*10e9 - 1e9
+    h = abs(s)*1e-6
+
+    for operator_class in (EfieOperator, MfieOperator):
+        sim = openmodes.Simulation(basis_class=DivRwgBasis,
+                                   operator_class=operator_class)
+        sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+        part = sim.place_part(sphere)
+
+        # the singular terms of the self impedance include the extracted
+        # R term, whose derivative must also be included
+        Z = sim.operator.impedance(s, part, part)
+        Z_plus = sim.operator.impedance(s+h, part, part)
+        Z_minus = sim.operator.impedance(s-h, part, part)
+
+        for name in Z.matrix_names:
+            der_fd = (Z_plus.matrices[name] - Z_minus.matrices[name])/(2*h)
+            assert_allclose(Z.der[name], der_fd,
+                            atol=1e-6*np.max(np.abs(der_fd)))
+
+
+def test_background_material():
+    "PEC operators use the permittivity and permeability of the background"
+    s = 2j*np.pi*10e9 - 1e9
+
+    # The impedance in a background with unequal permittivity and
+    # permeability is compared with one with the same refractive index,
+    # which only differs by the scaling of L and S
+    eps, mu = 2.0, 1.5
+    n = np.sqrt(eps*mu)
+    background = IsotropicMaterial("Background", eps, mu)
+    matched = IsotropicMaterial("Matched", n, n)
+    scale = {'L': mu/n, 'S': n/eps, 'M': 1.0, 'Z': 1.0}
+
+    for operator_class in (EfieOperator, MfieOperator, CfieOperator):
+        Z = {}
+        for material in (background, matched):
+            sim = openmodes.Simulation(basis_class=DivRwgBasis,
+                                       operator_class=operator_class,
+                                       background_material=material)
+            sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+            sim.place_part(sphere)
+            Z[material] = sim.impedance(s)
+
+        for name in Z[background].matrix_names:
+            ref = Z[matched].matrices[name]*scale[name]
+            assert_allclose(Z[background].matrices[name], ref, rtol=1e-10,
+                            atol=1e-12*np.max(np.abs(ref)))
+            ref = Z[matched].der[name]*scale[name]
+            assert_allclose(Z[background].der[name], ref, rtol=1e-10,
+                            atol=1e-12*np.max(np.abs(ref)))
+
+def test_second_frequency_derivative():
+    "Second derivative of the EFIE impedance of a sphere"
+    sim = openmodes.Simulation(basis_class=DivRwgBasis,
+                               operator_class=EfieOperator)
+    sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+    part = sim.place_part(sphere)
+    operator = sim.operator
+
+    s = 2j*np.pi*10e9 - 1e9
+    h = abs(s)*1e-5
+
+    assert(operator.second_frequency_derivatives)
+    Z = operator.impedance(s, part, part, second_derivatives=True)
+    d2Z = Z.frequency_second_derivative()
+    d2Z_fd = (operator.impedance(s+h, part, part).frequency_derivative() -
+              operator.impedance(s-h, part, part).frequency_derivative())/(2*h)
+
+    assert_allclose(d2Z, d2Z_fd, atol=1e-6*np.max(np.abs(d2Z_fd)))
+
+
+def test_face_derivative_arrays():
+    "The face terms of unrequested derivatives are empty"
+    sim = openmodes.Simulation(basis_class=DivRwgBasis)
+    sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+    part = sim.place_part(sphere)
+    basis = sim.basis_container[part]
+    rule = sim.integration_rule
+    num_faces = len(sphere.polygons)
+    singular_terms = singular_impedance_rwg(basis, num_terms=2, rel_tol=1e-5,
+                                            normals=sphere.surface_normals)
+    gamma_0 = 2j*np.pi*10e9/c
+
+    values = []
+    for derivative_order in (0, 1, 2):
+        mutual = z_efie_faces_mutual(part.nodes, sphere.polygons,
+                                     part.nodes+1.0, sphere.polygons,
+                                     gamma_0, rule.points, rule.weights,
+                                     derivative_order=derivative_order)
+        self_terms = z_efie_faces_self(part.nodes, sphere.polygons, gamma_0,
+                                       rule.points, rule.weights,
+                                       *singular_terms["T_EFIE"],
+                                       derivative_order=derivative_order)
+
+        for res in (mutual, self_terms):
+            size = num_faces if derivative_order > 0 else 0
+            assert(res[2].shape == (size, 3, size, 3))
+            assert(res[3].shape == (size, size))
+            size = num_faces if derivative_order == 2 else 0
+            assert(res[4].shape == (size, 3, size, 3))
+            assert(res[5].shape == (size, size))
+
+        values.append(mutual[:2] + self_terms[:2])
+
+    # the values do not depend on the derivatives calculated
+    for values_n in values[1:]:
+        for value, value_0 in zip(values_n, values[0]):
+            assert_allclose(value, value_0, rtol=1e-14)
+
+def icosphere_mesh(radius, subdivisions):
+    """A sphere meshed by repeated subdivision of an icosahedron, giving a
+    sequence of uniformly refined meshes without requiring gmsh"""
+    t = (1+np.sqrt(5))/2
+    nodes = [(-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0),
+             (0, -1, t), (0, 1, t), (0, -1, -t), (0, 1, -t),
+             (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1)]
+    nodes = [np.array(node)/np.sqrt(1+t**2) for node in nodes]
+    triangles = [(0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+                 (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+                 (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+                 (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)]
+
+    for count in range(subdivisions):
+        midpoints = {}
+
+        def midpoint(a, b):
+            key = frozenset((a, b))
+            if key not in midpoints:
+                node = nodes[a]+nodes[b]
+                nodes.append(node/np.sqrt(np.sum(node**2)))
+                midpoints[key] = len(nodes)-1
+            return midpoints[key]
+
+        refined = []
+        for a, b, c in triangles:
+            ab, bc, ca = midpoint(a, b), midpoint(b, c), midpoint(c, a)
+            refined.extend(((a, ab, ca), (b, bc, ab), (c, ca, bc),
+                            (ab, bc, ca)))
+        triangles = refined
+
+    return TriangularSurfaceMesh({'nodes': radius*np.array(nodes),
+                                  'triangles': np.array(triangles)})
+
+
+def test_calderon_preconditioner(print_output=False):
+    "Iteration count of Calderon preconditioned EFIE is mesh independent"
+    radius = 10e-3
+    s = 2j*np.pi*0.1*c/radius
+
+    pw = PlaneWaveSource([1, 0, 0], [0, 0, 1])
+
+    iterations = []
+    for subdivisions in (1, 2):
+        sim = openmodes.Simulation(basis_class=DivRwgBasis)
+        sim.place_part(icosphere_mesh(radius, subdivisions))
+
+        Z = sim.impedance(s)
+        V = sim.source_vector(pw, s)
+        I_direct = Z.solve(V)
+
+        calderon = sim.operator.calderon_preconditioner(s, sim.parts)
+
+        counts = []
+        for preconditioner in (None, calderon):
+            residuals = []
+            I = Z.solve_iterative(V, preconditioner=preconditioner,
+                                  callback=residuals.append, restart=500)
+            assert_allclose(I, I_direct, rtol=1e-5,
+                            atol=1e-5*np.max(abs(I_direct)))
+            counts.append(len(residuals))
+
+        iterations.append(counts)
+        if print_output:
+            print("%d unknowns, iterations without and with preconditioning:"
+                  % len(V), counts)
+
+    (plain_coarse, calderon_coarse), (plain_fine, calderon_fine) = iterations
+    assert(plain_fine > plain_coarse + 10)
+    assert(calderon_coarse < plain_coarse)
+    assert(abs(calderon_fine - calderon_coarse) <= 2)
+
+
+def test_sparse_approximate_inverse(print_output=False):
+    "Near-field sparse approximate inverse preconditioner for the EFIE"
+    sim = openmodes.Simulation(basis_class=DivRwgBasis)
+    sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+    part = sim.place_part(sphere)
+
+    s = 2j*np.pi*10e9
+    Z = sim.impedance(s)
+    V = sim.source_vector(PlaneWaveSource([1, 0, 0], [0, 0, 1]), s)
+    I_direct = Z.solve(V)
+
+    # the approximate inverse only has near-field elements
+    M = Z.sparse_approximate_inverse()
+    near = sim.basis_container[part].near_neighbours
+    assert(M.nnz == near.nnz)
+    assert(M.nnz < 0.2*np.prod(M.shape))
+
+    iterations = []
+    for preconditioner in (None, 'sai'):
+        residuals = []
+        I = Z.solve_iterative(V, preconditioner=preconditioner,
+                              callback=residuals.append, restart=500)
+        assert_allclose(I, I_direct, rtol=1e-5,
+                        atol=1e-5*np.max(abs(I_direct)))
+        iterations.append(len(residuals))
+
+    if print_output:
+        print("Iterations without and with preconditioning:", iterations)
+
+    assert(iterations[1] < iterations[0]//3)
+
+
+def test_plane_wave_collection(print_output=False):
+    "Source vectors of several plane waves are solved together"
+    dielectric = IsotropicMaterial("Dielectric", 6.0, 1.2)
+    waves = [planewave_angles(theta, 30, alpha)
+             for theta, alpha in ((0, 0), (45, 0), (90, 90), (135, 45))]
+    waves.append(PlaneWaveSource([0, 1, 0], [1, 0, 0]))
+    sources = PlaneWaveSources(waves)
+
+    s = 2j*np.pi*1e9
+    for operator_class, material in ((EfieOperator, None),
+                                     (CfieOperator, None),
+                                     (PMCHWTOperator, dielectric)):
+        sim = openmodes.Simulation(operator_class=operator_class)
+        sphere = sim.load_mesh(osp.join(mesh_dir, 'sphere.msh'))
+        if material is None:
+            sim.place_part(sphere)
+        else:
+            sim.place_part(sphere, material=material)
+
+        for extinction_field in (False, True):
+            V = sim.source_vector(sources, s,
+                                  extinction_field=extinction_field)
+            assert(V.shape[-1] == len(waves))
+            for count, wave in enumerate(waves):
+                V_single = sim.source_vector(wave, s,
+                                             extinction_field=extinction_field)
+                assert_allclose(V.simple_view()[:, count],
+                                V_single.simple_view(), rtol=1e-12,
+                                atol=1e-12*np.max(abs(V_single)))
+
+        # all incident fields are solved with a single factorisation
+        Z = sim.impedance(s)
+        I = Z.solve(sim.source_vector(sources, s))
+        I_single = Z.solve(sim.source_vector(waves[1], s))
+        assert_allclose(I.simple_view()[:, 1], I_single.simple_view(),
+                        rtol=1e-10, atol=1e-10*np.max(abs(I_single)))
+
+        if print_output:
+            print(operator_class.__name__, "solved for", I.shape[-1],
+                  "plane waves")
+
+
 if __name__ == "__main__":
     test_extinction_all(plot_extinction=True, skip_asserts=True)
+    test_calderon_preconditioner(print_output=True)
+    test_sparse_approximate_inverse(print_output=True)
+    test_plane_wave_collection(print_output=True)
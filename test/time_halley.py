@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+"""Compare Newton and Halley refinement of poles on the test geometries
+
+Prints the number of iterations and the time taken for each mode."""
+
+from __future__ import print_function
+
+import os.path as osp
+import time
+
+import numpy as np
+
+import openmodes
+from openmodes.basis import LoopStarBasis
+from openmodes.eig import eig_newton
+
+tests_location = osp.split(__file__)[0]
+
+geometries = (("SRR", osp.join('test_poles', 'srr.msh'), 2j*np.pi*5e9, 4),
+              ("sphere", osp.join('test_sphere', 'sphere.msh'),
+               2j*np.pi*15e9, 4))
+
+
+def time_halley():
+    for name, mesh_file, s_start, num_modes in geometries:
+        sim = openmodes.Simulation(basis_class=LoopStarBasis)
+        mesh = sim.load_mesh(osp.join(tests_location, 'input', mesh_file))
+        sim.place_part(mesh)
+        operator = sim.operator
+
+        estimates = sim.estimate_poles(s_start, cauchy_integral=False,
+                                       modes=num_modes)
+        part = estimates.parts[0]
+        estimates = estimates.modes_of_parts[part.unique_id]
+
+        def Z_func(s):
+            Z = operator.impedance(s, part, part)
+            return (Z.val().simple_view(),
+                    Z.frequency_derivative().simple_view())
+
+        def Z_func_der2(s):
+            Z = operator.impedance(s, part, part, second_derivatives=True)
+            return (Z.val().simple_view(),
+                    Z.frequency_derivative().simple_view(),
+                    Z.frequency_second_derivative().simple_view())
+
+        print(name)
+        for mode in range(num_modes):
+            results = []
+            for func, der2 in ((Z_func, False), (Z_func_der2, True)):
+                start = time.time()
+                res = eig_newton(func, estimates['s'][mode],
+                                 estimates['vr'][:, mode], lambda_tol=1e-10,
+                                 max_iter=40, func_gives_der=True,
+                                 func_gives_der2=der2)
+                results.append((res['iter_count'], time.time()-start,
+                                res['eigval']))
+
+            (newton_iter, newton_time, s_newton), (halley_iter, halley_time,
+                                                   s_halley) = results
+            print("Mode %d, %+.4e %+.4ej" % (mode, s_halley.real,
+                                             s_halley.imag))
+            print("    Newton: %2d iterations, %.2fs" % (newton_iter,
+                                                         newton_time))
+            print("    Halley: %2d iterations, %.2fs" % (halley_iter,
+                                                         halley_time))
+            print("    Relative difference in poles: %.2e"
+                  % abs((s_newton-s_halley)/s_newton))
+
+
+if __name__ == "__main__":
+    time_halley()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#-----------------------------------------------------------------------------
+#  OpenModes - An eigenmode solver for open electromagnetic resonantors
+#  Copyright (C) 2013 David Powell
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#-----------------------------------------------------------------------------
+"""Time the overhead of indexing LookupArrays by parts, for an array with many
+small parts
+
+Prints the time taken to find the ranges of the parts, to create arrays, and
+to get and set the blocks of every part."""
+
+from __future__ import print_function
+
+import os.path as osp
+import time
+
+import numpy as np
+
+import openmodes
+from openmodes.array import LookupArray, part_ranges, calculate_part_ranges
+
+tests_location = osp.split(__file__)[0]
+mesh_file = osp.join(tests_location, 'input', 'test_horseshoe',
+                     'horseshoe_rect.msh')
+
+
+def time_per_call(func, repeats):
+    "The average time taken to call a function"
+    start = time.time()
+    for count in range(repeats):
+        func()
+    return (time.time()-start)/repeats
+
+
+def time_lookup(num_parts=1000, repeats=20):
+    sim = openmodes.Simulation()
+    mesh = sim.load_mesh(mesh_file)
+    for count in range(num_parts):
+        sim.place_part(mesh, location=[count*15e-3, 0, 0])
+    parts = sim.parts.children
+    container = sim.basis_container
+    # a dense matrix would not fit in memory, so several vectors are used
+    index_data = ((sim.parts, container), 4)
+
+    print("%d parts" % num_parts)
+    print("Part ranges, calculated: %.2f ms" % (1e3*time_per_call(
+          lambda: calculate_part_ranges(sim.parts, container), repeats)))
+    print("Part ranges, cached:     %.2f ms" % (1e3*time_per_call(
+          lambda: part_ranges(sim.parts, container), repeats)))
+    print("New array:               %.2f ms" % (1e3*time_per_call(
+          lambda: LookupArray(index_data, dtype=np.complex128), repeats)))
+
+    A = LookupArray(index_data, dtype=np.complex128)
+    block = np.ones(A[parts[0]].shape, np.complex128)
+    plans = [A.index_plan(part) for part in parts]
+
+    def set_parts():
+        for part in parts:
+            A[part] = block
+
+    def set_plans():
+        for plan in plans:
+            A[plan] = block
+
+    def get_parts():
+        for part in parts:
+            A[part]
+
+    def get_plans():
+        for plan in plans:
+            A[plan]
+
+    for name, func in (("Set by part", set_parts), ("Set by plan", set_plans),
+                       ("Get by part", get_parts), ("Get by plan", get_plans)):
+        print("%s:             %.2f us per block"
+              % (name, 1e6*time_per_call(func, repeats)/num_parts))
+
+
+if __name__ == "__main__":
+    time_lookup()